@@ -41,9 +41,18 @@ Worst: O(1)
 
 """
 
+import operator
+import os
+import runpy
 import time
 import logging
 
+# Run priority_queue.py from its path, so importing this module leaves sys.path alone.
+_priority_queue = runpy.run_path(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..",
+                                              "data_structures", "priority_queue.py"))
+heapify = _priority_queue["heapify"]
+sift_down = _priority_queue["sift_down"]
+
 logging.basicConfig(level=logging.INFO)
 
 def time_it(func):
@@ -93,8 +102,7 @@ class HeapSort:
         n = len(self.arr)
 
         # Building a max heap
-        for i in range(n // 2 - 1, -1, -1):
-            self._heapify(n, i)
+        heapify(self.arr, operator.gt)
 
         # Extracting elements from the heap one by one
         for i in range(n - 1, 0, -1):
@@ -104,19 +112,8 @@ class HeapSort:
         return self.arr
 
     def _heapify(self, n, i):
-        largest = i  
-        left = 2 * i + 1  
-        right = 2 * i + 2  
-
-        if left < n and self.arr[left] > self.arr[largest]:
-            largest = left
-
-        if right < n and self.arr[right] > self.arr[largest]:
-            largest = right
-
-        if largest != i:
-            self.arr[i], self.arr[largest] = self.arr[largest], self.arr[i] 
-            self._heapify(n, largest)
+        # Sift-down shared with the priority queue, as a max heap
+        sift_down(self.arr, n, i, operator.gt)
 
 # Example usage:
 if __name__ == "__main__":
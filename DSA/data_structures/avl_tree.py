@@ -0,0 +1,616 @@
+"""
+AVL TREE DATA STRUCTURE
+.......................
+An AVL tree is a self-balancing binary search tree: for every node, the heights of
+its left and right subtrees differ by at most one. After an insert or delete breaks
+this rule, one or two rotations restore it, so the height stays below 1.44 log2(n).
+
+This implementation is an order-statistic AVL tree: every node also stores the size
+of its subtree, which gives ranks and positions in O(log n).
+
+Operations:
+1. Insert: Add a value in sorted position (duplicates are kept).
+2. Delete: Remove one occurrence of a value.
+3. Search: Find the node holding a value.
+4. Floor / Ceiling: Find the largest value <= x / the smallest value >= x.
+5. Rank: Count the values smaller than a given value.
+6. Select: Return the value at a given position (list[i]).
+7. Range: Iterate over the values in [low, high) in order.
+8. Traverse: Visit each value in order.
+
+Properties:
+- Values must be mutually comparable with <.
+- For every node, values in its left subtree are <= its value and values in its
+  right subtree are >= its value.
+- Nodes extend tree.TreeNode with the height and size of their subtree.
+- Insert and delete walk down recursively; the recursion depth is the height of
+  the tree, which is O(log n).
+
+Pros:
+- Guaranteed O(log n) insert, delete, search, rank and select.
+- Range iteration costs O(log n) plus the number of values yielded.
+
+Cons:
+- One node object per value, with four references and two integers.
+- Slower to build than sorting a list once.
+
+When to use an AVL tree:
+- When a sorted collection changes often and needs ordered, rank and range queries.
+
+When not to use an AVL tree:
+- When the data is static; a sorted Python list with bisect is smaller and faster.
+- When values only need to be looked up by equality; use a hash table.
+
+Keyword arguments:
+argument -- description
+Return: return_description
+"""
+
+import bisect
+import random
+import time
+
+from tree import BinaryTree, TreeNode
+
+
+class AVLNode(TreeNode):
+    """
+    A node in an AVL tree.
+
+    Parameters
+    ----------
+    value : object
+        The value to store in the node.
+
+    Attributes
+    ----------
+    value : object
+        The value stored in the node.
+    left : AVLNode or None
+        Root of the left subtree.
+    right : AVLNode or None
+        Root of the right subtree.
+    height : int
+        Height of the subtree rooted at this node; a leaf has height 1.
+    size : int
+        Number of nodes in the subtree rooted at this node.
+    """
+    __slots__ = ("height", "size")
+
+    def __init__(self, value):
+        super().__init__(value)
+        self.height = 1
+        self.size = 1
+
+
+def _height(node):
+    return node.height if node is not None else 0
+
+
+def _size(node):
+    return node.size if node is not None else 0
+
+
+def _update(node):
+    """Recompute the height and size of node from its children."""
+    left, right = node.left, node.right
+    left_height = left.height if left is not None else 0
+    right_height = right.height if right is not None else 0
+    node.height = (left_height if left_height > right_height else right_height) + 1
+    node.size = (left.size if left is not None else 0) + (right.size if right is not None else 0) + 1
+
+
+def _rotate_right(node):
+    """Rotate node down to the right and return the new subtree root."""
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rotate_left(node):
+    """Rotate node down to the left and return the new subtree root."""
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rebalance(node):
+    """Update node and rotate it if its subtrees differ in height by two."""
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+class AVLTree:
+    """
+    An order-statistic AVL tree implementation.
+
+    Methods
+    -------
+    insert(value)
+        Insert a value in sorted position.
+    delete(value)
+        Remove one occurrence of a value.
+    search(value)
+        Return the node holding the value.
+    floor(value)
+        Return the largest value <= value.
+    ceiling(value)
+        Return the smallest value >= value.
+    rank(value)
+        Return the number of values smaller than value.
+    select(index)
+        Return the value at the given position.
+    range(low=None, high=None)
+        Lazily yield the values v with low <= v < high.
+    traverse()
+        Return a list of all values in order.
+    height()
+        Return the height of the tree.
+    is_empty()
+        Check if the tree is empty.
+    size()
+        Return the number of values.
+
+    Supports len(), iteration in sorted order, the in operator and indexing.
+
+    Parameters
+    ----------
+    None
+
+    Attributes
+    ----------
+    root : AVLNode or None
+        Reference to the root node of the tree.
+    """
+
+    def __init__(self):
+        """Initialize an empty AVL tree.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        self.root = None
+
+    def insert(self, value):
+        """
+        Insert a value in sorted position, after any equal values.
+
+        Parameters
+        ----------
+        value : object
+            The value to be inserted.
+
+        Time complexity
+        ---------------
+        Best : O(log n)
+        Average : O(log n)
+        Worst : O(log n)
+
+        Space complexity
+        ----------------
+        Best : O(log n)
+        Average : O(log n)
+        Worst : O(log n)
+        """
+        def _insert(node):
+            if node is None:
+                return AVLNode(value)
+            if value < node.value:
+                node.left = _insert(node.left)
+            else:
+                node.right = _insert(node.right)
+            return _rebalance(node)
+        self.root = _insert(self.root)
+
+    def delete(self, value):
+        """
+        Remove one occurrence of a value.
+
+        A node with two children takes the value of its in-order successor,
+        which is then removed from the right subtree.
+
+        Parameters
+        ----------
+        value : object
+            The value to be deleted.
+
+        Raises
+        ------
+        ValueError
+            If the value is not in the tree.
+
+        Time complexity
+        ---------------
+        Best : O(log n)
+        Average : O(log n)
+        Worst : O(log n)
+
+        Space complexity
+        ----------------
+        Best : O(log n)
+        Average : O(log n)
+        Worst : O(log n)
+        """
+        def _remove_min(node):
+            if node.left is None:
+                return node.right, node.value
+            node.left, minimum = _remove_min(node.left)
+            return _rebalance(node), minimum
+
+        def _delete(node):
+            if node is None:
+                raise ValueError(f"Value {value} not found in the AVL tree.")
+            if value < node.value:
+                node.left = _delete(node.left)
+            elif node.value < value:
+                node.right = _delete(node.right)
+            elif node.left is None:
+                return node.right
+            elif node.right is None:
+                return node.left
+            else:
+                node.right, node.value = _remove_min(node.right)
+            return _rebalance(node)
+        self.root = _delete(self.root)
+
+    def search(self, value):
+        """
+        Return a node holding the value.
+
+        Parameters
+        ----------
+        value : object
+            The value to search for.
+
+        Returns
+        -------
+        AVLNode or None
+            A node holding the value, or None if not found.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(log n)
+        Worst : O(log n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        node = self.root
+        while node is not None:
+            if value < node.value:
+                node = node.left
+            elif node.value < value:
+                node = node.right
+            else:
+                return node
+        return None
+
+    def __contains__(self, value):
+        """Check whether a value is in the tree."""
+        return self.search(value) is not None
+
+    def floor(self, value):
+        """
+        Return the largest value that is <= value.
+
+        Returns
+        -------
+        object or None
+            The floor of value, or None if every value is greater.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(log n)
+        Worst : O(log n)
+        """
+        node = self.root
+        best = None
+        while node is not None:
+            if value < node.value:
+                node = node.left
+            else:
+                best = node.value
+                node = node.right
+        return best
+
+    def ceiling(self, value):
+        """
+        Return the smallest value that is >= value.
+
+        Returns
+        -------
+        object or None
+            The ceiling of value, or None if every value is smaller.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(log n)
+        Worst : O(log n)
+        """
+        node = self.root
+        best = None
+        while node is not None:
+            if node.value < value:
+                node = node.right
+            else:
+                best = node.value
+                node = node.left
+        return best
+
+    def rank(self, value):
+        """
+        Return the number of values smaller than value.
+
+        Parameters
+        ----------
+        value : object
+            The value to rank; it does not need to be in the tree.
+
+        Returns
+        -------
+        int
+            The position value would be inserted at before its duplicates.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(log n)
+        Worst : O(log n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        node = self.root
+        position = 0
+        while node is not None:
+            if node.value < value:
+                position += _size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return position
+
+    def select(self, index):
+        """
+        Return the value at the given position.
+
+        Parameters
+        ----------
+        index : int
+            Position of the value; negative positions count from the end.
+
+        Returns
+        -------
+        object
+            The value at that position.
+
+        Raises
+        ------
+        IndexError
+            If index is out of range.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(log n)
+        Worst : O(log n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        count = _size(self.root)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("AVL tree index out of range")
+        node = self.root
+        while True:
+            left_size = _size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index == left_size:
+                return node.value
+            else:
+                index -= left_size + 1
+                node = node.right
+
+    def __getitem__(self, index):
+        """Return the value at the given position."""
+        return self.select(index)
+
+    def range(self, low=None, high=None):
+        """
+        Lazily yield the values v with low <= v < high, in order.
+
+        The stack holds the path of nodes whose value and right subtree
+        have not been yielded yet.
+
+        Parameters
+        ----------
+        low : object, optional
+            Inclusive lower bound; None means no lower bound.
+        high : object, optional
+            Exclusive upper bound; None means no upper bound.
+
+        Returns
+        -------
+        generator
+            The values in the range.
+
+        Time complexity
+        ---------------
+        Best : O(log n + k)
+        Average : O(log n + k)
+        Worst : O(log n + k)
+
+        Space complexity
+        ----------------
+        Best : O(log n)
+        Average : O(log n)
+        Worst : O(log n)
+        """
+        stack = []
+        node = self.root
+        while node is not None:
+            if low is not None and node.value < low:
+                node = node.right
+            else:
+                stack.append(node)
+                node = node.left
+        while stack:
+            node = stack.pop()
+            if high is not None and not node.value < high:
+                return
+            yield node.value
+            node = node.right
+            while node is not None:
+                stack.append(node)
+                node = node.left
+
+    def __iter__(self):
+        """Lazily yield every value in order."""
+        return self.range()
+
+    def __len__(self):
+        """Return the number of values."""
+        return _size(self.root)
+
+    def traverse(self):
+        """
+        Return a list of all values in order.
+
+        Returns
+        -------
+        list
+            The values in sorted order.
+        """
+        return list(self)
+
+    def height(self):
+        """Return the height of the tree; 0 when empty."""
+        return _height(self.root)
+
+    def is_empty(self):
+        """
+        Check if the tree is empty.
+
+        Returns
+        -------
+        bool
+            True if the tree is empty, False otherwise.
+        """
+        return self.root is None
+
+    def size(self):
+        """
+        Return the number of values.
+
+        Returns
+        -------
+        int
+            The number of values in the tree.
+        """
+        return _size(self.root)
+
+    def __str__(self):
+        """Return the values in order."""
+        return "Inorder: " + str(self.traverse())
+
+    def __repr__(self):
+        """Return the number of values and the height."""
+        return f"AVLTree(size={self.size()}, height={self.height()})"
+
+
+def benchmark_search(n=100_000, queries=1_000, tree_queries=20, seed=0):
+    """
+    Compare lookups in an AVLTree with BinaryTree.search and bisect on a sorted list.
+
+    BinaryTree.search is a breadth-first scan, so only tree_queries of the
+    queries are timed for it.
+
+    Parameters
+    ----------
+    n : int, optional
+        Number of values in each container (default is 100_000).
+    queries : int, optional
+        Number of random lookups (default is 1_000).
+    tree_queries : int, optional
+        Number of lookups timed on BinaryTree (default is 20).
+    seed : int, optional
+        Random seed for the values and queries (default is 0).
+
+    Returns
+    -------
+    dict
+        Microseconds per lookup for each container.
+    """
+    rng = random.Random(seed)
+    values = list(range(0, 2 * n, 2))
+    shuffled = values[:]
+    rng.shuffle(shuffled)
+    targets = [rng.randrange(2 * n) for _ in range(queries)]
+
+    avl_tree = AVLTree()
+    for value in shuffled:
+        avl_tree.insert(value)
+    binary_tree = BinaryTree.build_from(shuffled)
+
+    def bisect_search(target):
+        index = bisect.bisect_left(values, target)
+        return index < len(values) and values[index] == target
+
+    results = {}
+    for name, search, timed in (("BinaryTree.search", binary_tree.search, targets[:tree_queries]),
+                                ("AVLTree.search", avl_tree.search, targets),
+                                ("bisect on list", bisect_search, targets)):
+        start = time.perf_counter()
+        for target in timed:
+            search(target)
+        results[name] = (time.perf_counter() - start) / len(timed) * 1e6
+    return results
+
+
+# Example usage:
+if __name__ == "__main__":
+    t = AVLTree()
+    for v in [50, 20, 80, 10, 30, 70, 90, 60]:
+        t.insert(v)
+    print("Tree:", t, repr(t))
+    print("Search 30:", t.search(30) is not None)
+    print("Floor 55:", t.floor(55), "Ceiling 55:", t.ceiling(55))
+    print("Rank of 60:", t.rank(60))
+    print("Select 2:", t.select(2), "Last:", t[-1])
+    print("Range [25, 75):", list(t.range(25, 75)))
+    t.delete(50)
+    print("After deleting 50:", t, repr(t))
+    print("Is tree empty?", t.is_empty())
+
+    for name, micros in benchmark_search().items():
+        print(f"{name:>18}: {micros:10.2f} us/lookup")
@@ -0,0 +1,847 @@
+"""
+B+ TREE DATA STRUCTURE
+......................
+A B+ tree is a balanced search tree whose nodes hold many keys each. Internal nodes
+only hold separator keys that guide the search; every key-value pair is stored in a
+leaf, and the leaves are linked left to right so a range of keys can be read by
+walking along them.
+
+With a fanout of f, a tree of n keys has height about log_f(n), so even millions of
+keys are found in three or four node visits. That makes it the classic structure
+for indexes on disk, where every node visit may be a page read.
+
+Page file layout (little-endian):
+1. Page 0: magic (8 bytes), page size and fanout (u32 each), root page, number of
+   keys and height (u64 each).
+2. Nodes, each starting on a page boundary and taking as many pages as it needs:
+   kind (u8), number of page references (u32) and payload length (u32), the page
+   references (u64 each) and the pickled keys (and values, for a leaf). An internal
+   node references its children; a leaf references the next leaf, 0 for none.
+
+Operations:
+1. Insert: Add a key-value pair, replacing the value of an existing key.
+2. Delete: Remove a key and its value.
+3. Search: Retrieve the value associated with a key.
+4. Range: Iterate over the pairs with keys in [low, high) in order.
+5. Bulk load: Build a tree from pairs sorted by key, filling the nodes one by one.
+6. Save / Open: Write the tree to a page file and open it again without loading it.
+
+Properties:
+- Keys must be unique and mutually comparable with <.
+- Every node except the root holds between (fanout + 1) // 2 and fanout keys
+  (leaves) or children (internal nodes); a full node is split and an underfull one
+  borrows from or merges with a sibling.
+- A tree opened from a page file is read-only. Its root is read when it is
+  opened; every other node is read on first use and kept in an LRU Cache of
+  cache_pages nodes, so only the visited part of the tree is loaded.
+
+Pros:
+- O(log n) insert, delete and search with very few node visits.
+- Range scans read whole leaves one after another.
+- Building from sorted input is O(n), with full nodes.
+
+Cons:
+- More complex than a binary search tree.
+- Saved trees cannot be changed in place; change the tree in memory and save it again.
+- Keys and values of a saved tree must be picklable, and nodes are read back
+  with pickle.loads, so opening an untrusted page file can run arbitrary code.
+
+When to use a B+ tree:
+- When indexing a large table for point and range lookups, especially on disk.
+
+When not to use a B+ tree:
+- When only equality lookups are needed; a hash table is simpler.
+- When the data is small and static; a sorted list with bisect is enough.
+
+Keyword arguments:
+argument -- description
+Return: return_description
+"""
+
+import bisect
+import csv
+import datetime
+import os
+import pickle
+import random
+import struct
+import tempfile
+import time
+
+from cache import Cache
+
+_MAGIC = b"GRITBPT1"
+_HEADER = struct.Struct("<8sIIQQQ")
+_NODE = struct.Struct("<BII")
+_REF = struct.Struct("<Q")
+_LEAF = 0
+_INTERNAL = 1
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+TRANSACTIONS_CSV = os.path.join(_HERE, "..", "..", "SQL", "transactions_cleaned.csv")
+
+
+class _Leaf:
+    """A leaf: sorted keys, their values and the next leaf (a node or a page number)."""
+    __slots__ = ("keys", "values", "next")
+
+    def __init__(self, keys=None, values=None):
+        self.keys = keys if keys is not None else []
+        self.values = values if values is not None else []
+        self.next = None
+
+
+class _Internal:
+    """An internal node: children[i + 1] holds the keys >= keys[i]."""
+    __slots__ = ("keys", "children")
+
+    def __init__(self, keys, children):
+        self.keys = keys
+        self.children = children
+
+
+class BPlusTree:
+    """
+    A B+ tree implementation with an optional page file.
+
+    Methods
+    -------
+    bulk_load(items, fanout=64)
+        Build a tree from (key, value) pairs sorted by key (classmethod).
+    open(path, cache_pages=1024)
+        Open a saved tree without loading it (classmethod).
+    save(path, page_size=4096)
+        Write the tree to a page file.
+    insert(key, value)
+        Add a key-value pair, or replace the value of an existing key.
+    delete(key)
+        Remove a key and its value.
+    search(key)
+        Return the value associated with a key.
+    range(low=None, high=None)
+        Lazily yield the (key, value) pairs with low <= key < high.
+    height()
+        Return the number of levels.
+    is_empty()
+        Check if the tree is empty.
+
+    Supports len(), the in operator and iteration over keys in order.
+
+    Parameters
+    ----------
+    fanout : int, optional
+        Maximum number of keys per leaf and children per internal node
+        (default is 64).
+
+    Attributes
+    ----------
+    _root : _Leaf, _Internal or int
+        The root node, or its page number in an opened page file.
+    _fanout : int
+        Maximum node size.
+    _count : int
+        Number of keys in the tree.
+    _height : int
+        Number of levels; 1 when the root is a leaf.
+    _file : file or None
+        The page file of an opened tree.
+    _pages : Cache or None
+        Nodes read from the page file, by page number.
+    """
+
+    def __init__(self, fanout=64):
+        """Initialize an empty tree.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        if fanout < 3:
+            raise ValueError("fanout must be at least 3")
+        self._fanout = fanout
+        self._root = _Leaf()
+        self._count = 0
+        self._height = 1
+        self._file = None
+        self._pages = None
+        self._page_size = None
+
+    @classmethod
+    def bulk_load(cls, items, fanout=64):
+        """
+        Build a tree from (key, value) pairs sorted by key.
+
+        Leaves are filled to fanout keys one after another, then each level
+        of internal nodes is built from the level below. The last two nodes
+        of a level share their entries if the last one would be underfull.
+
+        Parameters
+        ----------
+        items : iterable of (key, value)
+            The pairs, in strictly increasing key order.
+        fanout : int, optional
+            Maximum node size (default is 64).
+
+        Returns
+        -------
+        BPlusTree
+            The new tree.
+
+        Raises
+        ------
+        ValueError
+            If the keys are not strictly increasing.
+
+        Time complexity
+        ---------------
+        Best : O(n)
+        Average : O(n)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(n)
+        Average : O(n)
+        Worst : O(n)
+        """
+        tree = cls(fanout)
+        keys = []
+        values = []
+        for key, value in items:
+            if keys and not keys[-1] < key:
+                raise ValueError("bulk_load needs keys in strictly increasing order")
+            keys.append(key)
+            values.append(value)
+        if not keys:
+            return tree
+
+        leaves = [_Leaf(keys[start:end], values[start:end])
+                  for start, end in cls._chunks(len(keys), fanout)]
+        for leaf, following in zip(leaves, leaves[1:]):
+            leaf.next = following
+        level = leaves
+        low_keys = [leaf.keys[0] for leaf in leaves]
+        height = 1
+        while len(level) > 1:
+            parents = []
+            parent_low_keys = []
+            for start, end in cls._chunks(len(level), fanout):
+                parents.append(_Internal(low_keys[start + 1:end], level[start:end]))
+                parent_low_keys.append(low_keys[start])
+            level = parents
+            low_keys = parent_low_keys
+            height += 1
+        tree._root = level[0]
+        tree._count = len(keys)
+        tree._height = height
+        return tree
+
+    @staticmethod
+    def _chunks(n, fanout):
+        """
+        Return (start, end) bounds cutting n entries into chunks of fanout.
+
+        If there are several chunks and the last one is underfull, it takes
+        entries from the second-last one until it is half full.
+        """
+        starts = list(range(0, n, fanout))
+        minimum = (fanout + 1) // 2
+        if len(starts) > 1 and n - starts[-1] < minimum:
+            starts[-1] = n - minimum
+        return list(zip(starts, starts[1:] + [n]))
+
+    @classmethod
+    def open(cls, path, cache_pages=1024):
+        """
+        Open a tree saved with save(), reading only its header and root.
+
+        Nodes are decoded with pickle, so only open page files from a trusted
+        source.
+
+        Parameters
+        ----------
+        path : str
+            The page file.
+        cache_pages : int, optional
+            Number of nodes kept in memory (default is 1024).
+
+        Returns
+        -------
+        BPlusTree
+            A read-only tree backed by the page file.
+
+        Raises
+        ------
+        ValueError
+            If the file is not a B+ tree page file.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        file = open(path, "rb")
+        try:
+            header = file.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise ValueError(f"{path} is not a B+ tree page file")
+            magic, page_size, fanout, root, count, height = _HEADER.unpack(header)
+            if magic != _MAGIC:
+                raise ValueError(f"{path} is not a B+ tree page file")
+            tree = cls(fanout)
+            tree._file = file
+            tree._page_size = page_size
+            tree._pages = Cache(max_entries=cache_pages)
+            tree._count = count
+            tree._height = height
+            tree._root = tree._node(root)
+        except Exception:
+            file.close()
+            raise
+        return tree
+
+    def _node(self, ref):
+        """Return the node for a child or next reference, reading it if it is a page number."""
+        if type(ref) is not int:
+            return ref
+        node = self._pages.get(ref)
+        if node is None:
+            node = self._read_page(ref)
+            self._pages.put(ref, node)
+        return node
+
+    def _read_page(self, page):
+        """Read and decode the node that starts at the given page."""
+        file = self._file
+        file.seek(page * self._page_size)
+        kind, ref_count, payload_size = _NODE.unpack(file.read(_NODE.size))
+        refs = list(struct.unpack(f"<{ref_count}Q", file.read(ref_count * _REF.size)))
+        payload = pickle.loads(file.read(payload_size))
+        if kind == _INTERNAL:
+            return _Internal(payload, refs)
+        keys, values = payload
+        leaf = _Leaf(keys, values)
+        leaf.next = refs[0] or None
+        return leaf
+
+    def save(self, path, page_size=4096):
+        """
+        Write the tree to a page file, level by level from the root.
+
+        The leaves come last and in key order, so a range scan reads the
+        file sequentially.
+
+        Parameters
+        ----------
+        path : str
+            The page file; it is created or overwritten.
+        page_size : int, optional
+            Page size in bytes (default is 4096).
+
+        Time complexity
+        ---------------
+        Best : O(n)
+        Average : O(n)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(n)
+        Average : O(n)
+        Worst : O(n)
+        """
+        if page_size < _HEADER.size:
+            raise ValueError(f"page_size must be at least {_HEADER.size}")
+        # Pages are keyed by the reference a node is reached through: the node
+        # itself in memory, or its page number in an opened tree, whose nodes
+        # may be read again as new objects once the cache evicts them.
+        refs = []
+        nodes = []
+        level = [self._root]
+        while level:
+            refs.extend(level)
+            nodes.extend(self._node(ref) for ref in level)
+            if isinstance(nodes[-1], _Leaf):
+                break
+            level = [child for node in nodes[-len(level):] for child in node.children]
+
+        payloads = []
+        pages = {}
+        page = 1
+        for ref, node in zip(refs, nodes):
+            if isinstance(node, _Leaf):
+                payload = pickle.dumps((node.keys, node.values), pickle.HIGHEST_PROTOCOL)
+                ref_count = 1
+            else:
+                payload = pickle.dumps(node.keys, pickle.HIGHEST_PROTOCOL)
+                ref_count = len(node.children)
+            payloads.append(payload)
+            pages[ref] = page
+            size = _NODE.size + ref_count * _REF.size + len(payload)
+            page += -(-size // page_size)
+
+        with open(path, "wb") as file:
+            file.write(_HEADER.pack(_MAGIC, page_size, self._fanout, pages[self._root],
+                                    self._count, self._height).ljust(page_size, b"\x00"))
+            for ref, node, payload in zip(refs, nodes, payloads):
+                file.seek(pages[ref] * page_size)
+                if isinstance(node, _Leaf):
+                    links = [pages[node.next] if node.next is not None else 0]
+                    kind = _LEAF
+                else:
+                    links = [pages[child] for child in node.children]
+                    kind = _INTERNAL
+                file.write(_NODE.pack(kind, len(links), len(payload)))
+                file.write(struct.pack(f"<{len(links)}Q", *links))
+                file.write(payload)
+            file.truncate(page * page_size)
+
+    def close(self):
+        """Close the page file of an opened tree."""
+        if self._file is not None:
+            self._file.close()
+
+    def __enter__(self):
+        """Return the tree, so an opened tree can be used in a with statement."""
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        """Close the page file when the with statement ends."""
+        self.close()
+
+    def _check_writable(self):
+        """Raise PermissionError if the tree was opened from a page file."""
+        if self._file is not None:
+            raise PermissionError("BPlusTree was opened from a page file and is read-only")
+
+    def __len__(self):
+        """Return the number of keys."""
+        return self._count
+
+    def is_empty(self):
+        """
+        Check if the tree is empty.
+
+        Returns
+        -------
+        bool
+            True if the tree is empty, False otherwise.
+        """
+        return self._count == 0
+
+    def height(self):
+        """Return the number of levels; 1 when the root is a leaf."""
+        return self._height
+
+    def _find_leaf(self, key):
+        """Return the leaf whose key range contains key."""
+        node = self._node(self._root)
+        while type(node) is _Internal:
+            node = self._node(node.children[bisect.bisect_right(node.keys, key)])
+        return node
+
+    def search(self, key):
+        """
+        Retrieve the value associated with a key.
+
+        Parameters
+        ----------
+        key : object
+            The key to look up.
+
+        Returns
+        -------
+        object or None
+            The value, or None if the key is not in the tree.
+
+        Time complexity
+        ---------------
+        Best : O(log n)
+        Average : O(log n)
+        Worst : O(log n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        leaf = self._find_leaf(key)
+        index = bisect.bisect_left(leaf.keys, key)
+        if index < len(leaf.keys) and not key < leaf.keys[index]:
+            return leaf.values[index]
+        return None
+
+    def __contains__(self, key):
+        """Check whether a key is in the tree."""
+        leaf = self._find_leaf(key)
+        index = bisect.bisect_left(leaf.keys, key)
+        return index < len(leaf.keys) and not key < leaf.keys[index]
+
+    def range(self, low=None, high=None):
+        """
+        Lazily yield the (key, value) pairs with low <= key < high, in order.
+
+        Parameters
+        ----------
+        low : object, optional
+            Inclusive lower bound; None means no lower bound.
+        high : object, optional
+            Exclusive upper bound; None means no upper bound.
+
+        Returns
+        -------
+        generator
+            The pairs in the range.
+
+        Time complexity
+        ---------------
+        Best : O(log n + k)
+        Average : O(log n + k)
+        Worst : O(log n + k)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        if low is None:
+            node = self._node(self._root)
+            while type(node) is _Internal:
+                node = self._node(node.children[0])
+            leaf, index = node, 0
+        else:
+            leaf = self._find_leaf(low)
+            index = bisect.bisect_left(leaf.keys, low)
+        while leaf is not None:
+            keys = leaf.keys
+            end = len(keys) if high is None else bisect.bisect_left(keys, high, index)
+            yield from zip(keys[index:end], leaf.values[index:end])
+            if end < len(keys) or leaf.next is None:
+                return
+            leaf = self._node(leaf.next)
+            index = 0
+
+    def __iter__(self):
+        """Lazily yield every key in order."""
+        return (key for key, _ in self.range())
+
+    def insert(self, key, value):
+        """
+        Add a key-value pair, or replace the value of an existing key.
+
+        A node that grows past fanout entries is split in half, and the
+        first key of the new right half is added to the parent.
+
+        Parameters
+        ----------
+        key : object
+            The key to insert.
+        value : object
+            The value associated with the key.
+
+        Raises
+        ------
+        PermissionError
+            If the tree was opened from a page file.
+
+        Time complexity
+        ---------------
+        Best : O(log n)
+        Average : O(log n)
+        Worst : O(f log n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(f log n)
+        """
+        self._check_writable()
+        split = self._insert(self._root, key, value)
+        if split is not None:
+            separator, right = split
+            self._root = _Internal([separator], [self._root, right])
+            self._height += 1
+
+    def _insert(self, node, key, value):
+        """Insert below node; return (separator, new_right_node) if node was split."""
+        if type(node) is _Leaf:
+            index = bisect.bisect_left(node.keys, key)
+            if index < len(node.keys) and not key < node.keys[index]:
+                node.values[index] = value
+                return None
+            node.keys.insert(index, key)
+            node.values.insert(index, value)
+            self._count += 1
+            if len(node.keys) <= self._fanout:
+                return None
+            middle = len(node.keys) // 2
+            right = _Leaf(node.keys[middle:], node.values[middle:])
+            del node.keys[middle:]
+            del node.values[middle:]
+            right.next = node.next
+            node.next = right
+            return right.keys[0], right
+
+        index = bisect.bisect_right(node.keys, key)
+        split = self._insert(node.children[index], key, value)
+        if split is None:
+            return None
+        separator, child = split
+        node.keys.insert(index, separator)
+        node.children.insert(index + 1, child)
+        if len(node.children) <= self._fanout:
+            return None
+        middle = len(node.keys) // 2
+        separator = node.keys[middle]
+        right = _Internal(node.keys[middle + 1:], node.children[middle + 1:])
+        del node.keys[middle:]
+        del node.children[middle + 1:]
+        return separator, right
+
+    def delete(self, key):
+        """
+        Remove a key and its value.
+
+        A node left with fewer than (fanout + 1) // 2 entries borrows entries from
+        a sibling, or merges with it when both fit in one node.
+
+        Parameters
+        ----------
+        key : object
+            The key to delete.
+
+        Returns
+        -------
+        bool
+            True if the key was found and removed, False otherwise.
+
+        Raises
+        ------
+        PermissionError
+            If the tree was opened from a page file.
+
+        Time complexity
+        ---------------
+        Best : O(log n)
+        Average : O(log n)
+        Worst : O(f log n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(log n)
+        """
+        self._check_writable()
+        if not self._delete(self._root, key):
+            return False
+        root = self._root
+        if type(root) is _Internal and len(root.children) == 1:
+            self._root = root.children[0]
+            self._height -= 1
+        return True
+
+    def _delete(self, node, key):
+        """Delete key below node and fix an underfull child; return whether it was found."""
+        if type(node) is _Leaf:
+            index = bisect.bisect_left(node.keys, key)
+            if index == len(node.keys) or key < node.keys[index]:
+                return False
+            del node.keys[index]
+            del node.values[index]
+            self._count -= 1
+            return True
+
+        index = bisect.bisect_right(node.keys, key)
+        child = node.children[index]
+        if not self._delete(child, key):
+            return False
+        size = len(child.keys) if type(child) is _Leaf else len(child.children)
+        if size < (self._fanout + 1) // 2:
+            self._rebalance(node, index - 1 if index > 0 else index)
+        return True
+
+    def _rebalance(self, parent, index):
+        """Merge, or share the entries of, parent.children[index] and the child after it."""
+        left = parent.children[index]
+        right = parent.children[index + 1]
+        if type(left) is _Leaf:
+            if len(left.keys) + len(right.keys) <= self._fanout:
+                left.keys.extend(right.keys)
+                left.values.extend(right.values)
+                left.next = right.next
+                del parent.keys[index]
+                del parent.children[index + 1]
+                return
+            keys = left.keys + right.keys
+            values = left.values + right.values
+            middle = len(keys) // 2
+            left.keys, right.keys = keys[:middle], keys[middle:]
+            left.values, right.values = values[:middle], values[middle:]
+            parent.keys[index] = right.keys[0]
+            return
+
+        keys = left.keys + [parent.keys[index]] + right.keys
+        children = left.children + right.children
+        if len(children) <= self._fanout:
+            left.keys = keys
+            left.children = children
+            del parent.keys[index]
+            del parent.children[index + 1]
+            return
+        middle = len(children) // 2
+        left.keys, left.children = keys[:middle - 1], children[:middle]
+        parent.keys[index] = keys[middle - 1]
+        right.keys, right.children = keys[middle:], children[middle:]
+
+    def __repr__(self):
+        """Return the number of keys, the height and the fanout."""
+        return f"BPlusTree(size={self._count}, height={self._height}, fanout={self._fanout})"
+
+
+def load_transactions(path=TRANSACTIONS_CSV):
+    """
+    Read the transactions CSV.
+
+    Parameters
+    ----------
+    path : str, optional
+        The CSV file (default is SQL/transactions_cleaned.csv in this repository).
+
+    Returns
+    -------
+    list of dict
+        One dict per row, with transaction_id as an int and tran_date as a
+        datetime.date. The file stores dates day first, as dd-mm-yyyy or d/m/yyyy.
+    """
+    with open(path, newline="") as file:
+        rows = list(csv.DictReader(file))
+    for row in rows:
+        row["transaction_id"] = int(row["transaction_id"])
+        row["tran_date"] = datetime.datetime.strptime(row["tran_date"].replace("/", "-"),
+                                                      "%d-%m-%Y").date()
+    return rows
+
+
+def build_transaction_indexes(rows, fanout=64):
+    """
+    Bulk load B+ tree indexes on transaction_id and tran_date.
+
+    Parameters
+    ----------
+    rows : list of dict
+        Rows from load_transactions.
+    fanout : int, optional
+        Fanout of both trees (default is 64).
+
+    Returns
+    -------
+    tuple of BPlusTree
+        The transaction_id index, mapping each id to the list of row numbers
+        with that id, and the tran_date index, mapping each date to the list
+        of row numbers on that date.
+    """
+    indexes = []
+    for column in ("transaction_id", "tran_date"):
+        row_numbers = {}
+        for number, row in enumerate(rows):
+            row_numbers.setdefault(row[column], []).append(number)
+        indexes.append(BPlusTree.bulk_load(sorted(row_numbers.items()), fanout))
+    return tuple(indexes)
+
+
+def benchmark_transactions(path=TRANSACTIONS_CSV, fanout=64, lookups=10_000, seed=0):
+    """
+    Time point and range lookups on the transaction indexes.
+
+    Point lookups search random transaction ids; range lookups collect the
+    rows of a random 30-day window from the tran_date index. Both are run on
+    the in-memory trees, on trees opened from page files, and as a linear
+    scan over the rows for comparison.
+
+    Parameters
+    ----------
+    path : str, optional
+        The transactions CSV (default is SQL/transactions_cleaned.csv).
+    fanout : int, optional
+        Fanout of the trees (default is 64).
+    lookups : int, optional
+        Number of point and of range lookups (default is 10_000).
+    seed : int, optional
+        Random seed (default is 0).
+
+    Returns
+    -------
+    dict
+        Microseconds per lookup, keyed by "<index> point" and "<index> range".
+    """
+    rows = load_transactions(path)
+    rng = random.Random(seed)
+    ids = [rng.choice(rows)["transaction_id"] for _ in range(lookups)]
+    first = min(row["tran_date"] for row in rows)
+    span = (max(row["tran_date"] for row in rows) - first).days
+    windows = []
+    for _ in range(lookups):
+        low = first + datetime.timedelta(days=rng.randrange(span))
+        windows.append((low, low + datetime.timedelta(days=30)))
+
+    id_index, date_index = build_transaction_indexes(rows, fanout)
+    results = {}
+
+    def run(name, id_tree, date_tree):
+        start = time.perf_counter()
+        for transaction_id in ids:
+            id_tree.search(transaction_id)
+        results[f"{name} point"] = (time.perf_counter() - start) / lookups * 1e6
+        start = time.perf_counter()
+        for low, high in windows:
+            [number for _, numbers in date_tree.range(low, high) for number in numbers]
+        results[f"{name} range"] = (time.perf_counter() - start) / lookups * 1e6
+
+    run("BPlusTree", id_index, date_index)
+    with tempfile.TemporaryDirectory() as directory:
+        id_path = os.path.join(directory, "transaction_id.bpt")
+        date_path = os.path.join(directory, "tran_date.bpt")
+        id_index.save(id_path)
+        date_index.save(date_path)
+        with BPlusTree.open(id_path) as id_tree, BPlusTree.open(date_path) as date_tree:
+            run("paged BPlusTree", id_tree, date_tree)
+
+    scans = lookups // 100 or 1
+    start = time.perf_counter()
+    for transaction_id in ids[:scans]:
+        [row for row in rows if row["transaction_id"] == transaction_id]
+    results["linear scan point"] = (time.perf_counter() - start) / scans * 1e6
+    start = time.perf_counter()
+    for low, high in windows[:scans]:
+        [row for row in rows if low <= row["tran_date"] < high]
+    results["linear scan range"] = (time.perf_counter() - start) / scans * 1e6
+    return results
+
+
+# Example usage:
+if __name__ == "__main__":
+    bpt = BPlusTree(fanout=4)
+    for key in [50, 20, 80, 10, 30, 70, 90, 60, 40]:
+        bpt.insert(key, key * 10)
+    print("Tree:", bpt)
+    print("Search 30:", bpt.search(30))
+    print("Search 35:", bpt.search(35))
+    print("Range [25, 75):", list(bpt.range(25, 75)))
+    print("Delete 20:", bpt.delete(20), "Delete 25:", bpt.delete(25))
+    print("Keys:", list(bpt))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "example.bpt")
+        BPlusTree.bulk_load(((key, str(key)) for key in range(1_000)), fanout=16).save(path)
+        with BPlusTree.open(path, cache_pages=8) as paged:
+            print("Opened:", paged)
+            print("Search 500:", paged.search(500))
+            print("Range [10, 14):", list(paged.range(10, 14)))
+
+    if os.path.exists(TRANSACTIONS_CSV):
+        for name, micros in benchmark_transactions().items():
+            print(f"{name:>24}: {micros:10.2f} us/lookup")
@@ -0,0 +1,629 @@
+"""
+CACHE DATA STRUCTURE
+....................
+A cache is a bounded key-value store that keeps recently or frequently used entries
+and evicts others when it runs out of room.
+
+This implementation stores its entries in the chained HashTable and keeps them in
+the order an eviction policy needs, so both lookups and evictions are O(1).
+
+Eviction policies:
+1. LRU (least recently used): evict the entry that was read or written longest ago.
+2. LFU (least frequently used): evict the entry with the fewest reads, breaking
+   ties by evicting the least recently used among them.
+3. TTL (time to live): entries expire a fixed number of seconds after they were
+   written; when the cache is full the entry closest to expiring is evicted.
+
+Operations:
+1. Get: Retrieve a cached value and record the access.
+2. Put: Store a value, evicting entries first until it fits in the budget.
+3. Delete: Remove an entry.
+4. Stats: Report hit, miss, eviction and expiration counters.
+
+Properties:
+- The budget is a maximum number of entries, a maximum number of bytes, or both.
+- Each policy keeps entries in doubly linked lists, so reordering an entry on
+  access and finding the next victim are both O(1).
+- memoize() turns any function into a cached one, keyed on its arguments.
+
+Pros:
+- Memory use is bounded.
+- Counters show whether the cache is actually helping.
+
+Cons:
+- Each entry costs a hash table node and a list entry.
+- The byte budget is only as accurate as the sizeof function used.
+
+When to use a cache:
+- When the same expensive computation or lookup is repeated with the same inputs.
+
+When not to use a cache:
+- When results depend on state that is not part of the key.
+- When inputs rarely repeat.
+
+Keyword arguments:
+argument -- description
+Return: return_description
+"""
+
+import functools
+import sys
+import time
+
+from hash import HashTable
+
+
+class _CacheEntry:
+    """
+    An entry in the cache, linked into the eviction policy's lists.
+
+    Attributes
+    ----------
+    key : object
+        The cache key.
+    value : object
+        The cached value.
+    size : int
+        Size of the value in bytes, as reported by the cache's sizeof function.
+    freq : int
+        Number of accesses, used by LFUPolicy.
+    expires : float or None
+        Monotonic time at which the entry expires, used by TTLPolicy.
+    prev : _CacheEntry
+        Previous entry in the policy list.
+    next : _CacheEntry
+        Next entry in the policy list.
+    """
+    __slots__ = ("key", "value", "size", "freq", "expires", "prev", "next")
+
+    def __init__(self, key, value, size=0):
+        self.key = key
+        self.value = value
+        self.size = size
+        self.freq = 1
+        self.expires = None
+        self.prev = None
+        self.next = None
+
+
+class _EntryList:
+    """
+    Circular doubly linked list of cache entries with a sentinel node.
+    The first entry is the oldest, the last entry the newest.
+    """
+    def __init__(self):
+        self._sentinel = _CacheEntry(None, None)
+        self._sentinel.prev = self._sentinel.next = self._sentinel
+
+    def is_empty(self):
+        return self._sentinel.next is self._sentinel
+
+    def first(self):
+        entry = self._sentinel.next
+        return None if entry is self._sentinel else entry
+
+    def append(self, entry):
+        last = self._sentinel.prev
+        entry.prev = last
+        entry.next = self._sentinel
+        last.next = entry
+        self._sentinel.prev = entry
+
+    def remove(self, entry):
+        entry.prev.next = entry.next
+        entry.next.prev = entry.prev
+        entry.prev = entry.next = None
+
+
+class EvictionPolicy:
+    """
+    Base class for cache eviction policies.
+
+    A policy is told about every entry that is inserted, accessed or removed,
+    and is asked which entry to evict next.
+
+    Methods
+    -------
+    on_insert(entry)
+        Record a new entry.
+    on_access(entry)
+        Record a read of an entry.
+    on_remove(entry)
+        Forget an entry that left the cache.
+    victim()
+        Return the entry to evict next, or None if there are none.
+    is_expired(entry)
+        Check whether an entry should no longer be served.
+    """
+
+    def on_insert(self, entry):
+        raise NotImplementedError
+
+    def on_access(self, entry):
+        raise NotImplementedError
+
+    def on_remove(self, entry):
+        raise NotImplementedError
+
+    def victim(self):
+        raise NotImplementedError
+
+    def is_expired(self, entry):
+        return False
+
+
+class LRUPolicy(EvictionPolicy):
+    """
+    Least recently used eviction.
+
+    Entries are kept in access order; an access moves the entry to the end and
+    the victim is the first entry.
+    """
+
+    def __init__(self):
+        self._entries = _EntryList()
+
+    def on_insert(self, entry):
+        self._entries.append(entry)
+
+    def on_access(self, entry):
+        self._entries.remove(entry)
+        self._entries.append(entry)
+
+    def on_remove(self, entry):
+        self._entries.remove(entry)
+
+    def victim(self):
+        return self._entries.first()
+
+
+class _FrequencyList(_EntryList):
+    """
+    The entries with one access count, linked to the lists with the next
+    lower and next higher counts.
+    """
+    def __init__(self, freq):
+        super().__init__()
+        self.freq = freq
+        self.lower = None
+        self.higher = None
+
+
+class LFUPolicy(EvictionPolicy):
+    """
+    Least frequently used eviction.
+
+    Entries are grouped into one list per access count, and the non-empty
+    lists are linked in increasing count order. An access moves the entry to
+    the list of the next count, creating it next to the current one if
+    needed, and the victim is the oldest entry of the lowest list. Every
+    operation, including finding the victim, is O(1).
+
+    Attributes
+    ----------
+    _lists : dict
+        Maps an access count to the _FrequencyList of entries with that count.
+    _lowest : _FrequencyList or None
+        The list with the lowest access count.
+    """
+
+    def __init__(self):
+        self._lists = {}
+        self._lowest = None
+
+    def _insert_list(self, freq, lower):
+        """Create the list for freq and link it right after lower (None for first)."""
+        entries = self._lists[freq] = _FrequencyList(freq)
+        higher = lower.higher if lower is not None else self._lowest
+        entries.lower = lower
+        entries.higher = higher
+        if lower is not None:
+            lower.higher = entries
+        else:
+            self._lowest = entries
+        if higher is not None:
+            higher.lower = entries
+        return entries
+
+    def _discard(self, entry):
+        """Remove entry from its list and unlink the list if it is now empty."""
+        entries = self._lists[entry.freq]
+        entries.remove(entry)
+        if entries.is_empty():
+            del self._lists[entry.freq]
+            if entries.lower is not None:
+                entries.lower.higher = entries.higher
+            else:
+                self._lowest = entries.higher
+            if entries.higher is not None:
+                entries.higher.lower = entries.lower
+
+    def on_insert(self, entry):
+        entry.freq = 1
+        entries = self._lists.get(1)
+        if entries is None:
+            entries = self._insert_list(1, None)
+        entries.append(entry)
+
+    def on_access(self, entry):
+        current = self._lists[entry.freq]
+        entries = current.higher
+        if entries is None or entries.freq != entry.freq + 1:
+            entries = self._insert_list(entry.freq + 1, current)
+        self._discard(entry)
+        entry.freq += 1
+        entries.append(entry)
+
+    def on_remove(self, entry):
+        self._discard(entry)
+
+    def victim(self):
+        return self._lowest.first() if self._lowest is not None else None
+
+
+class TTLPolicy(EvictionPolicy):
+    """
+    Time-to-live expiry.
+
+    Every entry expires ttl seconds after it was last written. Since all
+    entries share one ttl, write order is expiry order, so the entries are
+    kept in a single list and the victim is the first one.
+
+    Parameters
+    ----------
+    ttl : float
+        Seconds an entry stays valid after it is written.
+    clock : callable, optional
+        Returns the current time in seconds (default is time.monotonic).
+    """
+
+    def __init__(self, ttl, clock=time.monotonic):
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self._ttl = ttl
+        self._clock = clock
+        self._entries = _EntryList()
+
+    def on_insert(self, entry):
+        entry.expires = self._clock() + self._ttl
+        self._entries.append(entry)
+
+    def on_access(self, entry):
+        pass
+
+    def on_remove(self, entry):
+        self._entries.remove(entry)
+
+    def victim(self):
+        return self._entries.first()
+
+    def is_expired(self, entry):
+        return entry.expires <= self._clock()
+
+
+POLICIES = {
+    "lru": LRUPolicy,
+    "lfu": LFUPolicy,
+}
+
+
+class Cache:
+    """
+    Bounded cache on top of HashTable with a pluggable eviction policy.
+
+    Methods
+    -------
+    get(key, default=None)
+        Retrieve a cached value.
+    put(key, value)
+        Store a value, evicting entries while over budget.
+    delete(key)
+        Remove an entry.
+    clear()
+        Remove every entry.
+    stats()
+        Return the hit, miss, eviction and expiration counters.
+    is_empty()
+        Check if the cache is empty.
+
+    Parameters
+    ----------
+    max_entries : int or None, optional
+        Maximum number of entries (default is 128).
+    max_bytes : int or None, optional
+        Maximum total size of the cached values (default is None).
+    policy : str or EvictionPolicy, optional
+        "lru", "lfu" or a policy instance such as TTLPolicy(60)
+        (default is "lru").
+    sizeof : callable, optional
+        Returns the size in bytes of a value (default is sys.getsizeof).
+
+    Attributes
+    ----------
+    _table : HashTable
+        Maps keys to their _CacheEntry.
+    _policy : EvictionPolicy
+        Decides which entry to evict.
+    _bytes : int
+        Total size of the cached values.
+    hits, misses, evictions, expirations : int
+        Counters since the cache was created.
+    """
+
+    def __init__(self, max_entries=128, max_bytes=None, policy="lru", sizeof=sys.getsizeof):
+        """Initialize an empty cache.
+
+        Time complexity: O(1)
+        Space complexity: O(n)
+        """
+        if max_entries is None and max_bytes is None:
+            raise ValueError("a cache needs max_entries, max_bytes or both")
+        if isinstance(policy, str):
+            try:
+                policy = POLICIES[policy]()
+            except KeyError:
+                raise ValueError(f"Unknown eviction policy {policy!r}") from None
+        self._table = HashTable()
+        self._policy = policy
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        """Return the number of cached entries."""
+        return len(self._table)
+
+    def __contains__(self, key):
+        """Check whether an unexpired entry is cached, without recording an access."""
+        entry = self._table.search(key)
+        return entry is not None and not self._policy.is_expired(entry)
+
+    def is_empty(self):
+        """
+        Check if the cache is empty.
+
+        Returns
+        -------
+        bool
+            True if the cache is empty, False otherwise.
+        """
+        return self._table.is_empty()
+
+    def _remove(self, entry):
+        self._table.delete(entry.key)
+        self._policy.on_remove(entry)
+        self._bytes -= entry.size
+
+    def _over_budget(self, size):
+        # True if a new entry of the given size does not fit next to the cached ones.
+        return ((self._max_entries is not None and len(self._table) >= self._max_entries)
+                or (self._max_bytes is not None and self._bytes + size > self._max_bytes))
+
+    def get(self, key, default=None):
+        """
+        Retrieve a cached value and record the access.
+
+        Parameters
+        ----------
+        key : object
+            The key to look up.
+        default : object, optional
+            Returned on a miss (default is None).
+
+        Returns
+        -------
+        object
+            The cached value, or default.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        entry = self._table.search(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        if self._policy.is_expired(entry):
+            self._remove(entry)
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self._policy.on_access(entry)
+        self.hits += 1
+        return entry.value
+
+    def put(self, key, value):
+        """
+        Store a value, first evicting entries until it fits in the budget.
+
+        The victims are chosen before the new entry is inserted, so a policy
+        such as LFU never picks the entry being stored. A value larger than
+        max_bytes on its own is not cached.
+
+        Parameters
+        ----------
+        key : object
+            The key to store the value under.
+        value : object
+            The value to cache.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        size = self._sizeof(value) if self._max_bytes is not None else 0
+        old = self._table.search(key)
+        if old is not None:
+            self._remove(old)
+        if self._max_bytes is not None and size > self._max_bytes:
+            return
+        if self._max_entries == 0:
+            return
+        while not self._table.is_empty() and self._over_budget(size):
+            victim = self._policy.victim()
+            self._remove(victim)
+            if self._policy.is_expired(victim):
+                self.expirations += 1
+            else:
+                self.evictions += 1
+        entry = _CacheEntry(key, value, size)
+        self._table.insert(key, entry)
+        self._policy.on_insert(entry)
+        self._bytes += size
+
+    def delete(self, key):
+        """
+        Remove an entry.
+
+        Parameters
+        ----------
+        key : object
+            The key to remove.
+
+        Returns
+        -------
+        bool
+            True if the key was cached, False otherwise.
+        """
+        entry = self._table.search(key)
+        if entry is None:
+            return False
+        self._remove(entry)
+        return True
+
+    def clear(self):
+        """Remove every entry, keeping the counters."""
+        while True:
+            entry = self._policy.victim()
+            if entry is None:
+                return
+            self._remove(entry)
+
+    def stats(self):
+        """
+        Return the cache counters.
+
+        Returns
+        -------
+        dict
+            hits, misses, evictions, expirations, hit_rate, entries and bytes.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._table),
+            "bytes": self._bytes,
+        }
+
+
+def _freeze(obj):
+    """Turn lists, dicts and sets in a function argument into hashable equivalents."""
+    if isinstance(obj, (list, tuple)):
+        return type(obj).__name__, tuple(_freeze(item) for item in obj)
+    if isinstance(obj, dict):
+        return "dict", tuple((key, _freeze(value)) for key, value in obj.items())
+    if isinstance(obj, (set, frozenset)):
+        return "set", frozenset(obj)
+    return obj
+
+
+def memoize(cache=None, **cache_kwargs):
+    """
+    Decorator that caches a function's results keyed on its arguments.
+
+    Unhashable list, dict and set arguments are frozen into tuples first, so
+    methods such as the leetcode Solution.twoSum(nums, target) can be wrapped.
+    For methods the instance is part of the key.
+
+    Parameters
+    ----------
+    cache : Cache, optional
+        The cache to store results in. A new Cache(**cache_kwargs) is
+        created if omitted.
+    **cache_kwargs
+        Passed to Cache when no cache is given.
+
+    Returns
+    -------
+    callable
+        The decorator. The wrapped function exposes its cache as .cache.
+    """
+    if cache is None:
+        cache = Cache(**cache_kwargs)
+    missing = object()
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _freeze(args)
+            if kwargs:
+                key = (key, _freeze(kwargs))
+            result = cache.get(key, missing)
+            if result is missing:
+                result = func(*args, **kwargs)
+                cache.put(key, result)
+            return result
+        wrapper.cache = cache
+        return wrapper
+    return decorator
+
+
+# Example usage:
+if __name__ == "__main__":
+    cache = Cache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    print("Get 'a':", cache.get("a"))
+    cache.put("c", 3)
+    print("Get 'b' after LRU eviction:", cache.get("b"))
+    print("LRU stats:", cache.stats())
+
+    cache = Cache(max_entries=2, policy="lfu")
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+    cache.put("c", 3)
+    print("Keys kept by LFU:", [key for key in "abc" if key in cache])
+    print("Get 'c' after evicting the least read key:", cache.get("c"))
+
+    cache = Cache(max_entries=10, policy=TTLPolicy(0.05))
+    cache.put("a", 1)
+    time.sleep(0.06)
+    print("Get 'a' after TTL:", cache.get("a"), cache.stats()["expirations"], "expired")
+
+    class Solution(object):
+        @memoize(max_entries=1000)
+        def climbStairs(self, n):
+            return n if n <= 2 else self.climbStairs(n - 1) + self.climbStairs(n - 2)
+
+    start = time.perf_counter()
+    print("climbStairs(300):", Solution().climbStairs(300))
+    print(f"Computed in {(time.perf_counter() - start) * 1000:.3f} ms,",
+          Solution.climbStairs.cache.stats())
@@ -0,0 +1,377 @@
+"""
+CONCURRENT HASH TABLE DATA STRUCTURE
+....................................
+A concurrent hash table is a hash table that can be shared between threads
+without wrapping every operation in one global lock.
+
+This implementation uses separate chaining with lock striping: the buckets are
+partitioned into a fixed number of stripes and every stripe has its own lock.
+Writers only lock the stripe that owns the key's bucket, so writers to
+different stripes do not wait for each other. Readers take no lock at all.
+
+Operations:
+1. Insert: Add a key-value pair to the hash table.
+2. Search: Retrieve the value associated with a given key.
+3. Delete: Remove a key-value pair from the hash table.
+4. Check if empty: Determine if the hash table has no entries.
+
+Properties:
+- The stripe of a key is hash(key) % stripes. The bucket count is always a
+  multiple of the stripe count, so a key keeps its stripe across resizes.
+- New nodes are fully built before they are published with a single reference
+  assignment, and deleted nodes keep their next pointer, so a reader walking a
+  chain always sees a consistent list.
+- Resizing takes every stripe lock in order, copies the entries into a new bucket
+  array and publishes it with one assignment. Readers still holding the old array
+  keep seeing the old, unchanged chains.
+
+Pros:
+- Readers never block, and writers only contend within a stripe.
+- Resizing is coordinated across stripes without a separate global lock.
+
+Cons:
+- Resizing copies every node and blocks all writers while it runs.
+- In CPython with the GIL, threads still take turns executing bytecode, so
+  throughput gains come from less lock contention rather than parallel execution.
+
+When to use a concurrent hash table:
+- When one table is shared between worker threads with mixed reads and writes.
+
+When not to use a concurrent hash table:
+- When the table is only used from one thread; HashTable is faster there.
+
+Keyword arguments:
+argument -- description
+Return: return_description
+"""
+
+import random
+import threading
+import time
+
+from hash import HashNode, HashTable
+
+
+class ConcurrentHashTable:
+    """
+    Thread-safe hash table using separate chaining and striped locks.
+
+    Methods
+    -------
+    insert(key, value)
+        Insert a key-value pair into the hash table.
+    search(key)
+        Retrieve the value associated with a key.
+    delete(key)
+        Remove a key-value pair from the hash table.
+    is_empty()
+        Check if the hash table is empty.
+
+    Parameters
+    ----------
+    capacity : int, optional
+        Initial number of buckets, rounded up to a multiple of stripes
+        (default is 16).
+    stripes : int, optional
+        Number of locks the buckets are partitioned into (default is 16).
+    max_load_factor : float, optional
+        Load factor above which the table doubles its buckets (default is 0.75).
+
+    Attributes
+    ----------
+    _buckets : list
+        List of bucket heads (linked lists). Replaced, never resized in place.
+    _locks : list of threading.Lock
+        One lock per stripe.
+    _counts : list of int
+        Number of entries in each stripe, updated under the stripe's lock.
+    """
+
+    def __init__(self, capacity=16, stripes=16, max_load_factor=0.75):
+        """Initialize an empty hash table.
+
+        Time complexity: O(1)
+        Space complexity: O(n)
+        """
+        if stripes < 1:
+            raise ValueError("stripes must be at least 1")
+        if max_load_factor <= 0:
+            raise ValueError("max_load_factor must be positive")
+        capacity = max(capacity, stripes)
+        capacity += -capacity % stripes
+        self._buckets = [None] * capacity
+        self._stripes = stripes
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._counts = [0] * stripes
+        self._max_load_factor = max_load_factor
+
+    def __len__(self):
+        """Return the number of key-value pairs in the hash table."""
+        return sum(self._counts)
+
+    def is_empty(self):
+        """
+        Check if the hash table is empty.
+
+        Returns
+        -------
+        bool
+            True if the hash table is empty, False otherwise.
+
+        Time complexity
+        ---------------
+        Best : O(s)
+        Average : O(s)
+        Worst : O(s)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        return len(self) == 0
+
+    def search(self, key):
+        """
+        Retrieve the value associated with a key without taking any lock.
+
+        Parameters
+        ----------
+        key : object
+            The key to search for.
+
+        Returns
+        -------
+        object or None
+            The value associated with the key, or None if not found.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        buckets = self._buckets
+        current = buckets[hash(key) % len(buckets)]
+        while current:
+            if current.key == key:
+                return current.value
+            current = current.next
+        return None
+
+    def insert(self, key, value):
+        """
+        Insert a key-value pair into the hash table.
+
+        Only the key's stripe is locked, unless the insert pushes the whole
+        table over its load factor, in which case the table is resized.
+
+        Parameters
+        ----------
+        key : object
+            The key to insert.
+        value : object
+            The value to associate with the key.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(n)
+        """
+        key_hash = hash(key)
+        stripe = key_hash % self._stripes
+        with self._locks[stripe]:
+            buckets = self._buckets
+            index = key_hash % len(buckets)
+            head = buckets[index]
+            current = head
+            while current:
+                if current.key == key:
+                    current.value = value
+                    return
+                current = current.next
+            new_node = HashNode(key, value)
+            new_node.next = head
+            buckets[index] = new_node
+            self._counts[stripe] += 1
+            # The other stripes' counts are read without their locks, so the
+            # total is approximate; _resize checks it again under every lock.
+            needs_resize = sum(self._counts) > self._max_load_factor * len(buckets)
+        if needs_resize:
+            self._resize()
+
+    def delete(self, key):
+        """
+        Remove a key-value pair from the hash table.
+
+        Parameters
+        ----------
+        key : object
+            The key to delete.
+
+        Returns
+        -------
+        bool
+            True if the key was found and deleted, False otherwise.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        key_hash = hash(key)
+        stripe = key_hash % self._stripes
+        with self._locks[stripe]:
+            buckets = self._buckets
+            index = key_hash % len(buckets)
+            current = buckets[index]
+            prev = None
+            while current:
+                if current.key == key:
+                    if prev:
+                        prev.next = current.next
+                    else:
+                        buckets[index] = current.next
+                    self._counts[stripe] -= 1
+                    return True
+                prev = current
+                current = current.next
+            return False
+
+    def _resize(self):
+        """
+        Double the bucket array while holding every stripe lock.
+
+        Locks are always taken in stripe order, so two threads resizing at
+        once cannot deadlock. The load factor is checked again once all locks
+        are held, because another thread may have resized already. Nodes are
+        copied rather than relinked so that lock-free readers of the old
+        array are unaffected.
+        """
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            old_buckets = self._buckets
+            if sum(self._counts) <= self._max_load_factor * len(old_buckets):
+                return
+            capacity = len(old_buckets) * 2
+            buckets = [None] * capacity
+            for current in old_buckets:
+                while current:
+                    index = hash(current.key) % capacity
+                    new_node = HashNode(current.key, current.value)
+                    new_node.next = buckets[index]
+                    buckets[index] = new_node
+                    current = current.next
+            self._buckets = buckets
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
+
+
+class _GlobalLockHashTable:
+    """HashTable behind a single lock, the baseline for the benchmark."""
+
+    def __init__(self):
+        self._table = HashTable()
+        self._lock = threading.Lock()
+
+    def insert(self, key, value):
+        with self._lock:
+            self._table.insert(key, value)
+
+    def search(self, key):
+        with self._lock:
+            return self._table.search(key)
+
+
+def benchmark_throughput(thread_counts=(1, 2, 4, 8), read_ratios=(0.5, 0.9, 0.99),
+                         ops_per_thread=50_000, key_space=100_000):
+    """
+    Measure operations per second with several threads sharing one table.
+
+    Each thread performs ops_per_thread random searches and inserts over
+    key_space keys, with the given fraction of searches. The striped table
+    is compared against HashTable behind a single global lock.
+
+    Parameters
+    ----------
+    thread_counts : tuple of int, optional
+        Numbers of threads to run (default is (1, 2, 4, 8)).
+    read_ratios : tuple of float, optional
+        Fractions of operations that are searches (default is (0.5, 0.9, 0.99)).
+    ops_per_thread : int, optional
+        Operations performed by each thread (default is 50_000).
+    key_space : int, optional
+        Number of distinct keys (default is 100_000).
+
+    Returns
+    -------
+    list of tuple
+        (table_name, threads, read_ratio, ops_per_second) for each run.
+    """
+    results = []
+    for name, factory in (("striped", ConcurrentHashTable), ("global lock", _GlobalLockHashTable)):
+        for read_ratio in read_ratios:
+            for threads in thread_counts:
+                table = factory()
+                for key in range(0, key_space, 2):
+                    table.insert(key, key)
+
+                def worker(seed):
+                    rng = random.Random(seed)
+                    search, insert = table.search, table.insert
+                    for _ in range(ops_per_thread):
+                        key = rng.randrange(key_space)
+                        if rng.random() < read_ratio:
+                            search(key)
+                        else:
+                            insert(key, key)
+
+                workers = [threading.Thread(target=worker, args=(seed,)) for seed in range(threads)]
+                start = time.perf_counter()
+                for thread in workers:
+                    thread.start()
+                for thread in workers:
+                    thread.join()
+                elapsed = time.perf_counter() - start
+                results.append((name, threads, read_ratio, threads * ops_per_thread / elapsed))
+    return results
+
+
+# Example usage:
+if __name__ == "__main__":
+    ht = ConcurrentHashTable()
+    ht.insert("apple", 10)
+    ht.insert("banana", 20)
+    ht.insert("orange", 30)
+    print("Search 'banana':", ht.search("banana"))
+    print("Delete 'banana':", ht.delete("banana"))
+    print("Search 'banana':", ht.search("banana"))
+    print("Size:", len(ht))
+    print("Is hash table empty?", ht.is_empty())
+
+    print("Throughput (ops/s):")
+    for name, threads, read_ratio, rate in benchmark_throughput(ops_per_thread=20_000):
+        print(f"  {name:>11}, {threads} threads, {read_ratio:.0%} reads: {rate:12,.0f}")
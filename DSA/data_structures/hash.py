@@ -4,17 +4,29 @@ HASH TABLE DATA STRUCTURE
 A hash table is a data structure that implements a structure that can map keys to values.
 It uses a hash function to compute an index into an array of buckets or slots, from which the desired value can be found.
 
-This implementation provides a simple hash table using separate chaining for collision resolution.
+This implementation provides a simple hash table using separate chaining for collision resolution,
+and an alternative open addressing engine that stores entries in flat arrays.
 
 Operations:
 1. Insert: Add a key-value pair to the hash table.
 2. Search: Retrieve the value associated with a given key.
 3. Delete: Remove a key-value pair from the hash table.
 4. Check if empty: Determine if the hash table has no entries.
+5. Iterate: Stream keys, values or items lazily, bucket by bucket.
+6. Resize: Grow (or shrink) the bucket array when the load factor leaves its bounds.
 
 Properties:
 - Each entry contains a key and a value.
 - Collisions are handled using separate chaining (linked lists).
+- The load factor (entries / buckets) is kept below a configurable maximum.
+- Resizing is incremental: the old buckets are migrated a few at a time on every
+  insert and delete, so no single operation pays for a full rehash.
+- The open addressing engine keeps cached hashes, keys and values in parallel arrays
+  and uses Robin Hood probing with backward-shift deletion (no tombstones).
+- create_hash_table(engine=...) picks an engine at construction time.
+- enable_stats() turns on probe counting for insert, search and delete; stats()
+  reports probe counts, the chain (or probe) length histogram, the load factor
+  and the number of resizes. Until stats are enabled the operations run unchanged.
 
 Pros:
 - Provides average-case constant time complexity for insert, search, and delete.
@@ -37,6 +49,13 @@ argument -- description
 Return: return_description
 """
 
+import json
+import math
+import time
+import tracemalloc
+from array import array
+
+
 class HashNode:
     """
     Node for separate chaining in hash table.
@@ -59,11 +78,77 @@ class HashNode:
     next : HashNode or None
         Reference to the next node in the chain.
     """
+    __slots__ = ("key", "value", "next")
+
     def __init__(self, key, value):
         self.key = key
         self.value = value
         self.next = None
 
+class _OperationStats:
+    """
+    Probe counters for one hash table operation.
+
+    Attributes
+    ----------
+    count : int
+        Number of calls recorded.
+    total_probes : int
+        Sum of the probes over all calls.
+    max_probes : int
+        Largest number of probes in a single call.
+    """
+    def __init__(self):
+        self.count = 0
+        self.total_probes = 0
+        self.max_probes = 0
+
+    def record(self, probes):
+        self.count += 1
+        self.total_probes += probes
+        if probes > self.max_probes:
+            self.max_probes = probes
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "avg_probes": self.total_probes / self.count if self.count else 0.0,
+            "max_probes": self.max_probes,
+        }
+
+
+def _instrument(table, name, stats):
+    """
+    Return a replacement for table.<name> that records the probes needed for
+    the key before running the original method.
+    """
+    method = getattr(type(table), name)
+    probe_count = table._probe_count
+
+    def instrumented(key, *args, **kwargs):
+        stats.record(probe_count(key))
+        return method(table, key, *args, **kwargs)
+    return instrumented
+
+
+def _enable_stats(table):
+    """Shadow insert, search and delete on the instance with instrumented versions."""
+    if table._op_stats is not None:
+        return
+    table._op_stats = {name: _OperationStats() for name in ("insert", "search", "delete")}
+    for name, stats in table._op_stats.items():
+        setattr(table, name, _instrument(table, name, stats))
+
+
+def _disable_stats(table):
+    """Remove the instrumented methods so the class methods are used again."""
+    if table._op_stats is None:
+        return
+    for name in table._op_stats:
+        delattr(table, name)
+    table._op_stats = None
+
+
 class HashTable:
     """
     Hash table implementation using separate chaining.
@@ -78,11 +163,42 @@ class HashTable:
         Remove a key-value pair from the hash table.
     is_empty()
         Check if the hash table is empty.
+    load_factor()
+        Return the ratio of entries to buckets.
+    insert_many(keys, values=None)
+        Insert many key-value pairs, sizing the table once up front.
+    search_many(keys)
+        Retrieve the values associated with many keys.
+    delete_many(keys)
+        Remove many keys from the hash table.
+    keys()
+        Lazily yield every key.
+    values()
+        Lazily yield every value.
+    items()
+        Lazily yield every (key, value) pair.
+    enable_stats()
+        Start counting probes for insert, search and delete.
+    disable_stats()
+        Stop counting probes.
+    stats()
+        Return chain lengths, probe counts, load factor and resizes as a dict.
+    stats_json()
+        Return stats() encoded as JSON.
+
+    Supports len(), iteration over keys and the in operator. Iterators raise
+    RuntimeError if the table is modified while they are running.
 
     Parameters
     ----------
     capacity : int, optional
-        Number of buckets in the hash table (default is 10).
+        Initial number of buckets in the hash table (default is 10).
+    max_load_factor : float or None, optional
+        Load factor above which the table doubles its buckets (default is 0.75).
+        None disables growth.
+    min_load_factor : float or None, optional
+        Load factor below which the table halves its buckets, never going below
+        the initial capacity (default is None, which disables shrinking).
 
     Attributes
     ----------
@@ -92,17 +208,52 @@ class HashTable:
         Number of buckets in the hash table.
     _size : int
         Number of key-value pairs in the hash table.
+    _old_buckets : list or None
+        Buckets of the previous table while an incremental rehash is running.
+    _old_capacity : int
+        Number of buckets in the previous table.
+    _rehash_index : int
+        Next bucket of the previous table to migrate.
+    _rehash_batch : int
+        Buckets migrated per insert or delete, sized when a resize starts so
+        that the migration ends before the next resize can be triggered.
+    _version : int
+        Counter bumped on every structural change, used to detect
+        modification during iteration.
+    _resizes : int
+        Number of resizes started.
+    _op_stats : dict or None
+        Probe counters per operation while stats are enabled.
     """
 
-    def __init__(self, capacity=10):
+    _REHASH_STEP = 4
+
+    def __init__(self, capacity=10, max_load_factor=0.75, min_load_factor=None):
         """Initialize an empty hash table.
 
         Time complexity: O(1)
         Space complexity: O(n)
         """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if max_load_factor is not None and max_load_factor <= 0:
+            raise ValueError("max_load_factor must be positive")
+        if min_load_factor is not None:
+            if max_load_factor is None or not 0 < min_load_factor < max_load_factor / 2:
+                raise ValueError("min_load_factor must be between 0 and max_load_factor / 2")
         self._capacity = capacity
         self._buckets = [None] * capacity
         self._size = 0
+        self._initial_capacity = capacity
+        self._max_load_factor = max_load_factor
+        self._min_load_factor = min_load_factor
+        self._old_buckets = None
+        self._old_capacity = 0
+        self._rehash_index = 0
+        self._rehash_batch = self._REHASH_STEP
+        self._version = 0
+        self._resizes = 0
+        self._op_stats = None
 
     def _hash(self, key):
         """
@@ -120,6 +271,136 @@ class HashTable:
         """
         return hash(key) % self._capacity
 
+    def _old_bucket_index(self, key):
+        """
+        Return the index of the key's bucket in the previous table if that
+        bucket has not been migrated yet, otherwise None.
+        """
+        if self._old_buckets is None:
+            return None
+        index = hash(key) % self._old_capacity
+        if index < self._rehash_index:
+            return None
+        return index
+
+    def load_factor(self):
+        """
+        Return the ratio of entries to buckets.
+
+        Returns
+        -------
+        float
+            Number of entries divided by the number of buckets.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        return self._size / self._capacity
+
+    def _resize(self, new_capacity):
+        """
+        Start an incremental rehash into a table with new_capacity buckets.
+
+        Any rehash still in progress is finished first, so at most two bucket
+        arrays exist at a time. Each later insert or delete migrates enough
+        buckets to finish before the size can reach either load factor bound
+        of the new table.
+        """
+        self._finish_rehash()
+        self._old_buckets = self._buckets
+        self._old_capacity = self._capacity
+        self._rehash_index = 0
+        self._buckets = [None] * new_capacity
+        self._capacity = new_capacity
+        self._version += 1
+        self._resizes += 1
+        operations = self._operations_until_resize()
+        self._rehash_batch = max(self._REHASH_STEP, -(-self._old_capacity // operations))
+
+    def _operations_until_resize(self):
+        """
+        Return the fewest inserts or deletes after which the load factor can
+        leave its bounds, since each one changes the size by at most one.
+        """
+        operations = self._old_capacity
+        if self._max_load_factor is not None:
+            grow_at = math.floor(self._max_load_factor * self._capacity) + 1
+            operations = min(operations, grow_at - self._size)
+        if self._min_load_factor is not None and self._capacity > self._initial_capacity:
+            shrink_at = math.ceil(self._min_load_factor * self._capacity) - 1
+            operations = min(operations, self._size - shrink_at)
+        return max(operations, 1)
+
+    def _rehash_step(self, steps):
+        """
+        Migrate up to steps buckets from the previous table to the current one.
+
+        Nodes are relinked rather than copied.
+        """
+        old_buckets = self._old_buckets
+        if old_buckets is None:
+            return
+        buckets = self._buckets
+        capacity = self._capacity
+        index = self._rehash_index
+        end = min(index + steps, self._old_capacity)
+        while index < end:
+            current = old_buckets[index]
+            old_buckets[index] = None
+            while current:
+                next_node = current.next
+                new_index = hash(current.key) % capacity
+                current.next = buckets[new_index]
+                buckets[new_index] = current
+                current = next_node
+            index += 1
+        self._rehash_index = index
+        self._version += 1
+        if index >= self._old_capacity:
+            self._old_buckets = None
+            self._old_capacity = 0
+            self._rehash_index = 0
+
+    def _finish_rehash(self):
+        """Migrate every remaining bucket of the previous table."""
+        if self._old_buckets is not None:
+            self._rehash_step(self._old_capacity)
+
+    def _reserve(self, count):
+        """
+        Grow the bucket array in one step so that count entries fit under the
+        maximum load factor. Any running rehash is finished first.
+        """
+        self._finish_rehash()
+        if self._max_load_factor is None:
+            return
+        new_capacity = self._capacity
+        while count > self._max_load_factor * new_capacity:
+            new_capacity *= 2
+        if new_capacity != self._capacity:
+            self._resize(new_capacity)
+            self._finish_rehash()
+
+    def _check_load(self):
+        """Advance any running rehash and start a new one if the load factor is out of bounds."""
+        if self._old_buckets is not None:
+            self._rehash_step(self._rehash_batch)
+        if self._max_load_factor is not None and self._size > self._max_load_factor * self._capacity:
+            self._resize(self._capacity * 2)
+        elif (self._min_load_factor is not None
+              and self._capacity > self._initial_capacity
+              and self._size < self._min_load_factor * self._capacity):
+            self._resize(max(self._capacity // 2, self._initial_capacity))
+
     def is_empty(self):
         """
         Check if the hash table is empty.
@@ -166,6 +447,14 @@ class HashTable:
         Average : O(1)
         Worst : O(1)
         """
+        old_index = self._old_bucket_index(key)
+        if old_index is not None:
+            current = self._old_buckets[old_index]
+            while current:
+                if current.key == key:
+                    current.value = value
+                    return
+                current = current.next
         index = self._hash(key)
         head = self._buckets[index]
         current = head
@@ -178,6 +467,8 @@ class HashTable:
         new_node.next = head
         self._buckets[index] = new_node
         self._size += 1
+        self._version += 1
+        self._check_load()
 
     def search(self, key):
         """
@@ -211,8 +502,37 @@ class HashTable:
             if current.key == key:
                 return current.value
             current = current.next
+        old_index = self._old_bucket_index(key)
+        if old_index is not None:
+            current = self._old_buckets[old_index]
+            while current:
+                if current.key == key:
+                    return current.value
+                current = current.next
         return None
 
+    def _unlink(self, buckets, index, key):
+        """
+        Remove the node holding key from the chain at buckets[index].
+
+        Returns
+        -------
+        bool
+            True if a node was removed, False otherwise.
+        """
+        current = buckets[index]
+        prev = None
+        while current:
+            if current.key == key:
+                if prev:
+                    prev.next = current.next
+                else:
+                    buckets[index] = current.next
+                return True
+            prev = current
+            current = current.next
+        return False
+
     def delete(self, key):
         """
         Remove a key-value pair from the hash table.
@@ -239,21 +559,1048 @@ class HashTable:
         Average : O(1)
         Worst : O(1)
         """
-        index = self._hash(key)
-        current = self._buckets[index]
-        prev = None
+        found = self._unlink(self._buckets, self._hash(key), key)
+        if not found:
+            old_index = self._old_bucket_index(key)
+            if old_index is not None:
+                found = self._unlink(self._old_buckets, old_index, key)
+        if not found:
+            return False
+        self._size -= 1
+        self._version += 1
+        self._check_load()
+        return True
+
+    def insert_many(self, keys, values=None):
+        """
+        Insert many key-value pairs.
+
+        The table is resized at most once before loading, and the loop works
+        on local references instead of calling insert for every pair.
+
+        Parameters
+        ----------
+        keys : mapping or iterable
+            A mapping, an iterable of (key, value) pairs, or the keys when
+            values is given.
+        values : iterable, optional
+            Values matching keys position by position (default is None).
+
+        Raises
+        ------
+        ValueError
+            If keys and values have different lengths.
+
+        Time complexity
+        ---------------
+        Best : O(k)
+        Average : O(k)
+        Worst : O(n + k^2)
+
+        Space complexity
+        ----------------
+        Best : O(k)
+        Average : O(k)
+        Worst : O(n + k)
+        """
+        if values is None:
+            if hasattr(keys, "items"):
+                keys = keys.items()
+            pairs = keys if hasattr(keys, "__len__") else list(keys)
+            count = len(pairs)
+        else:
+            keys = keys if hasattr(keys, "__len__") else list(keys)
+            values = values if hasattr(values, "__len__") else list(values)
+            if len(keys) != len(values):
+                raise ValueError("keys and values must have the same length")
+            count = len(keys)
+            pairs = zip(keys, values)
+        self._reserve(self._size + count)
+        buckets = self._buckets
+        capacity = self._capacity
+        added = 0
+        try:
+            for key, value in pairs:
+                index = hash(key) % capacity
+                head = buckets[index]
+                current = head
+                while current:
+                    if current.key == key:
+                        current.value = value
+                        break
+                    current = current.next
+                else:
+                    new_node = HashNode(key, value)
+                    new_node.next = head
+                    buckets[index] = new_node
+                    added += 1
+        finally:
+            self._size += added
+            self._version += 1
+
+    def search_many(self, keys):
+        """
+        Retrieve the values associated with many keys.
+
+        Parameters
+        ----------
+        keys : iterable
+            The keys to search for.
+
+        Returns
+        -------
+        list
+            The value for each key, or None where the key is not found.
+
+        Time complexity
+        ---------------
+        Best : O(k)
+        Average : O(k)
+        Worst : O(n * k)
+
+        Space complexity
+        ----------------
+        Best : O(k)
+        Average : O(k)
+        Worst : O(k)
+        """
+        if self._old_buckets is not None:
+            return [self.search(key) for key in keys]
+        buckets = self._buckets
+        capacity = self._capacity
+        results = []
+        append = results.append
+        for key in keys:
+            current = buckets[hash(key) % capacity]
+            while current:
+                if current.key == key:
+                    append(current.value)
+                    break
+                current = current.next
+            else:
+                append(None)
+        return results
+
+    def delete_many(self, keys):
+        """
+        Remove many keys from the hash table.
+
+        The load factor is checked once after all keys are removed, and the
+        table shrinks straight to its final size, within this call, if
+        shrinking is enabled.
+
+        Parameters
+        ----------
+        keys : iterable
+            The keys to delete.
+
+        Returns
+        -------
+        list of bool
+            For each key, True if it was found and deleted, False otherwise.
+
+        Time complexity
+        ---------------
+        Best : O(k)
+        Average : O(k)
+        Worst : O(n * k)
+
+        Space complexity
+        ----------------
+        Best : O(k)
+        Average : O(k)
+        Worst : O(k)
+        """
+        self._finish_rehash()
+        buckets = self._buckets
+        capacity = self._capacity
+        unlink = self._unlink
+        results = []
+        removed = 0
+        try:
+            for key in keys:
+                found = unlink(buckets, hash(key) % capacity, key)
+                results.append(found)
+                removed += found
+        finally:
+            self._size -= removed
+            self._version += 1
+        if self._min_load_factor is not None:
+            new_capacity = self._capacity
+            while (new_capacity > self._initial_capacity
+                   and self._size < self._min_load_factor * new_capacity):
+                new_capacity = max(new_capacity // 2, self._initial_capacity)
+            if new_capacity != self._capacity:
+                self._resize(new_capacity)
+                self._finish_rehash()
+        return results
+
+    def __len__(self):
+        """
+        Return the number of key-value pairs in the hash table.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        return self._size
+
+    def __contains__(self, key):
+        """
+        Check whether a key is present, even if its value is None.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        current = self._buckets[self._hash(key)]
         while current:
             if current.key == key:
-                if prev:
-                    prev.next = current.next
-                else:
-                    self._buckets[index] = current.next
-                self._size -= 1
                 return True
-            prev = current
             current = current.next
+        old_index = self._old_bucket_index(key)
+        if old_index is not None:
+            current = self._old_buckets[old_index]
+            while current:
+                if current.key == key:
+                    return True
+                current = current.next
         return False
-   
+
+    def _iter_nodes(self):
+        """
+        Yield every node, walking the current buckets and then the buckets of
+        the previous table that have not been migrated yet.
+
+        Raises
+        ------
+        RuntimeError
+            If the table is modified during iteration.
+        """
+        version = self._version
+        for buckets, start in ((self._buckets, 0), (self._old_buckets, self._rehash_index)):
+            if buckets is None:
+                continue
+            for index in range(start, len(buckets)):
+                current = buckets[index]
+                while current:
+                    yield current
+                    if self._version != version:
+                        raise RuntimeError("HashTable changed size during iteration")
+                    current = current.next
+
+    def __iter__(self):
+        """
+        Lazily yield every key.
+
+        Time complexity
+        ---------------
+        Best : O(n)
+        Average : O(n)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        for node in self._iter_nodes():
+            yield node.key
+
+    def keys(self):
+        """
+        Lazily yield every key.
+
+        Returns
+        -------
+        generator
+            Keys in bucket order.
+        """
+        return iter(self)
+
+    def values(self):
+        """
+        Lazily yield every value.
+
+        Returns
+        -------
+        generator
+            Values in bucket order.
+        """
+        for node in self._iter_nodes():
+            yield node.value
+
+    def items(self):
+        """
+        Lazily yield every (key, value) pair.
+
+        Returns
+        -------
+        generator
+            (key, value) tuples in bucket order.
+        """
+        for node in self._iter_nodes():
+            yield node.key, node.value
+
+    def _probe_count(self, key):
+        """
+        Return the number of nodes compared to find key, or to conclude it is
+        missing, across the current and any unmigrated previous bucket.
+        """
+        probes = 0
+        current = self._buckets[self._hash(key)]
+        while current:
+            probes += 1
+            if current.key == key:
+                return probes
+            current = current.next
+        old_index = self._old_bucket_index(key)
+        if old_index is not None:
+            current = self._old_buckets[old_index]
+            while current:
+                probes += 1
+                if current.key == key:
+                    return probes
+                current = current.next
+        return probes
+
+    def enable_stats(self):
+        """
+        Start counting probes for insert, search and delete.
+
+        The instance gets instrumented versions of the three methods; the
+        class methods, and so every table without stats, are left unchanged.
+        Bulk operations are not instrumented.
+        """
+        _enable_stats(self)
+
+    def disable_stats(self):
+        """Stop counting probes and discard the counters."""
+        _disable_stats(self)
+
+    def stats(self):
+        """
+        Return instrumentation data about the table.
+
+        Returns
+        -------
+        dict
+            engine, size, capacity, load_factor, resizes, rehash_in_progress,
+            chain_length_histogram (chain length -> number of buckets) and
+            operations (operation -> count, avg_probes, max_probes; empty
+            unless stats are enabled).
+
+        Time complexity
+        ---------------
+        Best : O(n + m)
+        Average : O(n + m)
+        Worst : O(n + m)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(k)
+        Worst : O(k)
+        """
+        histogram = {}
+        for buckets, start in ((self._buckets, 0), (self._old_buckets, self._rehash_index)):
+            if buckets is None:
+                continue
+            for index in range(start, len(buckets)):
+                current = buckets[index]
+                length = 0
+                while current:
+                    length += 1
+                    current = current.next
+                histogram[length] = histogram.get(length, 0) + 1
+        operations = {}
+        if self._op_stats is not None:
+            operations = {name: stats.as_dict() for name, stats in self._op_stats.items()}
+        return {
+            "engine": "chained",
+            "size": self._size,
+            "capacity": self._capacity,
+            "load_factor": self.load_factor(),
+            "resizes": self._resizes,
+            "rehash_in_progress": self._old_buckets is not None,
+            "chain_length_histogram": dict(sorted(histogram.items())),
+            "operations": operations,
+        }
+
+    def stats_json(self, **kwargs):
+        """
+        Return stats() encoded as JSON.
+
+        Parameters
+        ----------
+        **kwargs
+            Passed to json.dumps, e.g. indent=2.
+
+        Returns
+        -------
+        str
+            The JSON document.
+        """
+        return json.dumps(self.stats(), **kwargs)
+
+
+_EMPTY = -1  # hash() never returns -1, so it marks an empty slot
+
+
+class OpenAddressingHashTable:
+    """
+    Hash table implementation using open addressing with Robin Hood probing.
+
+    Entries live in three parallel arrays indexed by slot: cached hashes,
+    keys and values. An entry is placed at the first free slot after its
+    home slot; on the way it evicts any entry that is closer to its own home
+    ("robs the rich"), which keeps probe sequences short and lets lookups
+    stop early. Deletion shifts the following entries back by one slot, so
+    no tombstones are ever left behind.
+
+    Methods
+    -------
+    insert(key, value)
+        Insert a key-value pair into the hash table.
+    search(key)
+        Retrieve the value associated with a key.
+    delete(key)
+        Remove a key-value pair from the hash table.
+    is_empty()
+        Check if the hash table is empty.
+    load_factor()
+        Return the ratio of entries to slots.
+    keys()
+        Lazily yield every key.
+    values()
+        Lazily yield every value.
+    items()
+        Lazily yield every (key, value) pair.
+    enable_stats()
+        Start counting probes for insert, search and delete.
+    disable_stats()
+        Stop counting probes.
+    stats()
+        Return probe lengths, probe counts, load factor and resizes as a dict.
+    stats_json()
+        Return stats() encoded as JSON.
+
+    Supports len(), iteration over keys and the in operator. Iterators raise
+    RuntimeError if the table is modified while they are running.
+
+    Parameters
+    ----------
+    capacity : int, optional
+        Initial number of slots, rounded up to a power of two (default is 8).
+    max_load_factor : float, optional
+        Load factor at which the slot arrays double in size (default is 0.8).
+
+    Attributes
+    ----------
+    _hashes : array.array
+        Cached hash of the key in each slot, or -1 for an empty slot.
+    _keys : list
+        Key stored in each slot.
+    _values : list
+        Value stored in each slot.
+    _capacity : int
+        Number of slots.
+    _mask : int
+        capacity - 1, used to wrap slot indexes.
+    _size : int
+        Number of key-value pairs in the hash table.
+    _version : int
+        Counter bumped on every structural change, used to detect
+        modification during iteration.
+    _resizes : int
+        Number of resizes.
+    _op_stats : dict or None
+        Probe counters per operation while stats are enabled.
+    """
+
+    def __init__(self, capacity=8, max_load_factor=0.8):
+        """Initialize an empty hash table.
+
+        Time complexity: O(1)
+        Space complexity: O(n)
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor must be between 0 and 1")
+        slots = 2
+        while slots < capacity:
+            slots <<= 1
+        self._max_load_factor = max_load_factor
+        self._size = 0
+        self._version = 0
+        self._resizes = 0
+        self._op_stats = None
+        self._allocate(slots)
+
+    def _allocate(self, slots):
+        """Replace the slot arrays with empty arrays of the given size."""
+        self._capacity = slots
+        self._mask = slots - 1
+        self._hashes = array("q", [_EMPTY]) * slots
+        self._keys = [None] * slots
+        self._values = [None] * slots
+
+    def _resize(self, slots):
+        """Move every entry into new slot arrays of the given size."""
+        hashes, keys, values = self._hashes, self._keys, self._values
+        self._allocate(slots)
+        self._size = 0
+        self._resizes += 1
+        for i, key_hash in enumerate(hashes):
+            if key_hash != _EMPTY:
+                self._place(key_hash, keys[i], values[i])
+
+    def _place(self, key_hash, key, value):
+        """
+        Insert an entry known not to be in the table, applying Robin Hood displacement.
+        """
+        hashes, keys, values = self._hashes, self._keys, self._values
+        mask = self._mask
+        i = key_hash & mask
+        dist = 0
+        while True:
+            slot_hash = hashes[i]
+            if slot_hash == _EMPTY:
+                hashes[i] = key_hash
+                keys[i] = key
+                values[i] = value
+                self._size += 1
+                return
+            slot_dist = (i - slot_hash) & mask
+            if slot_dist < dist:
+                hashes[i], key_hash = key_hash, slot_hash
+                keys[i], key = key, keys[i]
+                values[i], value = value, values[i]
+                dist = slot_dist
+            i = (i + 1) & mask
+            dist += 1
+
+    def _find(self, key, key_hash):
+        """
+        Return the slot holding key, or -1 if the key is not present.
+        """
+        hashes, keys = self._hashes, self._keys
+        mask = self._mask
+        i = key_hash & mask
+        dist = 0
+        while True:
+            slot_hash = hashes[i]
+            if slot_hash == _EMPTY or (i - slot_hash) & mask < dist:
+                return -1
+            if slot_hash == key_hash:
+                slot_key = keys[i]
+                if slot_key is key or slot_key == key:
+                    return i
+            i = (i + 1) & mask
+            dist += 1
+
+    def load_factor(self):
+        """
+        Return the ratio of entries to slots.
+
+        Returns
+        -------
+        float
+            Number of entries divided by the number of slots.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        return self._size / self._capacity
+
+    def is_empty(self):
+        """
+        Check if the hash table is empty.
+
+        Returns
+        -------
+        bool
+            True if the hash table is empty, False otherwise.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        return self._size == 0
+
+    def insert(self, key, value):
+        """
+        Insert a key-value pair into the hash table.
+
+        Parameters
+        ----------
+        key : object
+            The key to insert.
+        value : object
+            The value to associate with the key.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(n)
+        """
+        key_hash = hash(key)
+        index = self._find(key, key_hash)
+        if index != -1:
+            self._values[index] = value
+            return
+        if self._size + 1 > self._max_load_factor * self._capacity:
+            self._resize(self._capacity * 2)
+        self._place(key_hash, key, value)
+        self._version += 1
+
+    def search(self, key):
+        """
+        Retrieve the value associated with a key.
+
+        Parameters
+        ----------
+        key : object
+            The key to search for.
+
+        Returns
+        -------
+        object or None
+            The value associated with the key, or None if not found.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        index = self._find(key, hash(key))
+        if index == -1:
+            return None
+        return self._values[index]
+
+    def delete(self, key):
+        """
+        Remove a key-value pair from the hash table.
+
+        The entries after the removed slot are shifted back until an empty
+        slot or an entry already in its home slot is reached.
+
+        Parameters
+        ----------
+        key : object
+            The key to delete.
+
+        Returns
+        -------
+        bool
+            True if the key was found and deleted, False otherwise.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        index = self._find(key, hash(key))
+        if index == -1:
+            return False
+        hashes, keys, values = self._hashes, self._keys, self._values
+        mask = self._mask
+        next_index = (index + 1) & mask
+        while True:
+            next_hash = hashes[next_index]
+            if next_hash == _EMPTY or (next_index - next_hash) & mask == 0:
+                break
+            hashes[index] = next_hash
+            keys[index] = keys[next_index]
+            values[index] = values[next_index]
+            index = next_index
+            next_index = (next_index + 1) & mask
+        hashes[index] = _EMPTY
+        keys[index] = None
+        values[index] = None
+        self._size -= 1
+        self._version += 1
+        return True
+
+    def __len__(self):
+        """Return the number of key-value pairs in the hash table."""
+        return self._size
+
+    def __contains__(self, key):
+        """Check whether a key is present, even if its value is None."""
+        return self._find(key, hash(key)) != -1
+
+    def _iter_slots(self):
+        """
+        Yield the index of every occupied slot.
+
+        Raises
+        ------
+        RuntimeError
+            If the table is modified during iteration.
+        """
+        version = self._version
+        hashes = self._hashes
+        for index in range(len(hashes)):
+            if hashes[index] != _EMPTY:
+                yield index
+                if self._version != version:
+                    raise RuntimeError("HashTable changed size during iteration")
+
+    def __iter__(self):
+        """Lazily yield every key."""
+        keys = self._keys
+        for index in self._iter_slots():
+            yield keys[index]
+
+    def keys(self):
+        """Lazily yield every key."""
+        return iter(self)
+
+    def values(self):
+        """Lazily yield every value."""
+        values = self._values
+        for index in self._iter_slots():
+            yield values[index]
+
+    def items(self):
+        """Lazily yield every (key, value) pair."""
+        keys, values = self._keys, self._values
+        for index in self._iter_slots():
+            yield keys[index], values[index]
+
+    def _probe_count(self, key):
+        """
+        Return the number of slots inspected to find key, or to conclude it
+        is missing.
+        """
+        key_hash = hash(key)
+        hashes, keys = self._hashes, self._keys
+        mask = self._mask
+        i = key_hash & mask
+        probes = 0
+        while True:
+            probes += 1
+            slot_hash = hashes[i]
+            if slot_hash == _EMPTY or (i - slot_hash) & mask < probes - 1:
+                return probes
+            if slot_hash == key_hash and keys[i] == key:
+                return probes
+            i = (i + 1) & mask
+
+    def enable_stats(self):
+        """
+        Start counting probes for insert, search and delete.
+
+        The instance gets instrumented versions of the three methods; the
+        class methods, and so every table without stats, are left unchanged.
+        """
+        _enable_stats(self)
+
+    def disable_stats(self):
+        """Stop counting probes and discard the counters."""
+        _disable_stats(self)
+
+    def stats(self):
+        """
+        Return instrumentation data about the table.
+
+        Returns
+        -------
+        dict
+            engine, size, capacity, load_factor, resizes, tombstones (always
+            0, deletion shifts entries back), probe_length_histogram
+            (distance from home slot + 1 -> number of entries) and operations
+            (operation -> count, avg_probes, max_probes; empty unless stats
+            are enabled).
+        """
+        histogram = {}
+        mask = self._mask
+        for i, slot_hash in enumerate(self._hashes):
+            if slot_hash != _EMPTY:
+                length = ((i - slot_hash) & mask) + 1
+                histogram[length] = histogram.get(length, 0) + 1
+        operations = {}
+        if self._op_stats is not None:
+            operations = {name: stats.as_dict() for name, stats in self._op_stats.items()}
+        return {
+            "engine": "open_addressing",
+            "size": self._size,
+            "capacity": self._capacity,
+            "load_factor": self.load_factor(),
+            "resizes": self._resizes,
+            "tombstones": 0,
+            "probe_length_histogram": dict(sorted(histogram.items())),
+            "operations": operations,
+        }
+
+    def stats_json(self, **kwargs):
+        """Return stats() encoded as JSON; kwargs are passed to json.dumps."""
+        return json.dumps(self.stats(), **kwargs)
+
+
+ENGINES = {
+    "chained": HashTable,
+    "open_addressing": OpenAddressingHashTable,
+}
+
+
+def create_hash_table(engine="chained", **kwargs):
+    """
+    Create a hash table using the named engine.
+
+    Parameters
+    ----------
+    engine : str, optional
+        "chained" for HashTable or "open_addressing" for
+        OpenAddressingHashTable (default is "chained").
+    **kwargs
+        Passed to the engine's constructor.
+
+    Returns
+    -------
+    HashTable or OpenAddressingHashTable
+        An empty hash table.
+
+    Raises
+    ------
+    ValueError
+        If the engine name is unknown.
+    """
+    try:
+        table_class = ENGINES[engine]
+    except KeyError:
+        raise ValueError(f"Unknown hash table engine {engine!r}") from None
+    return table_class(**kwargs)
+
+
+def benchmark_insert_latency(n=1_000_000, percentile=99):
+    """
+    Measure insert latency while a table grows from its default capacity to n keys.
+
+    Latencies are grouped per power-of-ten range of table size so that a
+    stall caused by a full rehash would show up as a jump in the reported
+    percentile. Pass n=10_000_000 for the full-size run.
+
+    Parameters
+    ----------
+    n : int, optional
+        Number of keys to insert (default is 1_000_000).
+    percentile : int, optional
+        Percentile to report for each range (default is 99).
+
+    Returns
+    -------
+    list of tuple
+        (range_end, percentile_latency_ns, max_latency_ns) for each range.
+    """
+    ht = HashTable()
+    clock = time.perf_counter_ns
+    results = []
+    start_key = 0
+    end_key = 10
+    while start_key < n:
+        end_key = min(end_key, n)
+        latencies = []
+        for key in range(start_key, end_key):
+            start = clock()
+            ht.insert(key, key)
+            latencies.append(clock() - start)
+        latencies.sort()
+        rank = min(len(latencies) - 1, len(latencies) * percentile // 100)
+        results.append((end_key, latencies[rank], latencies[-1]))
+        start_key = end_key
+        end_key *= 10
+    return results
+
+
+def benchmark_delete_latency(n=1_000_000, percentile=99, min_load_factor=0.1):
+    """
+    Measure delete latency while a shrinking table goes from n keys to none.
+
+    The table is loaded with insert_many and then emptied one key at a time
+    with min_load_factor set, so it halves repeatedly. Latencies are grouped
+    per power-of-ten range of remaining keys, as in benchmark_insert_latency.
+
+    Parameters
+    ----------
+    n : int, optional
+        Number of keys to delete (default is 1_000_000).
+    percentile : int, optional
+        Percentile to report for each range (default is 99).
+    min_load_factor : float, optional
+        Load factor below which the table shrinks (default is 0.1).
+
+    Returns
+    -------
+    list of tuple
+        (range_start, percentile_latency_ns, max_latency_ns) for each range,
+        from the largest range down.
+    """
+    ht = HashTable(min_load_factor=min_load_factor)
+    ht.insert_many(zip(range(n), range(n)))
+    clock = time.perf_counter_ns
+    results = []
+    end_key = n
+    start_key = 10 ** (len(str(n - 1)) - 1) if n > 1 else 0
+    while end_key > 0:
+        latencies = []
+        for key in range(end_key - 1, start_key - 1, -1):
+            start = clock()
+            ht.delete(key)
+            latencies.append(clock() - start)
+        latencies.sort()
+        rank = min(len(latencies) - 1, len(latencies) * percentile // 100)
+        results.append((start_key, latencies[rank], latencies[-1]))
+        end_key = start_key
+        start_key = start_key // 10 if start_key > 10 else 0
+    return results
+
+
+def benchmark_engines(n=200_000):
+    """
+    Compare the hash table engines on memory per entry and lookups per second.
+
+    Parameters
+    ----------
+    n : int, optional
+        Number of keys to load into each table (default is 200_000).
+
+    Returns
+    -------
+    dict
+        Maps engine name to (bytes_per_entry, lookups_per_second).
+    """
+    keys = [f"key-{i}" for i in range(n)]
+    results = {}
+    for engine in ENGINES:
+        tracemalloc.start()
+        table = create_hash_table(engine)
+        for key in keys:
+            table.insert(key, key)
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        search = table.search
+        start = time.perf_counter()
+        for key in keys:
+            search(key)
+        elapsed = time.perf_counter() - start
+        results[engine] = (current / n, n / elapsed)
+    return results
+
+
+def benchmark_bulk_insert(n=500_000):
+    """
+    Compare loading n customer ids with insert_many against a per-call insert loop.
+
+    Parameters
+    ----------
+    n : int, optional
+        Number of keys to load (default is 500_000).
+
+    Returns
+    -------
+    tuple
+        (loop_seconds, bulk_seconds).
+    """
+    keys = [f"CUST{i:08d}" for i in range(n)]
+    values = list(range(n))
+
+    loop_table = HashTable()
+    insert = loop_table.insert
+    start = time.perf_counter()
+    for key, value in zip(keys, values):
+        insert(key, value)
+    loop_seconds = time.perf_counter() - start
+
+    bulk_table = HashTable()
+    start = time.perf_counter()
+    bulk_table.insert_many(keys, values)
+    bulk_seconds = time.perf_counter() - start
+    return loop_seconds, bulk_seconds
+
+
+def benchmark_scan_memory(n=1_000_000):
+    """
+    Measure the extra memory used to scan every item of an n-entry table.
+
+    Parameters
+    ----------
+    n : int, optional
+        Number of entries in the scanned table (default is 1_000_000).
+
+    Returns
+    -------
+    tuple
+        (peak_bytes_during_scan, seconds).
+    """
+    table = HashTable()
+    table.insert_many(zip(range(n), range(n)))
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in table.items():
+        pass
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, elapsed
+
 
 # Example usage:
 if __name__ == "__main__":
@@ -270,4 +1617,35 @@ if __name__ == "__main__":
     print("Delete 'banana':", ht.delete("banana"))
     print("Hash table after deletion:", ht)
 
-    print("Is hash table empty?", ht.is_empty())
\ No newline at end of file
+    print("Is hash table empty?", ht.is_empty())
+
+    print("p99 insert latency while growing:")
+    for size, p99, worst in benchmark_insert_latency(100_000):
+        print(f"  up to {size:>10,} keys: p99 {p99:>6} ns, max {worst:>8} ns")
+
+    print("p99 delete latency while shrinking (min_load_factor=0.1):")
+    for size, p99, worst in benchmark_delete_latency(100_000):
+        print(f"  from {size:>10,} keys: p99 {p99:>6} ns, max {worst:>8} ns")
+
+    print("Engine comparison:")
+    for engine, (per_entry, rate) in benchmark_engines().items():
+        print(f"  {engine:>15}: {per_entry:6.1f} bytes/entry, {rate:12,.0f} lookups/s")
+
+    loop_seconds, bulk_seconds = benchmark_bulk_insert()
+    print(f"Bulk load: loop {loop_seconds:.3f} s, insert_many {bulk_seconds:.3f} s "
+          f"({loop_seconds / bulk_seconds:.1f}x faster)")
+
+    ht = HashTable()
+    ht.insert_many([("apple", 10), ("banana", 20), ("orange", 30)])
+    print("Length:", len(ht), "| 'apple' in table:", "apple" in ht)
+    print("Items:", sorted(ht.items()))
+    peak, seconds = benchmark_scan_memory()
+    print(f"Scan of 1,000,000 items: peak extra memory {peak:,} bytes in {seconds:.3f} s")
+
+    ht = HashTable()
+    ht.enable_stats()
+    for i in range(1000):
+        ht.insert(f"key-{i}", i)
+    for i in range(0, 2000, 3):
+        ht.search(f"key-{i}")
+    print("Stats:", ht.stats_json(indent=2))
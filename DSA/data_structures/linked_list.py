@@ -5,10 +5,13 @@ A linked list is a linear data structure where elements, called nodes, are store
 Each node contains a value and a reference(pointer) to the next node in the sequence.
 
 Operations: 
-1. Insert: Add a new node to the linked list.
+1. Insert: Add a new node to the end of the linked list.
+   Extend: Add every value of an iterable to the end of the linked list.
 2. Delete: Remove a node from the linked list.
 3. Search: Find a node with a specific value.
 4. Traverse: Visit each node in the linked list.
+   Iterate: Stream values front to back or back to front, or a window of them,
+   without building a list.
 6. Peek: Return the value of the first node without removing it.
 7. is_empty: Check if the linked list is empty.
 8. size: Return the number of nodes in the linked list.
@@ -17,6 +20,11 @@ Properties:
 - The linked list grows and shrinks as nodes are added or removed.
 - Each node contains a value and a reference to the next node.
 - The first node is called the head, and the last node points to null.
+- This implementation also keeps a reference to the last node (the tail), so
+  appending does not have to walk the list.
+- An optional value index (LinkedList(indexed=True)) maps each value to its
+  nodes in list order, and the nodes also link back to their predecessor, so
+  search and delete by value are average O(1). Order and duplicates are kept.
 - The linked list can be singly linked or doubly linked.
 
 Pros:
@@ -45,6 +53,14 @@ Return: return_description
 
 """
 
+import io
+import math
+import random
+import time
+import tracemalloc
+from collections import deque
+from itertools import islice
+
 
 class Node:
     """
@@ -62,10 +78,26 @@ class Node:
         next: Reference to the next node in the list.
     
     """
+    __slots__ = ("data", "next")
+
     def __init__(self, data):
         self.data = data
         self.next = None
 
+class IndexedNode(Node):
+    """
+    A node that also references its predecessor, used by indexed linked lists
+    so a node found through the index can be unlinked without a scan.
+
+    Attributes:
+        prev: Reference to the previous node in the list.
+    """
+    __slots__ = ("prev",)
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.prev = None
+
 class LinkedList:
     """
     A singly linked list implementation.
@@ -74,12 +106,16 @@ class LinkedList:
     -------
     insert(value)
         Insert a new node with the given value at the end of the linked list.
+    extend(values)
+        Insert a new node for every value at the end of the linked list.
     delete(value)
         Remove the first node with the specified value from the linked list.
     search(value)
         Search for a node with the specified value and return it.
     traverse()
         Traverse the linked list and return a list of values.
+    window(start, stop=None)
+        Lazily yield the values at positions start to stop - 1.
     peek()
         Return the value of the first node without removing it.
     is_empty()
@@ -87,17 +123,27 @@ class LinkedList:
     size()
         Return the number of nodes in the linked list.
 
+    Supports len(), iter() and reversed(); iteration streams values in O(1)
+    extra memory (O(sqrt(n)) for reversed() on an unindexed list).
+
     Parameters
     ----------
-    None
+    indexed : bool, optional
+        Keep a value index for average O(1) search and delete by value.
+        Values must then be hashable. Default is False.
 
     Attributes
     ----------
     _head: The first node in the linked list.
+    _tail: The last node in the linked list.
     count: The number of nodes in the linked list.
+    _index: dict mapping each value to a deque of its nodes in list order,
+        or None when the list is not indexed.
     """
+
+    _REPR_LIMIT = 10
     
-    def __init__(self):
+    def __init__(self, indexed=False):
         """
         Initialize an empty linked list.
         
@@ -106,7 +152,9 @@ class LinkedList:
         """
     
         self._head = None
+        self._tail = None
         self.count = 0
+        self._index = {} if indexed else None
 
     def insert(self,_value):
         """
@@ -124,8 +172,8 @@ class LinkedList:
         Time complexity
         ---------------
         Best : O(1)
-        Average : O(n)
-        Worst : O(n)
+        Average : O(1)
+        Worst : O(1)
 
         Space complexity
         ----------------
@@ -134,18 +182,75 @@ class LinkedList:
         Worst : O(1)
         """
         
-        new_node = Node(_value)
+        if self._index is not None:
+            new_node = IndexedNode(_value)
+            new_node.prev = self._tail
+            nodes = self._index.get(_value)
+            if nodes is None:
+                nodes = self._index[_value] = deque()
+            nodes.append(new_node)
+        else:
+            new_node = Node(_value)
         
         if self._head is None:
             self._head = new_node
         else:
-            current = self._head
-            while current.next is not None:
-                current = current.next
-            current.next = new_node
+            self._tail.next = new_node
+        self._tail = new_node
         
         self.count += 1
 
+    def extend(self, values):
+        """
+        Insert a new node for every value at the end of the linked list.
+
+        The new nodes are chained together first and then attached to the
+        tail in one step.
+
+        Parameters
+        ----------
+        values : iterable
+            The values to be inserted, in order.
+
+        Returns
+        -------
+        None
+
+        Time complexity
+        ---------------
+        Best : O(k)
+        Average : O(k)
+        Worst : O(k)
+
+        Space complexity
+        ----------------
+        Best : O(k)
+        Average : O(k)
+        Worst : O(k)
+        """
+        if self._index is not None:
+            for value in values:
+                self.insert(value)
+            return
+        iterator = iter(values)
+        for first_value in iterator:
+            break
+        else:
+            return
+        first = last = Node(first_value)
+        added = 1
+        for value in iterator:
+            node = Node(value)
+            last.next = node
+            last = node
+            added += 1
+        if self._head is None:
+            self._head = first
+        else:
+            self._tail.next = first
+        self._tail = last
+        self.count += added
+
     def delete(self,_value):
         """ 
         Remove the first node with the specified value from the linked list.
@@ -162,7 +267,7 @@ class LinkedList:
         Time complexity:
         ---------------
         Best: O(1)
-        Average: O(n)
+        Average: O(n), O(1) when indexed
         Worst: O(n)
         
         Space complexity:
@@ -174,20 +279,54 @@ class LinkedList:
 
         if self._head is None:
             return
+
+        if self._index is not None:
+            nodes = self._index.get(_value)
+            if not nodes:
+                raise ValueError(f"Value {_value} not found in the linked list.")
+            node = nodes.popleft()
+            if not nodes:
+                del self._index[_value]
+            self._unlink(node)
+            return
         
         if self._head.data == _value:
             self._head = self._head.next
+            if self._head is None:
+                self._tail = None
             self.count -= 1
             return
         
         current = self._head
         while current.next is not None:
             if current.next.data == _value:
+                if current.next is self._tail:
+                    self._tail = current
                 current.next = current.next.next
                 self.count -= 1
                 return
             current = current.next
         raise ValueError(f"Value {_value} not found in the linked list.")
+
+    def _unlink(self, node):
+        """
+        Remove an IndexedNode using its prev reference.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        prev_node = node.prev
+        next_node = node.next
+        if prev_node is None:
+            self._head = next_node
+        else:
+            prev_node.next = next_node
+        if next_node is None:
+            self._tail = prev_node
+        else:
+            next_node.prev = prev_node
+        node.prev = node.next = None
+        self.count -= 1
     
 
     def search(self,_value):
@@ -207,7 +346,7 @@ class LinkedList:
         Time complexity
         ---------------
         Best : O(1)
-        Average : O(n)
+        Average : O(n), O(1) when indexed
         Worst : O(n)
 
         Space complexity
@@ -217,6 +356,9 @@ class LinkedList:
         Worst : O(1)
 
         """
+        if self._index is not None:
+            nodes = self._index.get(_value)
+            return nodes[0] if nodes else None
         current = self._head
         while current is not None:
             if current.data == _value:
@@ -245,13 +387,108 @@ class LinkedList:
         Average : O(n)
         Worst : O(n)
         """
-        
-        values = []
+        return list(self)
+
+    def __len__(self):
+        """Return the number of nodes in the linked list."""
+        return self.count
+
+    def __iter__(self):
+        """
+        Lazily yield the values from head to tail.
+
+        Time complexity
+        ---------------
+        Best : O(n)
+        Average : O(n)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        current = self._head
+        while current is not None:
+            yield current.data
+            current = current.next
+
+    def __reversed__(self):
+        """
+        Lazily yield the values from tail to head.
+
+        Indexed lists follow the prev references. Unindexed lists remember
+        every k-th node on one forward pass (k about sqrt(n)), then replay
+        the segments from last to first, buffering one segment at a time.
+
+        Time complexity
+        ---------------
+        Best : O(n)
+        Average : O(n)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(sqrt(n))
+        Worst : O(sqrt(n))
+        """
+        if self._index is not None:
+            current = self._tail
+            while current is not None:
+                yield current.data
+                current = current.prev
+            return
+        step = max(1, math.isqrt(self.count))
+        checkpoints = []
         current = self._head
+        position = 0
         while current is not None:
-            values.append(current.data)
+            if position % step == 0:
+                checkpoints.append(current)
             current = current.next
-        return values
+            position += 1
+        for checkpoint in reversed(checkpoints):
+            segment = []
+            current = checkpoint
+            for _ in range(step):
+                if current is None:
+                    break
+                segment.append(current.data)
+                current = current.next
+            yield from reversed(segment)
+
+    def window(self, start, stop=None):
+        """
+        Lazily yield the values at positions start to stop - 1, like
+        itertools.islice over the list.
+
+        Parameters
+        ----------
+        start : int
+            Position of the first value to yield.
+        stop : int or None, optional
+            Position after the last value to yield. Default is the end.
+
+        Returns
+        -------
+        iterator
+            The values in the window.
+
+        Time complexity
+        ---------------
+        Best : O(stop)
+        Average : O(stop)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        return islice(self, start, stop)
             
     def peek(self):
         """
@@ -351,17 +588,21 @@ class LinkedList:
         Worst : O(n)
         
         """
-        values = []
-        current = self._head
-        while current:
-         values.append(str(current.data))
-         current = current.next
-        return " -> ".join(values) + " -> None"
+        out = io.StringIO()
+        for value in self:
+            out.write(str(value))
+            out.write(" -> ")
+        if not self._head:
+            out.write(" -> ")
+        out.write("None")
+        return out.getvalue()
     
     def __repr__(self):
         """
         Return a string representation of the linked list for debugging.
 
+        Only the first _REPR_LIMIT values are shown; the rest are counted.
+
         Returns
         -------
         str
@@ -370,19 +611,119 @@ class LinkedList:
         Time complexity
         ---------------
         Best : O(1)
-        Average : O(n)
-        Worst : O(n)
+        Average : O(1)
+        Worst : O(1)
 
         Space complexity
         ----------------
         Best : O(1)
-        Average : O(n)
-        Worst : O(n)
+        Average : O(1)
+        Worst : O(1)
         
         """
-        values = self.traverse()
-        return f"LinkedList({values})"
+        shown = ", ".join(repr(value) for value in self.window(0, self._REPR_LIMIT))
+        hidden = self.count - self._REPR_LIMIT
+        if hidden > 0:
+            shown += f", ... {hidden} more"
+        return f"LinkedList([{shown}])"
     
+def benchmark_build(max_n=1_000_000):
+    """
+    Time building lists of increasing size with insert and with extend.
+
+    With the tail pointer both grow linearly, so the time per node should stay
+    flat as n grows. Pass max_n=10_000_000 for the full-size run.
+
+    Parameters
+    ----------
+    max_n : int, optional
+        Largest list size to build (default is 1_000_000).
+
+    Returns
+    -------
+    list of tuple
+        (n, insert_seconds, extend_seconds) for n = 1_000, 10_000, ... max_n.
+    """
+    results = []
+    n = 1_000
+    while n <= max_n:
+        linked_list = LinkedList()
+        start = time.perf_counter()
+        for value in range(n):
+            linked_list.insert(value)
+        insert_seconds = time.perf_counter() - start
+
+        linked_list = LinkedList()
+        start = time.perf_counter()
+        linked_list.extend(range(n))
+        extend_seconds = time.perf_counter() - start
+        results.append((n, insert_seconds, extend_seconds))
+        n *= 10
+    return results
+
+def benchmark_delete_heavy(n=20_000, deletes=5_000, seed=0):
+    """
+    Compare indexed and unindexed lists on a delete-heavy workload.
+
+    Both lists are filled with n session ids; then random ids are deleted
+    and re-appended, as when sessions are refreshed.
+
+    Parameters
+    ----------
+    n : int, optional
+        Number of session ids in the list (default is 20_000).
+    deletes : int, optional
+        Number of delete-and-reinsert rounds (default is 5_000).
+    seed : int, optional
+        Random seed for the workload (default is 0).
+
+    Returns
+    -------
+    dict
+        Seconds taken by the "unindexed" and "indexed" lists.
+    """
+    sessions = [f"session-{i}" for i in range(n)]
+    rng = random.Random(seed)
+    workload = [rng.choice(sessions) for _ in range(deletes)]
+    results = {}
+    for name, indexed in (("unindexed", False), ("indexed", True)):
+        linked_list = LinkedList(indexed=indexed)
+        linked_list.extend(sessions)
+        start = time.perf_counter()
+        for session in workload:
+            linked_list.delete(session)
+            linked_list.insert(session)
+        results[name] = time.perf_counter() - start
+    return results
+
+def benchmark_scan_memory(n=1_000_000):
+    """
+    Compare the peak extra memory of scanning the list with traverse() and
+    with lazy iteration.
+
+    Parameters
+    ----------
+    n : int, optional
+        Number of values in the list (default is 1_000_000).
+
+    Returns
+    -------
+    dict
+        Peak traced bytes for "traverse", "iter" and "reversed" scans.
+    """
+    linked_list = LinkedList()
+    linked_list.extend(range(n))
+    results = {}
+    for name, scan in (("traverse", lambda: sum(linked_list.traverse())),
+                       ("iter", lambda: sum(linked_list)),
+                       ("reversed", lambda: sum(reversed(linked_list)))):
+        tracemalloc.start()
+        scan()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[name] = peak
+    return results
+
 #Example usage:
 if __name__ == "__main__":
     l = LinkedList()
@@ -401,6 +742,24 @@ if __name__ == "__main__":
     print("Size of list:", l.size()) 
     print("Is list empty?", l.is_empty())
     print("All values:", l.traverse())
-
-
-
+    l.extend([55, 66])
+    print("After extend:", l)
+
+    for n, insert_seconds, extend_seconds in benchmark_build():
+        print(f"Build {n:>10,} nodes: insert {insert_seconds / n * 1e9:6.0f} ns/node, "
+              f"extend {extend_seconds / n * 1e9:6.0f} ns/node")
+
+    indexed = LinkedList(indexed=True)
+    indexed.extend(["s1", "s2", "s1", "s3"])
+    indexed.delete("s1")
+    print("Indexed list after deleting 's1':", indexed)
+    print("Search 's1' in indexed list:", indexed.search("s1") is not None)
+    for name, seconds in benchmark_delete_heavy().items():
+        print(f"Delete-heavy workload, {name}: {seconds:.3f} s")
+
+    print("Reversed:", list(reversed(l)))
+    print("Window 1-3:", list(l.window(1, 3)))
+    l.extend(range(100))
+    print("Truncated repr:", repr(l))
+    for name, peak in benchmark_scan_memory().items():
+        print(f"Scan of 1,000,000 values with {name}: peak {peak:,} bytes")
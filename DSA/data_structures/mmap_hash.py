@@ -0,0 +1,518 @@
+"""
+MEMORY-MAPPED HASH TABLE DATA STRUCTURE
+.......................................
+A memory-mapped hash table keeps its buckets and entries in a file that is mapped
+into memory, so the table survives process restarts and can be opened again
+without rebuilding it.
+
+This implementation uses separate chaining like HashTable, but the chains are
+made of byte offsets into the file instead of HashNode objects.
+
+File layout (little-endian):
+1. Header: magic (8 bytes), bucket count, entry count and end of data (u64 each).
+2. Bucket array: one u64 offset per bucket pointing at the head entry, 0 if empty.
+3. Entries, appended one after another: next offset (u64), key length (u32),
+   value length (u32), key bytes, value bytes.
+
+Keys and values are either ints, stored as fixed-width signed 64-bit integers, or
+bytes, stored length-prefixed. A one-byte tag in front of each distinguishes them.
+
+Operations:
+1. Insert: Add a key-value pair to the hash table.
+2. Search: Retrieve the value associated with a given key.
+3. Delete: Remove a key-value pair from the hash table.
+4. Check if empty: Determine if the hash table has no entries.
+
+Properties:
+- Opening an existing file only reads the header, so it is O(1) regardless of size.
+- Searches read straight from the mapped pages; several processes opening the
+  same file read-only share one copy in the operating system's page cache.
+- Buckets are chosen with zlib.crc32, which, unlike hash(), gives the same
+  result in every process.
+- The bucket count is fixed when the file is created. Use build() to size it
+  for a known number of entries.
+
+Pros:
+- Near-instant startup for large, mostly read-only indexes.
+- Memory is shared between processes instead of copied into each heap.
+
+Cons:
+- Only int and bytes keys and values are supported.
+- Deleted or overwritten entries leave dead space in the file until it is rebuilt.
+- Only one process may write at a time, and readers must reopen the file to see
+  a writer's changes.
+
+When to use a memory-mapped hash table:
+- When a large lookup table is rebuilt at every process start.
+- When many processes need the same read-only index.
+
+When not to use a memory-mapped hash table:
+- When keys or values are arbitrary Python objects.
+- When the table is small and short-lived; HashTable is simpler and faster.
+
+Keyword arguments:
+argument -- description
+Return: return_description
+"""
+
+import gc
+import mmap
+import os
+import struct
+import tempfile
+import time
+import zlib
+
+from hash import HashTable
+
+_MAGIC = b"GRITHASH"
+_HEADER = struct.Struct("<8sQQQ")
+_OFFSET = struct.Struct("<Q")
+_ENTRY = struct.Struct("<QII")
+_INT = struct.Struct("<q")
+_INT_TAG = b"\x00"
+_BYTES_TAG = b"\x01"
+
+
+def _encode(obj):
+    """
+    Encode an int or bytes object as tagged bytes.
+
+    Raises
+    ------
+    TypeError
+        If obj is neither an int nor a bytes-like object.
+    """
+    if isinstance(obj, int) and not isinstance(obj, bool):
+        return _INT_TAG + _INT.pack(obj)
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return _BYTES_TAG + bytes(obj)
+    raise TypeError(f"MappedHashTable only stores int or bytes, not {type(obj).__name__}")
+
+
+def _decode(data):
+    """Decode tagged bytes produced by _encode."""
+    if data[:1] == _INT_TAG:
+        return _INT.unpack_from(data, 1)[0]
+    return bytes(data[1:])
+
+
+class MappedHashTable:
+    """
+    Hash table stored in a memory-mapped file, using separate chaining.
+
+    Methods
+    -------
+    create(path, buckets=1024)
+        Create a new, empty table file and open it for writing.
+    build(path, items, buckets=None)
+        Create a table file from (key, value) pairs.
+    insert(key, value)
+        Insert a key-value pair into the hash table.
+    search(key)
+        Retrieve the value associated with a key.
+    delete(key)
+        Remove a key-value pair from the hash table.
+    is_empty()
+        Check if the hash table is empty.
+    flush()
+        Write the mapped pages back to the file.
+    close()
+        Flush (when writable) and unmap the file.
+
+    Parameters
+    ----------
+    path : str
+        Path of an existing table file.
+    readonly : bool, optional
+        Map the file read-only so it can be shared between processes
+        (default is True).
+
+    Attributes
+    ----------
+    _file : file object
+        The open table file.
+    _map : mmap.mmap
+        The mapping of the whole file.
+    _bucket_count : int
+        Number of buckets, fixed when the file was created.
+    _size : int
+        Number of key-value pairs in the hash table.
+    _end : int
+        Offset at which the next entry will be appended.
+    """
+
+    def __init__(self, path, readonly=True):
+        """Open an existing table file.
+
+        Raises ValueError if the file is not a table file; the file is
+        closed again on any error.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        self._readonly = readonly
+        self._file = open(path, "rb" if readonly else "r+b")
+        self._map = None
+        try:
+            if os.fstat(self._file.fileno()).st_size < _HEADER.size:
+                raise ValueError(f"{path} is not a MappedHashTable file")
+            access = mmap.ACCESS_READ if readonly else mmap.ACCESS_WRITE
+            self._map = mmap.mmap(self._file.fileno(), 0, access=access)
+            magic, self._bucket_count, self._size, self._end = _HEADER.unpack_from(self._map, 0)
+            if magic != _MAGIC:
+                raise ValueError(f"{path} is not a MappedHashTable file")
+        except Exception:
+            if self._map is not None:
+                self._map.close()
+            self._file.close()
+            raise
+
+    @classmethod
+    def create(cls, path, buckets=1024):
+        """
+        Create a new, empty table file and open it for writing.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file to create. An existing file is overwritten.
+        buckets : int, optional
+            Number of buckets (default is 1024).
+
+        Returns
+        -------
+        MappedHashTable
+            The new table, opened writable.
+        """
+        if buckets < 1:
+            raise ValueError("buckets must be at least 1")
+        data_start = _HEADER.size + buckets * _OFFSET.size
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, buckets, 0, data_start))
+            f.truncate(max(data_start * 2, mmap.PAGESIZE))
+        return cls(path, readonly=False)
+
+    @classmethod
+    def build(cls, path, items, buckets=None):
+        """
+        Create a table file from (key, value) pairs.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file to create. An existing file is overwritten.
+        items : iterable
+            (key, value) pairs with int or bytes keys and values.
+        buckets : int, optional
+            Number of buckets. Defaults to the number of items divided by a
+            load factor of 0.75.
+
+        Returns
+        -------
+        MappedHashTable
+            The new table, opened writable.
+        """
+        if buckets is None:
+            items = items if hasattr(items, "__len__") else list(items)
+            buckets = max(1, int(len(items) / 0.75))
+        table = cls.create(path, buckets)
+        insert = table.insert
+        for key, value in items:
+            insert(key, value)
+        return table
+
+    def _bucket_offset(self, encoded_key):
+        """Return the file offset of the bucket slot for an encoded key."""
+        return _HEADER.size + (zlib.crc32(encoded_key) % self._bucket_count) * _OFFSET.size
+
+    def _find(self, encoded_key):
+        """
+        Walk the key's chain.
+
+        Returns
+        -------
+        tuple
+            (offset of the pointer to the entry, entry offset), with an entry
+            offset of 0 if the key is not found.
+        """
+        mm = self._map
+        link = self._bucket_offset(encoded_key)
+        entry = _OFFSET.unpack_from(mm, link)[0]
+        key_len = len(encoded_key)
+        while entry:
+            next_entry, entry_key_len, _ = _ENTRY.unpack_from(mm, entry)
+            if entry_key_len == key_len:
+                start = entry + _ENTRY.size
+                if mm[start:start + key_len] == encoded_key:
+                    return link, entry
+            link = entry
+            entry = next_entry
+        return link, 0
+
+    def _check_writable(self):
+        if self._readonly:
+            raise PermissionError("MappedHashTable was opened read-only")
+
+    def _write_header(self):
+        _HEADER.pack_into(self._map, 0, _MAGIC, self._bucket_count, self._size, self._end)
+
+    def _reserve(self, nbytes):
+        """Grow the file (doubling) so nbytes more can be appended."""
+        needed = self._end + nbytes
+        length = len(self._map)
+        if needed <= length:
+            return
+        while length < needed:
+            length *= 2
+        self._map.flush()
+        self._map.close()
+        self._file.truncate(length)
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_WRITE)
+
+    def __len__(self):
+        """Return the number of key-value pairs in the hash table."""
+        return self._size
+
+    def __contains__(self, key):
+        """Check whether a key is present."""
+        return self._find(_encode(key))[1] != 0
+
+    def is_empty(self):
+        """
+        Check if the hash table is empty.
+
+        Returns
+        -------
+        bool
+            True if the hash table is empty, False otherwise.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        return self._size == 0
+
+    def search(self, key):
+        """
+        Retrieve the value associated with a key.
+
+        Parameters
+        ----------
+        key : int or bytes
+            The key to search for.
+
+        Returns
+        -------
+        int, bytes or None
+            The value associated with the key, or None if not found.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        _, entry = self._find(_encode(key))
+        if not entry:
+            return None
+        mm = self._map
+        _, key_len, value_len = _ENTRY.unpack_from(mm, entry)
+        start = entry + _ENTRY.size + key_len
+        return _decode(mm[start:start + value_len])
+
+    def insert(self, key, value):
+        """
+        Insert a key-value pair into the hash table.
+
+        A value of the same encoded length overwrites the old one in place;
+        otherwise a new entry replaces the old one in its chain.
+
+        Parameters
+        ----------
+        key : int or bytes
+            The key to insert.
+        value : int or bytes
+            The value to associate with the key.
+
+        Raises
+        ------
+        PermissionError
+            If the table was opened read-only.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        self._check_writable()
+        encoded_key = _encode(key)
+        encoded_value = _encode(value)
+        link, entry = self._find(encoded_key)
+        if entry:
+            next_entry, key_len, value_len = _ENTRY.unpack_from(self._map, entry)
+            if value_len == len(encoded_value):
+                start = entry + _ENTRY.size + key_len
+                self._map[start:start + value_len] = encoded_value
+                return
+            self._reserve(_ENTRY.size + len(encoded_key) + len(encoded_value))
+            _OFFSET.pack_into(self._map, link, next_entry)
+            self._size -= 1
+        link = self._bucket_offset(encoded_key)
+        self._reserve(_ENTRY.size + len(encoded_key) + len(encoded_value))
+        mm = self._map
+        new_entry = self._end
+        head = _OFFSET.unpack_from(mm, link)[0]
+        _ENTRY.pack_into(mm, new_entry, head, len(encoded_key), len(encoded_value))
+        start = new_entry + _ENTRY.size
+        mm[start:start + len(encoded_key)] = encoded_key
+        start += len(encoded_key)
+        mm[start:start + len(encoded_value)] = encoded_value
+        _OFFSET.pack_into(mm, link, new_entry)
+        self._end = start + len(encoded_value)
+        self._size += 1
+        self._write_header()
+
+    def delete(self, key):
+        """
+        Remove a key-value pair from the hash table.
+
+        Parameters
+        ----------
+        key : int or bytes
+            The key to delete.
+
+        Returns
+        -------
+        bool
+            True if the key was found and deleted, False otherwise.
+
+        Raises
+        ------
+        PermissionError
+            If the table was opened read-only.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        self._check_writable()
+        link, entry = self._find(_encode(key))
+        if not entry:
+            return False
+        next_entry = _ENTRY.unpack_from(self._map, entry)[0]
+        _OFFSET.pack_into(self._map, link, next_entry)
+        self._size -= 1
+        self._write_header()
+        return True
+
+    def flush(self):
+        """Write the mapped pages back to the file."""
+        if not self._readonly:
+            self._map.flush()
+
+    def close(self):
+        """Flush (when writable) and unmap the file."""
+        if self._map.closed:
+            return
+        self.flush()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        """Return the table, so it can be used in a with statement."""
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        """Close the table when the with statement ends."""
+        self.close()
+
+
+def benchmark_startup(n=500_000):
+    """
+    Compare rebuilding a HashTable with reopening a MappedHashTable.
+
+    Parameters
+    ----------
+    n : int, optional
+        Number of integer key-value pairs (default is 500_000).
+
+    Returns
+    -------
+    dict
+        Seconds for "rebuild HashTable", "reopen MappedHashTable" and for
+        n searches on each table.
+    """
+    pairs = [(i * 7919, i) for i in range(n)]
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "index.ght")
+        MappedHashTable.build(path, pairs).close()
+
+        start = time.perf_counter()
+        table = HashTable()
+        table.insert_many(pairs)
+        results["rebuild HashTable"] = time.perf_counter() - start
+
+        gc.collect()
+        start = time.perf_counter()
+        mapped = MappedHashTable(path)
+        results["reopen MappedHashTable"] = time.perf_counter() - start
+
+        for name, search in (("search HashTable", table.search), ("search MappedHashTable", mapped.search)):
+            start = time.perf_counter()
+            for key, _ in pairs:
+                search(key)
+            results[name] = time.perf_counter() - start
+        mapped.close()
+    return results
+
+
+# Example usage:
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "example.ght")
+        with MappedHashTable.create(path, buckets=16) as ht:
+            ht.insert(b"apple", 10)
+            ht.insert(b"banana", b"yellow")
+            ht.insert(42, 4200)
+            print("Delete 'apple':", ht.delete(b"apple"))
+
+        with MappedHashTable(path) as ht:
+            print("Reopened size:", len(ht))
+            print("Search 'banana':", ht.search(b"banana"))
+            print("Search 42:", ht.search(42))
+            print("Search 'apple':", ht.search(b"apple"))
+            print("Is hash table empty?", ht.is_empty())
+
+    for name, seconds in benchmark_startup().items():
+        print(f"{name:>24}: {seconds:.4f} s")
@@ -0,0 +1,114 @@
+"""
+NODE MEMORY BENCHMARK
+.....................
+Measures the bytes used per element by the linked structures in this package,
+and compares their slotted node classes with equivalent dict-based nodes.
+
+Every node class (HashNode, TreeNode, linked_list.Node and the Node classes of
+queue_using_linkedlist and stack_using_linkedlist) declares __slots__, so its
+instances store their fields in fixed slots instead of a per-instance __dict__.
+For each of them the benchmark defines two local classes with the same __init__,
+one with the same __slots__ and one without, and measures a node of each. The
+modules themselves are not changed; the structures are measured as shipped.
+
+Memory is measured with tracemalloc while the nodes or the structure are built,
+so only the allocations made for them are counted.
+"""
+
+import os
+import runpy
+import tracemalloc
+
+import hash as hash_module
+import linked_list
+import tree
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+# Run the queue and stack modules from their paths rather than adding their
+# directories to sys.path, where queue/queue.py would shadow the standard library.
+queue_using_linkedlist = runpy.run_path(os.path.join(_HERE, "queue", "queue_using_linkedlist.py"))
+stack_using_linkedlist = runpy.run_path(os.path.join(_HERE, "stack", "stack_using_linkedlist.py"))
+
+STRUCTURES = [
+    ("HashTable", hash_module.HashNode, hash_module.HashTable, "insert", 2),
+    ("BinaryTree", tree.TreeNode, tree.BinaryTree, "insert", 1),
+    ("LinkedList", linked_list.Node, linked_list.LinkedList, "insert", 1),
+    ("Queue (linked list)", queue_using_linkedlist["Node"],
+     queue_using_linkedlist["Queue"], "enqueue", 1),
+    ("Stack (linked list)", stack_using_linkedlist["Node"],
+     stack_using_linkedlist["Stack"], "push", 1),
+]
+
+
+def _node_classes(node_class):
+    """Return local dict-based and slotted copies of node_class."""
+    name = node_class.__name__
+    with_dict = type(name, (), {"__init__": node_class.__init__})
+    with_slots = type(name, (), {"__init__": node_class.__init__,
+                                 "__slots__": node_class.__slots__})
+    return with_dict, with_slots
+
+
+def _bytes_per_node(node_class, arg_count, values):
+    """Create a node for every value and return the traced bytes per node."""
+    nodes = [None] * len(values)
+    tracemalloc.start()
+    if arg_count == 2:
+        for i, value in enumerate(values):
+            nodes[i] = node_class(value, value)
+    else:
+        for i, value in enumerate(values):
+            nodes[i] = node_class(value)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / len(values)
+
+
+def _bytes_per_element(factory, method_name, arg_count, values):
+    """Build a structure from values and return the traced bytes per element."""
+    tracemalloc.start()
+    structure = factory()
+    add = getattr(structure, method_name)
+    if arg_count == 2:
+        for value in values:
+            add(value, value)
+    else:
+        for value in values:
+            add(value)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / len(values)
+
+
+def benchmark_node_memory(n=5_000):
+    """
+    Measure bytes per node for dict-based and slotted copies of every node
+    class, and bytes per element for every linked structure.
+
+    Parameters
+    ----------
+    n : int, optional
+        Number of nodes created and elements added to each structure
+        (default is 5_000).
+
+    Returns
+    -------
+    list of tuple
+        (structure_name, dict_bytes_per_node, slots_bytes_per_node,
+        structure_bytes_per_element).
+    """
+    values = list(range(1_000_000, 1_000_000 + n))
+    results = []
+    for name, node_class, factory, method_name, arg_count in STRUCTURES:
+        with_dict, with_slots = _node_classes(node_class)
+        results.append((name,
+                        _bytes_per_node(with_dict, arg_count, values),
+                        _bytes_per_node(with_slots, arg_count, values),
+                        _bytes_per_element(factory, method_name, arg_count, values)))
+    return results
+
+
+if __name__ == "__main__":
+    print(f"{'structure':>20} {'__dict__':>10} {'__slots__':>10} {'structure':>10}  (bytes)")
+    for name, with_dict, with_slots, structure in benchmark_node_memory():
+        print(f"{name:>20} {with_dict:10.1f} {with_slots:10.1f} {structure:10.1f}")
@@ -0,0 +1,567 @@
+"""
+PRIORITY QUEUE DATA STRUCTURE
+.............................
+A priority queue hands out its elements in priority order instead of insertion
+order: pop always returns the element with the smallest priority.
+
+This implementation is an indexed binary min-heap. Besides the heap array it keeps
+a dict from each item to its heap entry, and every entry records its current
+position in the array, so an item's priority can be changed, or the item removed,
+in O(log n) without searching the heap.
+
+The sift-up, sift-down and heapify functions in this module work on any list
+and any ordering, and are shared with HeapSort in algorithms/sort/heap_sort.py.
+
+Operations:
+1. Push: Add an item with a priority.
+2. Pop: Remove and return the item with the smallest priority.
+3. Peek: Return the item with the smallest priority without removing it.
+4. Update: Change the priority of an item (decrease_key only allows lowering it).
+5. Remove: Delete an item from anywhere in the heap.
+6. Heapify: Build the queue from a list of (item, priority) pairs in O(n).
+
+Properties:
+- Items must be hashable and unique; priorities must be comparable with <.
+- Items with equal priorities come out in the order they were pushed.
+- Updates and removals move entries in place, so the heap never holds stale
+  entries and its length is always the number of items.
+
+Pros:
+- O(log n) push, pop, update and remove; O(1) peek and membership.
+- O(n) construction from a bulk list.
+
+Cons:
+- Extra memory for the position index and per-entry lists.
+- Slower than heapq for plain push/pop without updates.
+
+When to use a priority queue:
+- When elements must be processed by priority, such as in a scheduler or
+  Dijkstra's algorithm, and priorities change while they wait.
+
+When not to use a priority queue:
+- When elements must be processed in arrival order; use Queue.
+- When priorities never change; heapq on a list is simpler and faster.
+
+Keyword arguments:
+argument -- description
+Return: return_description
+"""
+
+import heapq
+import itertools
+import operator
+import random
+import time
+
+_PRIORITY = 0
+_ITEM = 2
+_POSITION = 3
+
+
+def sift_up(heap, i, before, moved=None):
+    """
+    Move heap[i] up until its parent comes before it.
+
+    Parameters
+    ----------
+    heap : list
+        A binary heap stored in a list, where the children of i are 2i+1 and 2i+2.
+    i : int
+        Index of the element to move.
+    before : callable
+        before(a, b) is true when a belongs above b (operator.lt for a min-heap).
+    moved : callable, optional
+        Called as moved(element, index) for every element given a new index.
+
+    Returns
+    -------
+    int
+        The final index of the element.
+
+    Time complexity
+    ---------------
+    Best : O(1)
+    Average : O(1)
+    Worst : O(log n)
+
+    Space complexity
+    ----------------
+    Best : O(1)
+    Average : O(1)
+    Worst : O(1)
+    """
+    element = heap[i]
+    while i > 0:
+        parent = (i - 1) >> 1
+        if not before(element, heap[parent]):
+            break
+        heap[i] = heap[parent]
+        if moved is not None:
+            moved(heap[i], i)
+        i = parent
+    heap[i] = element
+    if moved is not None:
+        moved(element, i)
+    return i
+
+
+def sift_down(heap, n, i, before, moved=None):
+    """
+    Move heap[i] down until it comes before both of its children.
+
+    Only the first n elements of heap are treated as part of the heap.
+
+    Parameters
+    ----------
+    heap : list
+        A binary heap stored in a list.
+    n : int
+        Size of the heap.
+    i : int
+        Index of the element to move.
+    before : callable
+        before(a, b) is true when a belongs above b.
+    moved : callable, optional
+        Called as moved(element, index) for every element given a new index.
+
+    Returns
+    -------
+    int
+        The final index of the element.
+
+    Time complexity
+    ---------------
+    Best : O(1)
+    Average : O(log n)
+    Worst : O(log n)
+
+    Space complexity
+    ----------------
+    Best : O(1)
+    Average : O(1)
+    Worst : O(1)
+    """
+    element = heap[i]
+    while True:
+        child = 2 * i + 1
+        if child >= n:
+            break
+        right = child + 1
+        if right < n and before(heap[right], heap[child]):
+            child = right
+        if not before(heap[child], element):
+            break
+        heap[i] = heap[child]
+        if moved is not None:
+            moved(heap[i], i)
+        i = child
+    heap[i] = element
+    if moved is not None:
+        moved(element, i)
+    return i
+
+
+def heapify(heap, before, moved=None):
+    """
+    Rearrange a list into a binary heap by sifting down every parent, last first.
+
+    Parameters
+    ----------
+    heap : list
+        The list to rearrange in place.
+    before : callable
+        before(a, b) is true when a belongs above b.
+    moved : callable, optional
+        Called as moved(element, index) for every element given a new index.
+
+    Time complexity
+    ---------------
+    Best : O(n)
+    Average : O(n)
+    Worst : O(n)
+
+    Space complexity
+    ----------------
+    Best : O(1)
+    Average : O(1)
+    Worst : O(1)
+    """
+    n = len(heap)
+    for i in range(n // 2 - 1, -1, -1):
+        sift_down(heap, n, i, before, moved)
+
+
+def _set_position(entry, index):
+    """Record the heap index of an entry."""
+    entry[_POSITION] = index
+
+
+class PriorityQueue:
+    """
+    An indexed binary min-heap priority queue.
+
+    Methods
+    -------
+    push(item, priority)
+        Add an item with the given priority.
+    pop()
+        Remove and return the (item, priority) pair with the smallest priority.
+    peek()
+        Return the (item, priority) pair with the smallest priority.
+    update(item, priority)
+        Change the priority of an item.
+    decrease_key(item, priority)
+        Lower the priority of an item.
+    remove(item)
+        Remove an item and return its priority.
+    priority(item)
+        Return the priority of an item.
+    is_empty()
+        Check if the queue is empty.
+    size()
+        Return the number of items in the queue.
+
+    Parameters
+    ----------
+    items : iterable of (item, priority), optional
+        Initial items, heapified in O(n).
+
+    Attributes
+    ----------
+    _heap : list
+        Entries [priority, sequence, item, position] in heap order. The
+        sequence number breaks ties in push order.
+    _entries : dict
+        Maps each item to its entry.
+    _counter : itertools.count
+        Source of sequence numbers.
+    """
+
+    def __init__(self, items=None):
+        """
+        Initialize the queue, heapifying the initial items.
+
+        Raises
+        ------
+        ValueError
+            If an item appears more than once.
+
+        Time complexity: O(n)
+        Space complexity: O(n)
+        """
+        self._counter = itertools.count()
+        self._heap = []
+        self._entries = {}
+        if items is not None:
+            for item, priority in items:
+                if item in self._entries:
+                    raise ValueError(f"Item {item!r} is already in the priority queue.")
+                entry = [priority, next(self._counter), item, len(self._heap)]
+                self._heap.append(entry)
+                self._entries[item] = entry
+            heapify(self._heap, operator.lt, _set_position)
+
+    def __len__(self):
+        """Return the number of queued items."""
+        return len(self._heap)
+
+    def __contains__(self, item):
+        """Check if an item is queued."""
+        return item in self._entries
+
+    def is_empty(self):
+        """
+        Check if the queue is empty.
+
+        Returns
+        -------
+        bool
+            True if the queue is empty, False otherwise.
+        """
+        return not self._heap
+
+    def size(self):
+        """
+        Return the number of items in the queue.
+
+        Returns
+        -------
+        int
+            The number of items in the queue.
+        """
+        return len(self._heap)
+
+    def push(self, item, priority):
+        """
+        Add an item with the given priority.
+
+        Parameters
+        ----------
+        item : hashable
+            The item to add.
+        priority : object
+            Its priority; smaller priorities are popped first.
+
+        Raises
+        ------
+        ValueError
+            If the item is already in the queue; use update() instead.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(log n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        if item in self._entries:
+            raise ValueError(f"Item {item!r} is already in the priority queue.")
+        entry = [priority, next(self._counter), item, len(self._heap)]
+        self._heap.append(entry)
+        self._entries[item] = entry
+        sift_up(self._heap, entry[_POSITION], operator.lt, _set_position)
+
+    def peek(self):
+        """
+        Return the (item, priority) pair with the smallest priority.
+
+        Raises
+        ------
+        IndexError
+            If the queue is empty.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        if not self._heap:
+            raise IndexError("peek from empty priority queue")
+        entry = self._heap[0]
+        return entry[_ITEM], entry[_PRIORITY]
+
+    def _remove_at(self, index):
+        """Remove and return the entry at index, filling the hole with the last entry."""
+        heap = self._heap
+        entry = heap[index]
+        last = heap.pop()
+        if index < len(heap):
+            heap[index] = last
+            last[_POSITION] = index
+            self._restore(index)
+        del self._entries[entry[_ITEM]]
+        return entry
+
+    def _restore(self, index):
+        """Sift the entry at index up or down into place."""
+        if sift_up(self._heap, index, operator.lt, _set_position) == index:
+            sift_down(self._heap, len(self._heap), index, operator.lt, _set_position)
+
+    def pop(self):
+        """
+        Remove and return the (item, priority) pair with the smallest priority.
+
+        Raises
+        ------
+        IndexError
+            If the queue is empty.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(log n)
+        Worst : O(log n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        if not self._heap:
+            raise IndexError("pop from empty priority queue")
+        entry = self._remove_at(0)
+        return entry[_ITEM], entry[_PRIORITY]
+
+    def _entry(self, item):
+        """Return the entry of item, raising ValueError if it is not queued."""
+        try:
+            return self._entries[item]
+        except KeyError:
+            raise ValueError(f"Item {item!r} not found in the priority queue.") from None
+
+    def priority(self, item):
+        """
+        Return the priority of an item.
+
+        Raises
+        ------
+        ValueError
+            If the item is not in the queue.
+        """
+        return self._entry(item)[_PRIORITY]
+
+    def update(self, item, priority):
+        """
+        Change the priority of an item, moving it up or down the heap.
+
+        Parameters
+        ----------
+        item : hashable
+            An item in the queue.
+        priority : object
+            Its new priority.
+
+        Raises
+        ------
+        ValueError
+            If the item is not in the queue.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(log n)
+        Worst : O(log n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        entry = self._entry(item)
+        entry[_PRIORITY] = priority
+        self._restore(entry[_POSITION])
+
+    def decrease_key(self, item, priority):
+        """
+        Lower the priority of an item.
+
+        Raises
+        ------
+        ValueError
+            If the item is not in the queue, or priority is greater than its
+            current priority.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(log n)
+        Worst : O(log n)
+        """
+        entry = self._entry(item)
+        if entry[_PRIORITY] < priority:
+            raise ValueError(f"New priority {priority!r} is greater than the current priority.")
+        entry[_PRIORITY] = priority
+        sift_up(self._heap, entry[_POSITION], operator.lt, _set_position)
+
+    def remove(self, item):
+        """
+        Remove an item from the queue and return its priority.
+
+        Raises
+        ------
+        ValueError
+            If the item is not in the queue.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(log n)
+        Worst : O(log n)
+        """
+        return self._remove_at(self._entry(item)[_POSITION])[_PRIORITY]
+
+    def __repr__(self):
+        """
+        Return a string representation of the queue for debugging.
+
+        Returns
+        -------
+        str
+            The size and the front (item, priority) pair, if any.
+        """
+        if not self._heap:
+            return "PriorityQueue(size=0)"
+        return f"PriorityQueue(size={len(self._heap)}, front={self.peek()!r})"
+
+
+def benchmark_reprioritize(n=50_000, updates=200_000, seed=0):
+    """
+    Compare PriorityQueue.update with heapq using lazy deletion.
+
+    Both queues start with n items. Each round changes the priority of a
+    random item; heapq has to push a new entry and leave the old one in the
+    heap as stale. Finally both queues are drained.
+
+    Parameters
+    ----------
+    n : int, optional
+        Number of items (default is 50_000).
+    updates : int, optional
+        Number of priority changes (default is 200_000).
+    seed : int, optional
+        Random seed (default is 0).
+
+    Returns
+    -------
+    dict
+        Maps the queue name to (seconds, heap_length_before_draining).
+    """
+    rng = random.Random(seed)
+    priorities = [rng.random() for _ in range(n)]
+    changes = [(rng.randrange(n), rng.random()) for _ in range(updates)]
+    results = {}
+
+    start = time.perf_counter()
+    queue = PriorityQueue(enumerate(priorities))
+    for item, priority in changes:
+        queue.update(item, priority)
+    length = len(queue._heap)
+    while queue:
+        queue.pop()
+    results["PriorityQueue"] = (time.perf_counter() - start, length)
+
+    start = time.perf_counter()
+    heap = [[priority, item, True] for item, priority in enumerate(priorities)]
+    heapq.heapify(heap)
+    current = {entry[1]: entry for entry in heap}
+    for item, priority in changes:
+        current[item][2] = False
+        entry = [priority, item, True]
+        current[item] = entry
+        heapq.heappush(heap, entry)
+    length = len(heap)
+    while heap:
+        heapq.heappop(heap)
+    results["heapq, lazy deletion"] = (time.perf_counter() - start, length)
+    return results
+
+
+# Example usage:
+if __name__ == "__main__":
+    pq = PriorityQueue([("write report", 3), ("fix bug", 1), ("lunch", 2)])
+    pq.push("review PR", 2)
+    print("Priority queue:", pq)
+    pq.decrease_key("write report", 0)
+    print("After decrease_key('write report', 0):", pq.peek())
+    pq.update("fix bug", 5)
+    print("Priority of 'fix bug':", pq.priority("fix bug"))
+    print("Removed 'lunch' with priority:", pq.remove("lunch"))
+    while not pq.is_empty():
+        print("Pop:", pq.pop())
+
+    for name, (seconds, length) in benchmark_reprioritize().items():
+        print(f"{name:>20}: {seconds:.3f} s, heap length {length:,} before draining")
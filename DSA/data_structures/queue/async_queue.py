@@ -0,0 +1,371 @@
+"""
+ASYNC QUEUE DATA STRUCTURE
+..........................
+An async queue is a FIFO queue for asyncio coroutines: enqueue and dequeue are
+awaitable, and a coroutine that finds the queue full or empty is suspended until
+another coroutine makes room or adds an element.
+
+This implementation stores the elements in the circular-buffer Queue from queue.py
+and keeps the suspended coroutines' futures in FIFO waiter lists.
+
+Operations:
+1. Enqueue: Add an element, awaiting room if a bounded queue is full.
+2. Dequeue: Remove the front element, awaiting one if the queue is empty.
+3. Dequeue many: Remove up to n elements at once.
+4. Nowait variants: enqueue_nowait / dequeue_nowait raise IndexError instead of waiting.
+5. Peek, is_empty, is_full and size, as in Queue.
+
+Properties:
+- Waiters are woken in the order they started waiting.
+- A cancelled waiter passes its wakeup on, so no element or free slot is lost.
+- Not thread-safe: use it from coroutines running on one event loop.
+
+Pros:
+- Backpressure for asyncio pipelines without blocking the event loop.
+- O(1) enqueue and dequeue on the ring buffer.
+
+Cons:
+- Only usable from within a running event loop when it has to wait.
+
+When to use an async queue:
+- When asyncio producers and consumers exchange messages.
+
+When not to use an async queue:
+- When producers and consumers are threads; use BlockingQueue.
+
+Keyword arguments:
+argument -- description
+Return: return_description
+"""
+
+import asyncio
+import time
+from collections import deque
+
+# blocking_queue loads queue.py without it replacing the standard library queue module.
+from blocking_queue import Queue
+
+
+class AsyncQueue:
+    """
+    FIFO queue with awaitable enqueue and dequeue.
+
+    Methods
+    -------
+    enqueue(value)
+        Coroutine: add an element, waiting while the queue is full.
+    enqueue_nowait(value)
+        Add an element without waiting.
+    dequeue()
+        Coroutine: remove and return the front element, waiting while empty.
+    dequeue_nowait()
+        Remove and return the front element without waiting.
+    dequeue_many(n)
+        Coroutine: remove and return up to n elements.
+    peek()
+        Return the front element without removing it.
+    is_empty()
+        Check if the queue is empty.
+    is_full()
+        Check if a bounded queue is full.
+    size()
+        Return the number of elements in the queue.
+
+    Parameters
+    ----------
+    capacity : int or None, optional
+        Maximum number of elements; None (the default) means unbounded.
+
+    Attributes
+    ----------
+    _queue : Queue
+        Circular buffer holding the elements.
+    _getters : collections.deque
+        Futures of coroutines waiting for an element.
+    _putters : collections.deque
+        Futures of coroutines waiting for room.
+    """
+
+    def __init__(self, capacity=None):
+        """Initialize an empty queue.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        self._queue = Queue(capacity)
+        self._getters = deque()
+        self._putters = deque()
+
+    @staticmethod
+    def _wakeup_next(waiters):
+        """Wake the longest-waiting coroutine that is still waiting."""
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    async def _wait(self, waiters, blocked):
+        """
+        Suspend until blocked() is false.
+
+        If this waiter is cancelled after being woken, the wakeup is passed
+        on to the next waiter.
+        """
+        while blocked():
+            waiter = asyncio.get_running_loop().create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass
+                if not blocked() and not waiter.cancelled():
+                    self._wakeup_next(waiters)
+                raise
+
+    def enqueue_nowait(self, value):
+        """
+        Add an element to the end of the queue without waiting.
+
+        Raises
+        ------
+        IndexError
+            If a bounded queue is full.
+        """
+        self._queue.enqueue(value)
+        self._wakeup_next(self._getters)
+
+    async def enqueue(self, value):
+        """
+        Add an element to the end of the queue, waiting while it is full.
+
+        Parameters
+        ----------
+        value : object
+            The element to be added to the queue.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(n)
+        """
+        await self._wait(self._putters, self._queue.is_full)
+        self.enqueue_nowait(value)
+
+    def dequeue_nowait(self):
+        """
+        Remove and return the front element without waiting.
+
+        Raises
+        ------
+        IndexError
+            If the queue is empty.
+        """
+        value = self._queue.dequeue()
+        self._wakeup_next(self._putters)
+        return value
+
+    async def dequeue(self):
+        """
+        Remove and return the front element, waiting while the queue is empty.
+
+        Returns
+        -------
+        object
+            The front element of the queue.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        await self._wait(self._getters, self._queue.is_empty)
+        return self.dequeue_nowait()
+
+    async def dequeue_many(self, n):
+        """
+        Remove and return up to n elements from the front of the queue.
+
+        Waits only until at least one element is available, then takes as
+        many as are present, up to n, and wakes one producer per freed slot.
+
+        Parameters
+        ----------
+        n : int
+            Maximum number of elements to remove.
+
+        Returns
+        -------
+        list
+            Between 1 and n elements, front first.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(n)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(n)
+        Worst : O(n)
+        """
+        if n < 1:
+            raise ValueError("n must be at least 1")
+        queue = self._queue
+        await self._wait(self._getters, queue.is_empty)
+        dequeue = queue.dequeue
+        values = [dequeue() for _ in range(min(n, queue.size()))]
+        for _ in values:
+            if not self._putters:
+                break
+            self._wakeup_next(self._putters)
+        return values
+
+    def peek(self):
+        """
+        Return the front element without removing it.
+
+        Raises
+        ------
+        IndexError
+            If the queue is empty.
+        """
+        return self._queue.peek()
+
+    def is_empty(self):
+        """Check if the queue is empty."""
+        return self._queue.is_empty()
+
+    def is_full(self):
+        """Check if a bounded queue is full."""
+        return self._queue.is_full()
+
+    def size(self):
+        """Return the number of elements in the queue."""
+        return self._queue.size()
+
+    def __repr__(self):
+        """Return the size, capacity and number of waiters."""
+        return (f"AsyncQueue(size={self.size()}, capacity={self._queue._capacity}, "
+                f"getters={len(self._getters)}, putters={len(self._putters)})")
+
+
+_STOP = object()
+
+
+async def _run_pipeline(queue, enqueue, dequeue_batch, producers, consumers, messages):
+    """Run producer and consumer coroutines over queue and return messages per second."""
+    share = messages // producers
+
+    async def produce():
+        for value in range(share):
+            await enqueue(value)
+
+    async def consume():
+        while True:
+            for value in await dequeue_batch():
+                if value is _STOP:
+                    await enqueue(_STOP)
+                    return
+
+    start = time.perf_counter()
+    consumer_tasks = [asyncio.create_task(consume()) for _ in range(consumers)]
+    await asyncio.gather(*(produce() for _ in range(producers)))
+    await enqueue(_STOP)
+    await asyncio.gather(*consumer_tasks)
+    return share * producers / (time.perf_counter() - start)
+
+
+def benchmark_throughput(setups=((1, 1), (10, 10), (100, 100)), batch=64,
+                         messages=200_000, capacity=1_024):
+    """
+    Measure messages per second across many producer and consumer coroutines.
+
+    AsyncQueue is run with dequeue and with dequeue_many(batch), and compared
+    against asyncio.Queue with the same capacity.
+
+    Parameters
+    ----------
+    setups : tuple of tuple, optional
+        (producers, consumers) coroutine counts (default is 1:1, 10:10, 100:100).
+    batch : int, optional
+        Batch size for dequeue_many (default is 64).
+    messages : int, optional
+        Total messages per run (default is 200_000).
+    capacity : int, optional
+        Queue capacity (default is 1_024).
+
+    Returns
+    -------
+    list of tuple
+        (queue_name, producers, consumers, messages_per_second) for each run.
+    """
+    async def _single(dequeue):
+        return (await dequeue(),)
+
+    async def run_all():
+        results = []
+        for producers, consumers in setups:
+            queue = AsyncQueue(capacity)
+            rate = await _run_pipeline(queue, queue.enqueue, lambda: _single(queue.dequeue),
+                                       producers, consumers, messages)
+            results.append(("AsyncQueue", producers, consumers, rate))
+
+            queue = AsyncQueue(capacity)
+            rate = await _run_pipeline(queue, queue.enqueue, lambda: queue.dequeue_many(batch),
+                                       producers, consumers, messages)
+            results.append((f"AsyncQueue batch {batch}", producers, consumers, rate))
+
+            queue = asyncio.Queue(capacity)
+            rate = await _run_pipeline(queue, queue.put, lambda: _single(queue.get),
+                                       producers, consumers, messages)
+            results.append(("asyncio.Queue", producers, consumers, rate))
+        return results
+
+    return asyncio.run(run_all())
+
+
+# Example usage:
+if __name__ == "__main__":
+    async def main():
+        q = AsyncQueue(capacity=2)
+        await q.enqueue(10)
+        await q.enqueue(20)
+        print("Queue:", q)
+        try:
+            q.enqueue_nowait(30)
+        except IndexError as error:
+            print("enqueue_nowait:", error)
+
+        blocked = asyncio.create_task(q.enqueue(30))
+        await asyncio.sleep(0)
+        print("Producer waiting for room:", q)
+        print("Dequeue:", await q.dequeue())
+        await blocked
+        print("Dequeue many:", await q.dequeue_many(5))
+        print("Is queue empty?", q.is_empty())
+
+    asyncio.run(main())
+
+    for name, producers, consumers, rate in benchmark_throughput():
+        print(f"{name:>20}, {producers:>3} producers : {consumers:>3} consumers: {rate:12,.0f} msgs/s")
@@ -0,0 +1,374 @@
+"""
+BLOCKING QUEUE DATA STRUCTURE
+.............................
+A blocking queue is a thread-safe FIFO queue with a fixed capacity. Producers that
+find it full wait until there is room, and consumers that find it empty wait until
+an element arrives, which gives natural backpressure between threads.
+
+This implementation wraps the circular-buffer Queue from queue.py with one lock and
+two condition variables.
+
+Operations:
+1. Enqueue: Add an element, waiting (optionally up to a timeout) while the queue is full.
+2. Dequeue: Remove the front element, waiting while the queue is empty.
+3. Dequeue many: Remove up to n elements under a single lock acquisition.
+4. Peek: Return the front element without removing it.
+5. is_empty / is_full: Check the fill state.
+6. size: Return the number of elements in the queue.
+
+Properties:
+- Waiting threads sleep on a condition variable and are woken by notify, so
+  there is no busy waiting.
+- dequeue_many takes a whole batch per lock acquisition and wakes as many
+  producers as there are freed slots, amortizing locking costs.
+- A non-blocking call, or a blocking call whose timeout expires, raises
+  IndexError like the other queues in this package.
+
+Pros:
+- Safe to share between any number of producer and consumer threads.
+- Bounded memory: producers cannot run arbitrarily far ahead of consumers.
+
+Cons:
+- Every operation takes a lock, so it is slower than Queue in a single thread.
+
+When to use a blocking queue:
+- When handing work from producer threads to consumer threads.
+
+When not to use a blocking queue:
+- When the queue is only used from one thread.
+
+Keyword arguments:
+argument -- description
+Return: return_description
+"""
+
+import os
+import runpy
+import threading
+import time
+
+# queue.py has the same name as the standard library queue module, so importing it
+# by name would replace that module for the whole process; run it from its path.
+Queue = runpy.run_path(os.path.join(os.path.dirname(os.path.abspath(__file__)), "queue.py"))["Queue"]
+
+
+class BlockingQueue:
+    """
+    Thread-safe bounded FIFO queue with blocking and timeout-based operations.
+
+    Methods
+    -------
+    enqueue(value, block=True, timeout=None)
+        Add an element to the end of the queue.
+    dequeue(block=True, timeout=None)
+        Remove and return the front element of the queue.
+    dequeue_many(n, block=True, timeout=None)
+        Remove and return up to n elements from the front of the queue.
+    peek()
+        Return the front element without removing it.
+    is_empty()
+        Check if the queue is empty.
+    is_full()
+        Check if the queue is full.
+    size()
+        Return the number of elements in the queue.
+
+    Parameters
+    ----------
+    capacity : int
+        Maximum number of elements in the queue.
+
+    Attributes
+    ----------
+    _queue : Queue
+        Fixed-capacity circular buffer holding the elements.
+    _lock : threading.Lock
+        Guards _queue.
+    _not_empty : threading.Condition
+        Signalled when an element is added.
+    _not_full : threading.Condition
+        Signalled when elements are removed.
+    """
+
+    def __init__(self, capacity):
+        """Initialize an empty queue.
+
+        Time complexity: O(c)
+        Space complexity: O(c)
+        """
+        self._queue = Queue(capacity)
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    @staticmethod
+    def _wait(condition, ready, block, timeout, message):
+        """
+        Wait on condition until ready() is true.
+
+        Must be called with the lock held.
+
+        Raises
+        ------
+        IndexError
+            If block is False, or the timeout expires, while ready() is false.
+        """
+        if ready():
+            return
+        if not block:
+            raise IndexError(message)
+        if timeout is None:
+            while not ready():
+                condition.wait()
+            return
+        deadline = time.monotonic() + timeout
+        while not ready():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise IndexError(message)
+            condition.wait(remaining)
+
+    def enqueue(self, value, block=True, timeout=None):
+        """
+        Add an element to the end of the queue.
+
+        Parameters
+        ----------
+        value : object
+            The element to be added to the queue.
+        block : bool, optional
+            Wait for room if the queue is full (default is True).
+        timeout : float or None, optional
+            Maximum seconds to wait; None waits forever (default is None).
+
+        Raises
+        ------
+        IndexError
+            If the queue is still full when the call gives up.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        queue = self._queue
+        with self._not_full:
+            self._wait(self._not_full, lambda: not queue.is_full(), block, timeout,
+                       "enqueue to full queue")
+            queue.enqueue(value)
+            self._not_empty.notify()
+
+    def dequeue(self, block=True, timeout=None):
+        """
+        Remove and return the front element of the queue.
+
+        Parameters
+        ----------
+        block : bool, optional
+            Wait for an element if the queue is empty (default is True).
+        timeout : float or None, optional
+            Maximum seconds to wait; None waits forever (default is None).
+
+        Returns
+        -------
+        object
+            The front element of the queue.
+
+        Raises
+        ------
+        IndexError
+            If the queue is still empty when the call gives up.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        queue = self._queue
+        with self._not_empty:
+            self._wait(self._not_empty, lambda: not queue.is_empty(), block, timeout,
+                       "dequeue from empty queue")
+            value = queue.dequeue()
+            self._not_full.notify()
+            return value
+
+    def dequeue_many(self, n, block=True, timeout=None):
+        """
+        Remove and return up to n elements from the front of the queue.
+
+        Waits only until at least one element is available, then takes as
+        many as are present, up to n, under the same lock acquisition.
+
+        Parameters
+        ----------
+        n : int
+            Maximum number of elements to remove.
+        block : bool, optional
+            Wait for an element if the queue is empty (default is True).
+        timeout : float or None, optional
+            Maximum seconds to wait; None waits forever (default is None).
+
+        Returns
+        -------
+        list
+            Between 1 and n elements, front first.
+
+        Raises
+        ------
+        IndexError
+            If the queue is still empty when the call gives up.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(n)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(n)
+        Worst : O(n)
+        """
+        if n < 1:
+            raise ValueError("n must be at least 1")
+        queue = self._queue
+        with self._not_empty:
+            self._wait(self._not_empty, lambda: not queue.is_empty(), block, timeout,
+                       "dequeue from empty queue")
+            dequeue = queue.dequeue
+            values = [dequeue() for _ in range(min(n, queue.size()))]
+            self._not_full.notify(len(values))
+            return values
+
+    def peek(self):
+        """
+        Return the front element without removing it.
+
+        Raises
+        ------
+        IndexError
+            If the queue is empty.
+        """
+        with self._lock:
+            return self._queue.peek()
+
+    def is_empty(self):
+        """Check if the queue is empty."""
+        with self._lock:
+            return self._queue.is_empty()
+
+    def is_full(self):
+        """Check if the queue is full."""
+        with self._lock:
+            return self._queue.is_full()
+
+    def size(self):
+        """Return the number of elements in the queue."""
+        with self._lock:
+            return self._queue.size()
+
+    def __repr__(self):
+        """Return the size and capacity of the queue."""
+        return f"BlockingQueue(size={self.size()}, capacity={self._queue._capacity})"
+
+
+_STOP = object()
+
+
+def benchmark_throughput(setups=((1, 1), (1, 4), (4, 4), (8, 8)), batch_sizes=(1, 64),
+                         items=200_000, capacity=1_024):
+    """
+    Measure items per second moved from producer threads to consumer threads.
+
+    Producers enqueue their share of items; consumers drain with
+    dequeue_many(batch). After the producers finish, a stop marker is
+    enqueued, and every consumer that sees it puts it back and exits.
+
+    Parameters
+    ----------
+    setups : tuple of tuple, optional
+        (producers, consumers) pairs to run (default covers 1:1, 1:N and N:M).
+    batch_sizes : tuple of int, optional
+        Batch sizes for dequeue_many (default is (1, 64)).
+    items : int, optional
+        Total number of items per run (default is 200_000).
+    capacity : int, optional
+        Queue capacity (default is 1_024).
+
+    Returns
+    -------
+    list of tuple
+        (producers, consumers, batch, items_per_second) for each run.
+    """
+    results = []
+    for producers, consumers in setups:
+        for batch in batch_sizes:
+            queue = BlockingQueue(capacity)
+            share = items // producers
+
+            def produce():
+                enqueue = queue.enqueue
+                for value in range(share):
+                    enqueue(value)
+
+            def consume():
+                dequeue_many = queue.dequeue_many
+                while True:
+                    for value in dequeue_many(batch):
+                        if value is _STOP:
+                            queue.enqueue(_STOP)
+                            return
+
+            producer_threads = [threading.Thread(target=produce) for _ in range(producers)]
+            consumer_threads = [threading.Thread(target=consume) for _ in range(consumers)]
+            start = time.perf_counter()
+            for thread in producer_threads + consumer_threads:
+                thread.start()
+            for thread in producer_threads:
+                thread.join()
+            queue.enqueue(_STOP)
+            for thread in consumer_threads:
+                thread.join()
+            elapsed = time.perf_counter() - start
+            results.append((producers, consumers, batch, share * producers / elapsed))
+    return results
+
+
+# Example usage:
+if __name__ == "__main__":
+    q = BlockingQueue(capacity=2)
+    q.enqueue(10)
+    q.enqueue(20)
+    print("Queue:", q)
+    try:
+        q.enqueue(30, timeout=0.05)
+    except IndexError as error:
+        print("Enqueue with timeout:", error)
+    print("Dequeue many:", q.dequeue_many(5))
+    try:
+        q.dequeue(block=False)
+    except IndexError as error:
+        print("Non-blocking dequeue:", error)
+
+    worker = threading.Thread(target=lambda: print("Consumer got:", q.dequeue()))
+    worker.start()
+    q.enqueue(40)
+    worker.join()
+
+    for producers, consumers, batch, rate in benchmark_throughput():
+        print(f"{producers} producers : {consumers} consumers, batch {batch:>2}: {rate:12,.0f} items/s")
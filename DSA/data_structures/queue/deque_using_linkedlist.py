@@ -0,0 +1,564 @@
+"""
+DEQUE DATA STRUCTURE
+....................
+A deque (double-ended queue) allows elements to be added and removed at both the
+front and the rear. It can be used as a queue, as a stack, or as a work-stealing
+deque where the owner works at one end and other workers steal from the other.
+
+This implementation builds on the linked list of queue_using_linkedlist, but each
+node is a block holding BLOCK_LEN elements, like collections.deque in CPython.
+Blocks are linked in both directions and the elements occupy a contiguous run of
+slots from _front_index in the front block to _rear_index in the rear block.
+
+Operations:
+1. Append / Appendleft: Add an element at the rear / front.
+2. Pop / Popleft: Remove and return the element at the rear / front.
+3. Enqueue / Dequeue: Aliases of append and popleft, as in Queue.
+4. Peek front / Peek rear: Return an end element without removing it.
+5. Extend / Extendleft: Add many elements at one end.
+6. is_empty / size: Check the number of elements.
+
+Properties:
+- A new block is only allocated when the end block is full, and a block is
+  unlinked as soon as its last element is removed.
+- With a maxlen, adding to a full deque discards an element from the other end.
+- Only the two end blocks are touched by any operation.
+
+Pros:
+- O(1) operations at both ends.
+- One node object per BLOCK_LEN elements instead of one per element.
+
+Cons:
+- Access to the middle of the deque takes O(n).
+- A nearly empty deque still holds a whole block.
+
+When to use a deque:
+- When elements are added or removed at both ends, such as in work stealing,
+  sliding windows or undo histories with a fixed length.
+
+When not to use a deque:
+- When elements are accessed by position; use a list.
+
+Keyword arguments:
+argument -- description
+Return: return_description
+"""
+
+import collections
+import time
+import tracemalloc
+
+from queue_using_linkedlist import Node, Queue
+
+BLOCK_LEN = 64
+_CENTER = (BLOCK_LEN - 1) // 2
+
+
+class Block(Node):
+    """
+    A node of a deque holding BLOCK_LEN slots.
+
+    Attributes
+    ----------
+    value : list
+        The slots of the block; unused slots hold None.
+    next : Block or None
+        Reference to the next block, towards the rear.
+    prev : Block or None
+        Reference to the previous block, towards the front.
+    """
+    __slots__ = ("prev",)
+
+    def __init__(self):
+        super().__init__([None] * BLOCK_LEN)
+        self.prev = None
+
+
+class Deque:
+    """
+    A deque implementation using a doubly linked list of blocks.
+
+    Methods
+    -------
+    append(value)
+        Add an element at the rear.
+    appendleft(value)
+        Add an element at the front.
+    pop()
+        Remove and return the element at the rear.
+    popleft()
+        Remove and return the element at the front.
+    enqueue(value) / dequeue()
+        Aliases of append and popleft.
+    extend(values) / extendleft(values)
+        Add every element at the rear / front.
+    peek_front() / peek_rear()
+        Return the front / rear element without removing it.
+    clear()
+        Remove every element.
+    is_empty()
+        Check if the deque is empty.
+    size()
+        Return the number of elements in the deque.
+
+    Parameters
+    ----------
+    values : iterable, optional
+        Initial elements, appended in order.
+    maxlen : int or None, optional
+        Maximum length; None (the default) means unbounded.
+
+    Attributes
+    ----------
+    _front : Block
+        The block holding the front element.
+    _rear : Block
+        The block holding the rear element.
+    _front_index : int
+        Slot of the front element in _front.
+    _rear_index : int
+        Slot of the rear element in _rear.
+    count : int
+        Number of elements in the deque.
+    _state : int
+        Incremented by every change, to detect changes during iteration.
+    """
+
+    def __init__(self, values=(), maxlen=None):
+        """
+        Initialize the deque with the given elements.
+
+        Time complexity: O(k)
+        Space complexity: O(k)
+        """
+        if maxlen is not None and maxlen < 0:
+            raise ValueError("maxlen must be non-negative")
+        self._maxlen = maxlen
+        self._state = 0
+        self.clear()
+        self.extend(values)
+
+    @property
+    def maxlen(self):
+        """Maximum length of the deque, or None if unbounded."""
+        return self._maxlen
+
+    def clear(self):
+        """Remove every element, keeping a single empty block."""
+        self._front = self._rear = Block()
+        self._front_index = _CENTER + 1
+        self._rear_index = _CENTER
+        self.count = 0
+        self._state += 1
+
+    def append(self, value):
+        """
+        Add an element at the rear, discarding the front one if the deque is full.
+
+        Parameters
+        ----------
+        value : object
+            The element to add.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        if self.count == self._maxlen:
+            if not self._maxlen:
+                return
+            self.popleft()
+        if self._rear_index == BLOCK_LEN - 1:
+            block = Block()
+            block.prev = self._rear
+            self._rear.next = block
+            self._rear = block
+            self._rear_index = -1
+        self._rear_index += 1
+        self._rear.value[self._rear_index] = value
+        self.count += 1
+        self._state += 1
+
+    def appendleft(self, value):
+        """
+        Add an element at the front, discarding the rear one if the deque is full.
+
+        Parameters
+        ----------
+        value : object
+            The element to add.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        if self.count == self._maxlen:
+            if not self._maxlen:
+                return
+            self.pop()
+        if self._front_index == 0:
+            block = Block()
+            block.next = self._front
+            self._front.prev = block
+            self._front = block
+            self._front_index = BLOCK_LEN
+        self._front_index -= 1
+        self._front.value[self._front_index] = value
+        self.count += 1
+        self._state += 1
+
+    def pop(self):
+        """
+        Remove and return the element at the rear.
+
+        Returns
+        -------
+        object
+            The rear element.
+
+        Raises
+        ------
+        IndexError
+            If the deque is empty.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        if self.count == 0:
+            raise IndexError("pop from empty deque")
+        slots = self._rear.value
+        value = slots[self._rear_index]
+        slots[self._rear_index] = None
+        self._rear_index -= 1
+        self.count -= 1
+        self._state += 1
+        if self.count == 0:
+            self._front_index = _CENTER + 1
+            self._rear_index = _CENTER
+        elif self._rear_index < 0:
+            self._rear = self._rear.prev
+            self._rear.next = None
+            self._rear_index = BLOCK_LEN - 1
+        return value
+
+    def popleft(self):
+        """
+        Remove and return the element at the front.
+
+        Returns
+        -------
+        object
+            The front element.
+
+        Raises
+        ------
+        IndexError
+            If the deque is empty.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        if self.count == 0:
+            raise IndexError("pop from empty deque")
+        slots = self._front.value
+        value = slots[self._front_index]
+        slots[self._front_index] = None
+        self._front_index += 1
+        self.count -= 1
+        self._state += 1
+        if self.count == 0:
+            self._front_index = _CENTER + 1
+            self._rear_index = _CENTER
+        elif self._front_index == BLOCK_LEN:
+            self._front = self._front.next
+            self._front.prev = None
+            self._front_index = 0
+        return value
+
+    enqueue = append
+    dequeue = popleft
+
+    def extend(self, values):
+        """
+        Add every element at the rear, in order.
+
+        Time complexity
+        ---------------
+        Best : O(k)
+        Average : O(k)
+        Worst : O(k)
+        """
+        if values is self:
+            values = list(values)
+        append = self.append
+        for value in values:
+            append(value)
+
+    def extendleft(self, values):
+        """
+        Add every element at the front, so they end up in reverse order.
+
+        Time complexity
+        ---------------
+        Best : O(k)
+        Average : O(k)
+        Worst : O(k)
+        """
+        if values is self:
+            values = list(values)
+        appendleft = self.appendleft
+        for value in values:
+            appendleft(value)
+
+    def peek_front(self):
+        """
+        Return the front element without removing it.
+
+        Raises
+        ------
+        IndexError
+            If the deque is empty.
+        """
+        if self.count == 0:
+            raise IndexError("peek from empty deque")
+        return self._front.value[self._front_index]
+
+    def peek_rear(self):
+        """
+        Return the rear element without removing it.
+
+        Raises
+        ------
+        IndexError
+            If the deque is empty.
+        """
+        if self.count == 0:
+            raise IndexError("peek from empty deque")
+        return self._rear.value[self._rear_index]
+
+    def is_empty(self):
+        """
+        Check if the deque is empty.
+
+        Returns
+        -------
+        bool
+            True if the deque is empty, False otherwise.
+        """
+        return self.count == 0
+
+    def size(self):
+        """
+        Return the number of elements in the deque.
+
+        Returns
+        -------
+        int
+            The number of elements in the deque.
+        """
+        return self.count
+
+    def __len__(self):
+        """Return the number of elements in the deque."""
+        return self.count
+
+    def __iter__(self):
+        """
+        Yield the elements from front to rear without removing them.
+
+        Raises
+        ------
+        RuntimeError
+            If the deque is changed during iteration.
+        """
+        state = self._state
+        block = self._front
+        index = self._front_index
+        for _ in range(self.count):
+            if self._state != state:
+                raise RuntimeError("Deque mutated during iteration")
+            yield block.value[index]
+            index += 1
+            if index == BLOCK_LEN:
+                block = block.next
+                index = 0
+
+    def __reversed__(self):
+        """
+        Yield the elements from rear to front without removing them.
+
+        Raises
+        ------
+        RuntimeError
+            If the deque is changed during iteration.
+        """
+        state = self._state
+        block = self._rear
+        index = self._rear_index
+        for _ in range(self.count):
+            if self._state != state:
+                raise RuntimeError("Deque mutated during iteration")
+            yield block.value[index]
+            index -= 1
+            if index < 0:
+                block = block.prev
+                index = BLOCK_LEN - 1
+
+    def __str__(self):
+        """
+        Return a string representation of the deque from front to rear.
+
+        Returns
+        -------
+        str
+            String representation of the deque.
+        """
+        return "Front -> " + " -> ".join(str(value) for value in self) + " -> Rear"
+
+    def __repr__(self):
+        """
+        Return a detailed string representation of the deque.
+
+        Returns
+        -------
+        str
+            The elements and the maximum length.
+        """
+        if self._maxlen is None:
+            return f"Deque({list(self)})"
+        return f"Deque({list(self)}, maxlen={self._maxlen})"
+
+
+def benchmark_against_deque(n=1_000_000):
+    """
+    Compare Deque with collections.deque and the one-node-per-element Queue.
+
+    Measures the traced bytes per element after n appends, then the time of n
+    appends followed by n pops at the same end (stack use), at the other end
+    (queue use), and of a work-stealing mix where the owner appends and pops
+    at the rear while every fourth element is stolen from the front.
+
+    Parameters
+    ----------
+    n : int, optional
+        Number of elements (default is 1_000_000).
+
+    Returns
+    -------
+    dict
+        Maps the container name to a dict of "bytes/element" and nanoseconds
+        per operation for "stack", "queue" and "work stealing". The linked
+        Queue only supports the queue workload.
+    """
+    values = list(range(n))
+    results = {}
+    for name, factory in (("Deque", Deque), ("collections.deque", collections.deque)):
+        tracemalloc.start()
+        container = factory()
+        for value in values:
+            container.append(value)
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del container
+        timings = {"bytes/element": current / n}
+
+        container = factory()
+        append, pop, popleft = container.append, container.pop, container.popleft
+        start = time.perf_counter()
+        for value in values:
+            append(value)
+        for _ in values:
+            pop()
+        timings["stack"] = (time.perf_counter() - start) / (2 * n) * 1e9
+
+        start = time.perf_counter()
+        for value in values:
+            append(value)
+        for _ in values:
+            popleft()
+        timings["queue"] = (time.perf_counter() - start) / (2 * n) * 1e9
+
+        start = time.perf_counter()
+        operations = 0
+        for value in values:
+            append(value)
+            operations += 1
+            if value % 4 == 0:
+                popleft()
+                operations += 1
+        while container:
+            pop()
+            operations += 1
+        timings["work stealing"] = (time.perf_counter() - start) / operations * 1e9
+        results[name] = timings
+
+    tracemalloc.start()
+    queue = Queue()
+    for value in values:
+        queue.enqueue(value)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    while not queue.is_empty():
+        queue.dequeue()
+    results["queue_using_linkedlist.Queue"] = {
+        "bytes/element": current / n,
+        "queue": (time.perf_counter() - start) / n * 1e9,
+    }
+    return results
+
+
+# Example usage:
+if __name__ == "__main__":
+    d = Deque([20, 30])
+    d.appendleft(10)
+    d.append(40)
+    print("Deque:", d)
+    print("Pop:", d.pop())
+    print("Popleft:", d.popleft())
+    print("Peek front:", d.peek_front(), "Peek rear:", d.peek_rear())
+    print("Size of deque:", d.size())
+
+    window = Deque(maxlen=3)
+    window.extend([1, 2, 3, 4, 5])
+    print("Bounded deque after extend([1, 2, 3, 4, 5]):", repr(window))
+    window.appendleft(0)
+    print("After appendleft(0):", repr(window))
+
+    print("Bytes per element and nanoseconds per operation:")
+    for name, timings in benchmark_against_deque().items():
+        print(f"{name:>28}: " + ", ".join(f"{key} {value:.1f}" for key, value in timings.items()))
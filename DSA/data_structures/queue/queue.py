@@ -14,6 +14,9 @@ Operations:
 Properties:
 - The queue grows and shrinks as elements are added or removed.
 - The queue can be implemented using various data structures, such as arrays or linked lists.
+- This implementation stores the elements in a circular buffer: a list used as a ring,
+  with the front at index _head. Dequeue advances _head instead of shifting the list,
+  and a full buffer is copied into one twice its size.
 - Only the front element is accessible.
 - Elements are processed in the order they were added.
 
@@ -43,10 +46,12 @@ Return: return_description
 
 """
 
+import time
+
 
 class Queue:
     """
-    A simple queue implementation using a Python list.
+    A queue implementation using a circular buffer.
 
     Methods
     -------
@@ -58,36 +63,60 @@ class Queue:
         Return the front element without removing it.
     is_empty()
         Check if the queue is empty.
+    is_full()
+        Check if a fixed-capacity queue is full.
     size()
         Return the number of elements in the queue.
 
     Parameters
     ----------
-    None
+    capacity : int or None, optional
+        Fixed maximum number of elements. None (the default) lets the
+        buffer grow geometrically.
 
     Attributes
     ----------
-    _values : list
-        Internal storage for queue elements.
+    _buffer : list
+        Ring of slots holding the elements; unused slots hold None.
+    _head : int
+        Index of the front element in _buffer.
+    _count : int
+        Number of elements in the queue.
+    _capacity : int or None
+        Fixed maximum number of elements, or None if unbounded.
     """
 
-    def __init__(self):
+    _INITIAL_SLOTS = 8
+
+    def __init__(self, capacity=None):
         """Initialize an empty queue.
         
         Time complexity
         ---------------
         Best : O(1)
         Average : O(1)
-        Worst : O(1)
+        Worst : O(c)
         
         Space complexity
         ----------------
-        Best : O(n)
-        Average : O(n)  
-        Worst : O(n)
+        Best : O(1)
+        Average : O(1)  
+        Worst : O(c)
         
         """
-        self._values = []
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._capacity = capacity
+        self._buffer = [None] * (capacity if capacity is not None else self._INITIAL_SLOTS)
+        self._head = 0
+        self._count = 0
+
+    def _grow(self):
+        """Copy the elements, front first, into a buffer twice the size."""
+        buffer = self._buffer
+        head = self._head
+        self._buffer = buffer[head:] + buffer[:head] + [None] * len(buffer)
+        self._head = 0
 
     def enqueue(self, value):
         """
@@ -98,6 +127,11 @@ class Queue:
         value : object
             The element to be added to the queue.
 
+        Raises
+        ------
+        IndexError
+            If a fixed-capacity queue is full.
+
         Time complexity
         ---------------
         Best : O(1)
@@ -111,7 +145,17 @@ class Queue:
         Worst : O(n)
 
         """
-        self._values.append(value)
+        buffer = self._buffer
+        if self._count == len(buffer):
+            if self._capacity is not None:
+                raise IndexError("enqueue to full queue")
+            self._grow()
+            buffer = self._buffer
+        index = self._head + self._count
+        if index >= len(buffer):
+            index -= len(buffer)
+        buffer[index] = value
+        self._count += 1
 
     def dequeue(self):
         """
@@ -129,9 +173,9 @@ class Queue:
 
         Time complexity
         ---------------
-        Best : O(n)
-        Average : O(n)
-        Worst : O(n)
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
         
         Space complexity
         ----------------
@@ -140,9 +184,16 @@ class Queue:
         Worst : O(1)
 
         """
-        if not self.is_empty():
-            return self._values.pop(0)
-        raise IndexError("dequeue from empty queue")
+        if self._count == 0:
+            raise IndexError("dequeue from empty queue")
+        buffer = self._buffer
+        head = self._head
+        value = buffer[head]
+        buffer[head] = None
+        head += 1
+        self._head = 0 if head == len(buffer) else head
+        self._count -= 1
+        return value
 
     def peek(self):
         """
@@ -172,7 +223,7 @@ class Queue:
 
         """
         if not self.is_empty():
-            return self._values[0]
+            return self._buffer[self._head]
         raise IndexError("peek from empty queue")
 
     def is_empty(self):
@@ -197,7 +248,18 @@ class Queue:
         Worst : O(1)
 
         """
-        return len(self._values) == 0
+        return self._count == 0
+
+    def is_full(self):
+        """
+        Check if a fixed-capacity queue is full.
+
+        Returns
+        -------
+        bool
+            True if the queue has a capacity and holds that many elements.
+        """
+        return self._capacity is not None and self._count == self._capacity
 
     def size(self):
         """
@@ -221,7 +283,19 @@ class Queue:
         Worst : O(1)
 
         """
-        return len(self._values)
+        return self._count
+
+    def __len__(self):
+        """Return the number of elements in the queue."""
+        return self._count
+
+    def __iter__(self):
+        """Yield the elements from front to rear without removing them."""
+        buffer = self._buffer
+        slots = len(buffer)
+        for offset in range(self._count):
+            index = self._head + offset
+            yield buffer[index - slots if index >= slots else index]
 
     def __str__(self):
         """
@@ -247,7 +321,7 @@ class Queue:
         """
         if self.is_empty():
           return "Queue is empty"
-        return "Front -> " + " -> ".join(str(value) for value in self._values) + " -> Rear"
+        return "Front -> " + " -> ".join(str(value) for value in self) + " -> Rear"
     
     def __repr__(self):
         """
@@ -271,8 +345,51 @@ class Queue:
         Worst : O(n)
 
         """
-        return f"Queue({self._values})"
-    
+        return f"Queue({list(self)})"
+
+
+def benchmark_drain(max_n=1_000_000, list_max_n=100_000):
+    """
+    Time filling and draining queues of increasing size.
+
+    The circular buffer should take constant time per element at every size;
+    the previous list.pop(0) approach is measured up to list_max_n for
+    comparison. Pass max_n=10_000_000 for the full-size run.
+
+    Parameters
+    ----------
+    max_n : int, optional
+        Largest queue drained (default is 1_000_000).
+    list_max_n : int, optional
+        Largest size for the list.pop(0) baseline (default is 100_000).
+
+    Returns
+    -------
+    list of tuple
+        (n, ring_seconds, list_seconds or None) for n = 1_000, 10_000, ... max_n.
+    """
+    results = []
+    n = 1_000
+    while n <= max_n:
+        queue = Queue()
+        for value in range(n):
+            queue.enqueue(value)
+        start = time.perf_counter()
+        while not queue.is_empty():
+            queue.dequeue()
+        ring_seconds = time.perf_counter() - start
+
+        list_seconds = None
+        if n <= list_max_n:
+            values = list(range(n))
+            start = time.perf_counter()
+            while values:
+                values.pop(0)
+            list_seconds = time.perf_counter() - start
+        results.append((n, ring_seconds, list_seconds))
+        n *= 10
+    return results
+
 
 # Example usage:
 if __name__ == "__main__":
@@ -288,4 +405,15 @@ if __name__ == "__main__":
     print("Peek:", q.peek())  
     print("After peek:", q)
     print("Size of queue:", q.size())
-    print("Is queue empty?", q.is_empty())
\ No newline at end of file
+    print("Is queue empty?", q.is_empty())
+
+    bounded = Queue(capacity=2)
+    bounded.enqueue(1)
+    bounded.enqueue(2)
+    print("Bounded queue full?", bounded.is_full())
+
+    for n, ring_seconds, list_seconds in benchmark_drain():
+        line = f"Drain {n:>10,}: ring buffer {ring_seconds / n * 1e9:6.0f} ns/item"
+        if list_seconds is not None:
+            line += f", list.pop(0) {list_seconds / n * 1e9:8.0f} ns/item"
+        print(line)
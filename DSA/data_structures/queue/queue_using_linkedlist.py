@@ -16,6 +16,8 @@ class Node:
     next : Node or None
         Reference to the next node.
     """
+    __slots__ = ("value", "next")
+
     def __init__(self, value):
         self.value = value
         self.next = None
@@ -90,7 +92,7 @@ class Queue:
         """
         if self.is_empty():
             raise IndexError("dequeue from empty queue")
-        value = self._front._value
+        value = self._front.value
         self._front = self._front.next
         if self._front is None:
             self._rear = None
@@ -113,7 +115,7 @@ class Queue:
         """
         if self.is_empty():
             raise IndexError("peek from empty queue")
-        return self._front._value
+        return self._front.value
 
     def is_empty(self):
         """
@@ -162,7 +164,7 @@ class Queue:
         str
             Detailed string representation of the queue.
         """
-        return f"Queue(size={self._count})"
+        return f"Queue(size={self.count})"
 
 # Example usage:
 if __name__ == "__main__":
@@ -0,0 +1,626 @@
+"""
+SHARED MEMORY QUEUE DATA STRUCTURE
+..................................
+A shared memory queue is a FIFO queue whose elements live in a block of memory
+shared between processes, so a producer process can hand data to a consumer
+process without pickling it or sending it through a pipe.
+
+This implementation is a ring buffer of fixed-size slots in a
+multiprocessing.shared_memory block, like the circular buffer of Queue in queue.py
+but indexed by two ever-increasing counters instead of a head and a count.
+
+Memory layout:
+1. Header: the head counter (u64) and, on its own cache line, the tail counter (u64).
+2. capacity slots. In bytes mode a slot is a length (u32) followed by up to
+   record_size payload bytes; in record mode it is one struct record.
+
+Operations:
+1. Enqueue: Copy an element into the tail slot, waiting while the queue is full.
+2. Dequeue: Copy the element out of the head slot, waiting while the queue is empty.
+3. Dequeue view: Return a memoryview of the head payload without copying it.
+4. Dequeue many: Remove up to n elements with one head update.
+5. is_empty / is_full / size: Check the fill state.
+
+Properties:
+- Only the producer writes the tail counter and only the consumer writes the
+  head counter, so SharedMemoryQueue needs no lock for one producer and one
+  consumer. MultiProducerQueue serializes its producers with a lock.
+- A counter is published with one aligned 8-byte store after the slot is
+  written, so the other side never sees a half-written slot. There is no memory
+  barrier: this relies on the GIL ordering the stores within each process and on
+  x86-64 not reordering stores with other stores, or loads with other loads.
+  Weakly ordered CPUs such as ARM would need explicit fences.
+- Waiting polls the counters with a short back-off sleep; a non-blocking call,
+  or a blocking call whose timeout expires, raises IndexError.
+- The queue can be passed to a multiprocessing.Process; the child attaches to
+  the same shared memory block by name.
+
+Pros:
+- No pickling: bytes and struct records are copied straight into shared memory.
+- Bounded memory, allocated once.
+
+Cons:
+- Only bytes payloads up to record_size, or fixed struct records, can be queued.
+- Exactly one consumer process.
+- Polling adds latency when the queue is often empty or full.
+
+When to use a shared memory queue:
+- When worker processes exchange many small binary messages.
+
+When not to use a shared memory queue:
+- When the messages are arbitrary Python objects; use multiprocessing.Queue.
+- When everything runs in one process; use Queue or BlockingQueue.
+
+Keyword arguments:
+argument -- description
+Return: return_description
+"""
+
+import multiprocessing
+import struct
+import time
+from multiprocessing import shared_memory
+
+try:
+    import multiprocessing.queues
+except ImportError as error:
+    raise ImportError(
+        "multiprocessing.queues found queue.py from this directory instead of the standard "
+        "library queue module; run this file with 'python -m "
+        "DSA.data_structures.queue.shared_memory_queue' from the repository root") from error
+
+_HEADER_SIZE = 128
+_HEAD = 0
+_TAIL = 8
+_LENGTH = struct.Struct("<I")
+_MAX_POLL_DELAY = 0.001
+
+
+class SharedMemoryQueue:
+    """
+    Single-producer, single-consumer FIFO queue in shared memory.
+
+    Methods
+    -------
+    enqueue(value, block=True, timeout=None)
+        Add an element to the end of the queue.
+    dequeue(block=True, timeout=None)
+        Remove and return the front element of the queue.
+    dequeue_view(block=True, timeout=None)
+        Return a memoryview of the front payload without copying it.
+    release()
+        Remove the element returned by the last dequeue_view.
+    dequeue_many(n, block=True, timeout=None)
+        Remove and return up to n elements from the front of the queue.
+    is_empty()
+        Check if the queue is empty.
+    is_full()
+        Check if the queue is full.
+    size()
+        Return the number of elements in the queue.
+    close()
+        Detach from the shared memory block.
+    unlink()
+        Free the shared memory block.
+
+    Parameters
+    ----------
+    capacity : int, optional
+        Number of slots (default is 1024).
+    record_size : int, optional
+        Maximum payload size in bytes (default is 256). Ignored in record mode.
+    record_format : str or None, optional
+        A struct format. When given, elements are tuples packed with it
+        instead of bytes payloads (default is None).
+
+    Attributes
+    ----------
+    _shm : multiprocessing.shared_memory.SharedMemory
+        The shared memory block.
+    _counters : memoryview
+        The header as u64 values; _counters[_HEAD] and _counters[_TAIL].
+    _data : memoryview
+        The slots.
+    _record : struct.Struct or None
+        Packs and unpacks elements in record mode.
+    _held : bool
+        Whether the front element is held by a dequeue_view.
+    _owner : bool
+        Whether this process created the block and frees it in unlink().
+    """
+
+    def __init__(self, capacity=1024, record_size=256, record_format=None):
+        """Create the shared memory block with an empty queue.
+
+        Time complexity: O(c)
+        Space complexity: O(c * s)
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        record = struct.Struct(record_format) if record_format is not None else None
+        stride = record.size if record is not None else _LENGTH.size + record_size
+        shm = shared_memory.SharedMemory(create=True, size=_HEADER_SIZE + capacity * stride)
+        shm.buf[:_HEADER_SIZE] = bytes(_HEADER_SIZE)
+        self._attach(shm, capacity, record_size, record_format, owner=True)
+
+    def _attach(self, shm, capacity, record_size, record_format, owner):
+        """Set up the views of an existing block."""
+        self._shm = shm
+        self._capacity = capacity
+        self._record_size = record_size
+        self._record_format = record_format
+        self._record = struct.Struct(record_format) if record_format is not None else None
+        self._stride = self._record.size if self._record is not None else _LENGTH.size + record_size
+        self._counters = shm.buf[:_HEADER_SIZE].cast("Q")
+        self._data = shm.buf[_HEADER_SIZE:_HEADER_SIZE + capacity * self._stride]
+        self._held = False
+        self._owner = owner
+
+    def __getstate__(self):
+        """Pickle the block name, so a child process can attach to it."""
+        return (self._shm.name, self._capacity, self._record_size, self._record_format)
+
+    def __setstate__(self, state):
+        """Attach to the block of the pickled queue."""
+        name, capacity, record_size, record_format = state
+        self._attach(shared_memory.SharedMemory(name=name), capacity, record_size,
+                     record_format, owner=False)
+
+    @staticmethod
+    def _wait(ready, block, timeout, message):
+        """
+        Poll until ready() is true, sleeping a little longer each time.
+
+        Raises
+        ------
+        IndexError
+            If block is False, or the timeout expires, while ready() is false.
+        """
+        if ready():
+            return
+        if not block:
+            raise IndexError(message)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = 0.0
+        while not ready():
+            if deadline is not None and time.monotonic() >= deadline:
+                raise IndexError(message)
+            time.sleep(delay)
+            delay = min(delay * 2 or 1e-6, _MAX_POLL_DELAY)
+
+    def _check(self, value):
+        """Raise ValueError if value does not fit in a slot."""
+        if self._record is None and len(value) > self._record_size:
+            raise ValueError(f"payload of {len(value)} bytes exceeds record_size {self._record_size}")
+
+    def _write(self, tail, value):
+        """Write value into the slot of tail and publish it."""
+        offset = (tail % self._capacity) * self._stride
+        if self._record is None:
+            length = len(value)
+            _LENGTH.pack_into(self._data, offset, length)
+            start = offset + _LENGTH.size
+            self._data[start:start + length] = value
+        else:
+            self._record.pack_into(self._data, offset, *value)
+        # Publish only after the slot is written. Without a fence this is safe
+        # because the GIL keeps the two stores in program order and x86-64 makes
+        # stores visible to other cores in that order; ARM would need a barrier.
+        self._counters[_TAIL] = tail + 1
+
+    def _read_view(self, head):
+        """Return the payload of the slot of head as a memoryview."""
+        offset = (head % self._capacity) * self._stride
+        if self._record is not None:
+            return self._data[offset:offset + self._stride]
+        start = offset + _LENGTH.size
+        return self._data[start:start + _LENGTH.unpack_from(self._data, offset)[0]]
+
+    def _read(self, head):
+        """Return a copy of the element in the slot of head."""
+        if self._record is not None:
+            return self._record.unpack_from(self._data, (head % self._capacity) * self._stride)
+        return bytes(self._read_view(head))
+
+    def enqueue(self, value, block=True, timeout=None):
+        """
+        Add an element to the end of the queue.
+
+        Parameters
+        ----------
+        value : bytes-like or tuple
+            A payload of at most record_size bytes, or a tuple in record mode.
+        block : bool, optional
+            Wait for room if the queue is full (default is True).
+        timeout : float or None, optional
+            Maximum seconds to wait; None waits forever (default is None).
+
+        Raises
+        ------
+        ValueError
+            If the payload is longer than record_size.
+        IndexError
+            If the queue is still full when the call gives up.
+
+        Time complexity
+        ---------------
+        Best : O(s)
+        Average : O(s)
+        Worst : O(s)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        self._check(value)
+        counters = self._counters
+        self._wait(lambda: counters[_TAIL] - counters[_HEAD] < self._capacity, block, timeout,
+                   "enqueue to full queue")
+        self._write(counters[_TAIL], value)
+
+    def release(self):
+        """Remove the element returned by the last dequeue_view, if any."""
+        if self._held:
+            self._held = False
+            self._counters[_HEAD] += 1
+
+    def _wait_not_empty(self, block, timeout):
+        """Release a held element, then wait until the queue is not empty."""
+        self.release()
+        counters = self._counters
+        self._wait(lambda: counters[_TAIL] != counters[_HEAD], block, timeout,
+                   "dequeue from empty queue")
+
+    def dequeue(self, block=True, timeout=None):
+        """
+        Remove and return the front element of the queue.
+
+        Parameters
+        ----------
+        block : bool, optional
+            Wait for an element if the queue is empty (default is True).
+        timeout : float or None, optional
+            Maximum seconds to wait; None waits forever (default is None).
+
+        Returns
+        -------
+        bytes or tuple
+            The front payload, or the front record in record mode.
+
+        Raises
+        ------
+        IndexError
+            If the queue is still empty when the call gives up.
+
+        Time complexity
+        ---------------
+        Best : O(s)
+        Average : O(s)
+        Worst : O(s)
+
+        Space complexity
+        ----------------
+        Best : O(s)
+        Average : O(s)
+        Worst : O(s)
+        """
+        self._wait_not_empty(block, timeout)
+        head = self._counters[_HEAD]
+        value = self._read(head)
+        self._counters[_HEAD] = head + 1
+        return value
+
+    def dequeue_view(self, block=True, timeout=None):
+        """
+        Return the front payload as a memoryview into shared memory.
+
+        The slot stays reserved, and counted by size(), until release() or
+        the next dequeue call, after which the view must not be used. Release
+        the view itself (memoryview.release) before close().
+
+        Parameters
+        ----------
+        block : bool, optional
+            Wait for an element if the queue is empty (default is True).
+        timeout : float or None, optional
+            Maximum seconds to wait; None waits forever (default is None).
+
+        Returns
+        -------
+        memoryview
+            The payload bytes, or the packed record in record mode.
+
+        Raises
+        ------
+        IndexError
+            If the queue is still empty when the call gives up.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        self._wait_not_empty(block, timeout)
+        self._held = True
+        return self._read_view(self._counters[_HEAD])
+
+    def dequeue_many(self, n, block=True, timeout=None):
+        """
+        Remove and return up to n elements from the front of the queue.
+
+        Waits only until at least one element is available, then takes as
+        many as are present, up to n, and publishes the head once.
+
+        Parameters
+        ----------
+        n : int
+            Maximum number of elements to remove.
+        block : bool, optional
+            Wait for an element if the queue is empty (default is True).
+        timeout : float or None, optional
+            Maximum seconds to wait; None waits forever (default is None).
+
+        Returns
+        -------
+        list
+            Between 1 and n elements, front first.
+
+        Raises
+        ------
+        IndexError
+            If the queue is still empty when the call gives up.
+
+        Time complexity
+        ---------------
+        Best : O(s)
+        Average : O(n * s)
+        Worst : O(n * s)
+
+        Space complexity
+        ----------------
+        Best : O(s)
+        Average : O(n * s)
+        Worst : O(n * s)
+        """
+        if n < 1:
+            raise ValueError("n must be at least 1")
+        self._wait_not_empty(block, timeout)
+        head = self._counters[_HEAD]
+        end = min(self._counters[_TAIL], head + n)
+        values = [self._read(position) for position in range(head, end)]
+        self._counters[_HEAD] = end
+        return values
+
+    def is_empty(self):
+        """Check if the queue is empty."""
+        return self.size() == 0
+
+    def is_full(self):
+        """Check if the queue is full."""
+        return self.size() == self._capacity
+
+    def size(self):
+        """Return the number of elements in the queue."""
+        head = self._counters[_HEAD]
+        return self._counters[_TAIL] - head
+
+    def close(self):
+        """Detach this process from the shared memory block."""
+        if self._counters is None:
+            return
+        self._counters.release()
+        self._data.release()
+        self._counters = self._data = None
+        self._shm.close()
+
+    def unlink(self):
+        """Free the shared memory block once every process has closed it."""
+        self._shm.unlink()
+
+    def __enter__(self):
+        """Return the queue, so it can be used in a with statement."""
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        """Close the queue, and free the block if this process created it."""
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    def __repr__(self):
+        """Return the type, size and capacity of the queue."""
+        return f"{type(self).__name__}(size={self.size()}, capacity={self._capacity})"
+
+
+class MultiProducerQueue(SharedMemoryQueue):
+    """
+    Multi-producer, single-consumer FIFO queue in shared memory.
+
+    Producers take a multiprocessing.Lock to claim and fill the tail slot;
+    the consumer side is the same lock-free code as SharedMemoryQueue.
+
+    Parameters
+    ----------
+    capacity, record_size, record_format
+        As for SharedMemoryQueue.
+
+    Attributes
+    ----------
+    _lock : multiprocessing.Lock
+        Serializes producers.
+    """
+
+    def __init__(self, capacity=1024, record_size=256, record_format=None):
+        """Create the shared memory block with an empty queue and a producer lock.
+
+        Time complexity: O(c)
+        Space complexity: O(c * s)
+        """
+        super().__init__(capacity, record_size, record_format)
+        self._lock = multiprocessing.Lock()
+
+    def __getstate__(self):
+        """Pickle the block name and the producer lock."""
+        return super().__getstate__(), self._lock
+
+    def __setstate__(self, state):
+        """Attach to the block and share the producer lock."""
+        base_state, self._lock = state
+        super().__setstate__(base_state)
+
+    def enqueue(self, value, block=True, timeout=None):
+        """
+        Add an element to the end of the queue; safe to call from many processes.
+
+        The lock is only held while the queue has room, so a waiting producer
+        does not stop the others from enqueueing.
+
+        Parameters
+        ----------
+        value : bytes-like or tuple
+            A payload of at most record_size bytes, or a tuple in record mode.
+        block : bool, optional
+            Wait for room if the queue is full (default is True).
+        timeout : float or None, optional
+            Maximum seconds to wait; None waits forever (default is None).
+
+        Raises
+        ------
+        ValueError
+            If the payload is longer than record_size.
+        IndexError
+            If the queue is still full when the call gives up.
+        """
+        self._check(value)
+        counters = self._counters
+        capacity = self._capacity
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                tail = counters[_TAIL]
+                if tail - counters[_HEAD] < capacity:
+                    self._write(tail, value)
+                    return
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+            self._wait(lambda: counters[_TAIL] - counters[_HEAD] < capacity, block, remaining,
+                       "enqueue to full queue")
+
+
+def _produce_shared(queue, count, payload):
+    """Enqueue payload count times into a shared memory queue."""
+    enqueue = queue.enqueue
+    for _ in range(count):
+        enqueue(payload)
+    queue.close()
+
+
+def _produce_pipe(queue, count, payload):
+    """Put payload count times into a multiprocessing.Queue."""
+    put = queue.put
+    for _ in range(count):
+        put(payload)
+
+
+def benchmark_throughput(producer_counts=(1, 4), messages=200_000, payload_size=64,
+                         capacity=1_024, batch=64):
+    """
+    Measure messages per second from producer processes to this process.
+
+    One producer uses SharedMemoryQueue and several use MultiProducerQueue;
+    both are drained with dequeue_many(batch). multiprocessing.Queue is run
+    with the same producers and payloads for comparison.
+
+    Parameters
+    ----------
+    producer_counts : tuple of int, optional
+        Numbers of producer processes to run (default is (1, 4)).
+    messages : int, optional
+        Total messages per run (default is 200_000).
+    payload_size : int, optional
+        Bytes per message (default is 64).
+    capacity : int, optional
+        Queue capacity (default is 1_024).
+    batch : int, optional
+        Batch size for dequeue_many (default is 64).
+
+    Returns
+    -------
+    list of tuple
+        (queue_name, producers, messages_per_second) for each run.
+    """
+    payload = bytes(range(256)) * (payload_size // 256) + bytes(payload_size % 256)
+    results = []
+    for producers in producer_counts:
+        share = messages // producers
+        total = share * producers
+
+        queue_class = SharedMemoryQueue if producers == 1 else MultiProducerQueue
+        with queue_class(capacity, record_size=payload_size) as queue:
+            processes = [multiprocessing.Process(target=_produce_shared, args=(queue, share, payload))
+                         for _ in range(producers)]
+            start = time.perf_counter()
+            for process in processes:
+                process.start()
+            received = 0
+            while received < total:
+                received += len(queue.dequeue_many(batch))
+            elapsed = time.perf_counter() - start
+            for process in processes:
+                process.join()
+        results.append((queue_class.__name__, producers, total / elapsed))
+
+        queue = multiprocessing.Queue(capacity)
+        processes = [multiprocessing.Process(target=_produce_pipe, args=(queue, share, payload))
+                     for _ in range(producers)]
+        start = time.perf_counter()
+        for process in processes:
+            process.start()
+        get = queue.get
+        for _ in range(total):
+            get()
+        elapsed = time.perf_counter() - start
+        for process in processes:
+            process.join()
+        results.append(("multiprocessing.Queue", producers, total / elapsed))
+    return results
+
+
+# Example usage:
+# multiprocessing.queues imports the standard library queue module, which queue.py
+# in this directory shadows when it is first on sys.path, so run this file from the
+# repository root with "python -m DSA.data_structures.queue.shared_memory_queue"
+# (or "python -P shared_memory_queue.py" on Python 3.11+).
+if __name__ == "__main__":
+    with SharedMemoryQueue(capacity=2, record_size=16) as q:
+        q.enqueue(b"hello")
+        q.enqueue(b"world")
+        print("Queue:", q)
+        try:
+            q.enqueue(b"again", block=False)
+        except IndexError as error:
+            print("Non-blocking enqueue:", error)
+        view = q.dequeue_view()
+        print("Dequeue view:", view.tobytes(), "size while held:", q.size())
+        view.release()
+        print("Dequeue:", q.dequeue())
+        print("Is queue empty?", q.is_empty())
+
+    with MultiProducerQueue(capacity=8, record_format="<qd") as q:
+        workers = [multiprocessing.Process(target=q.enqueue, args=((i, i / 2),)) for i in range(3)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        print("Records from 3 processes:", sorted(q.dequeue_many(3)))
+
+    for name, producers, rate in benchmark_throughput():
+        print(f"{name:>22}, {producers} producers: {rate:12,.0f} msgs/s")
@@ -0,0 +1,541 @@
+"""
+SKIP LIST DATA STRUCTURE
+........................
+A skip list is a sorted linked list with extra "express lanes": every node is on
+the bottom level, about half of them are also on level 2, a quarter on level 3,
+and so on. A search starts on the highest level and drops down a level whenever
+the next node would overshoot, so it skips over most of the list.
+
+This implementation is an indexable skip list: every forward link also stores
+its width, the number of bottom-level nodes it jumps over, which gives positions
+and ranks in expected O(log n).
+
+Operations:
+1. Insert: Add a value in sorted position (duplicates are kept).
+2. Delete: Remove the first occurrence of a value.
+3. Search: Find the node holding a value.
+4. Rank: Count the values smaller than a given value.
+5. Select: Return the value at a given position (list[i]).
+6. Range: Iterate over the values in [low, high) in order.
+7. Traverse: Visit each value in order.
+
+Properties:
+- Values must be mutually comparable with <.
+- A node's level is drawn at random with P(level > k) = 1 / 2^k, so the list is
+  balanced in expectation without any rebalancing.
+- Nodes extend linked_list.Node: data holds the value and next holds one
+  forward reference per level instead of a single reference.
+
+Pros:
+- Expected O(log n) insert, delete, search and rank with simple code.
+- Range iteration walks the bottom level like an ordinary linked list.
+
+Cons:
+- Performance is probabilistic, not guaranteed.
+- Each node carries two small lists (forward links and widths).
+
+When to use a skip list:
+- When a sorted collection changes often and needs range and rank queries.
+
+When not to use a skip list:
+- When the data is static; a sorted Python list with bisect is smaller and faster.
+
+Keyword arguments:
+argument -- description
+Return: return_description
+"""
+
+import bisect
+import random
+import time
+
+from linked_list import LinkedList, Node
+
+
+class SkipNode(Node):
+    """
+    A node in a skip list.
+
+    Parameters
+    ----------
+    data : object
+        The value to store in the node.
+    level : int
+        Number of levels the node takes part in.
+
+    Attributes:
+        data: The value stored in the node.
+        next: List of references to the next node on each level.
+        width: List with the number of bottom-level steps each forward
+            reference skips.
+    """
+    __slots__ = ("width",)
+
+    def __init__(self, data, level):
+        super().__init__(data)
+        self.next = [None] * level
+        self.width = [1] * level
+
+
+class SkipList:
+    """
+    An indexable skip list implementation.
+
+    Methods
+    -------
+    insert(value)
+        Insert a value in sorted position.
+    delete(value)
+        Remove the first occurrence of a value.
+    search(value)
+        Return the node holding the value.
+    rank(value)
+        Return the number of values smaller than value.
+    select(index)
+        Return the value at the given position.
+    range(low=None, high=None)
+        Lazily yield the values v with low <= v < high.
+    traverse()
+        Return a list of all values in order.
+    peek()
+        Return the smallest value.
+    is_empty()
+        Check if the skip list is empty.
+    size()
+        Return the number of values.
+
+    Supports len(), iteration in sorted order, the in operator and indexing.
+
+    Parameters
+    ----------
+    max_level : int, optional
+        Maximum number of levels (default is 32).
+    seed : int or None, optional
+        Seed for the level generator (default is None).
+
+    Attributes
+    ----------
+    _head : SkipNode
+        Sentinel node with max_level forward references.
+    _level : int
+        Number of levels currently in use.
+    count : int
+        Number of values in the skip list.
+    """
+
+    def __init__(self, max_level=32, seed=None):
+        """
+        Initialize an empty skip list.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        if max_level < 1:
+            raise ValueError("max_level must be at least 1")
+        self._max_level = max_level
+        self._head = SkipNode(None, max_level)
+        self._level = 1
+        self._random = random.Random(seed)
+        self.count = 0
+
+    def _random_level(self):
+        """Draw a level in 1..max_level with P(level > k) = 1 / 2^k."""
+        top = 1 << (self._max_level - 1)
+        bits = self._random.getrandbits(self._max_level - 1) | top
+        return (bits & -bits).bit_length()
+
+    def _find_predecessors(self, value, inclusive):
+        """
+        Return the last node before value on every level in use, and the
+        position of each of those nodes.
+
+        With inclusive=True nodes equal to value are passed as well, so a new
+        value is inserted after its duplicates.
+        """
+        update = [None] * self._level
+        positions = [0] * self._level
+        node = self._head
+        position = 0
+        for lvl in range(self._level - 1, -1, -1):
+            nxt = node.next[lvl]
+            while nxt is not None and (nxt.data < value or (inclusive and not value < nxt.data)):
+                position += node.width[lvl]
+                node = nxt
+                nxt = node.next[lvl]
+            update[lvl] = node
+            positions[lvl] = position
+        return update, positions
+
+    def insert(self, value):
+        """
+        Insert a value in sorted position, after any equal values.
+
+        Parameters
+        ----------
+        value : object
+            The value to be inserted.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(log n)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(log n)
+        """
+        level = self._random_level()
+        head = self._head
+        if level > self._level:
+            for lvl in range(self._level, level):
+                head.width[lvl] = self.count + 1
+            self._level = level
+        update, positions = self._find_predecessors(value, inclusive=True)
+        position = positions[0] + 1
+        new_node = SkipNode(value, level)
+        for lvl in range(level):
+            prev = update[lvl]
+            skipped = position - positions[lvl]
+            new_node.next[lvl] = prev.next[lvl]
+            prev.next[lvl] = new_node
+            new_node.width[lvl] = prev.width[lvl] - skipped + 1
+            prev.width[lvl] = skipped
+        for lvl in range(level, self._level):
+            update[lvl].width[lvl] += 1
+        self.count += 1
+
+    def delete(self, value):
+        """
+        Remove the first occurrence of a value.
+
+        Parameters
+        ----------
+        value : object
+            The value to be deleted.
+
+        Raises
+        ------
+        ValueError
+            If the value is not in the skip list.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(log n)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(log n)
+        Worst : O(log n)
+        """
+        update, _ = self._find_predecessors(value, inclusive=False)
+        target = update[0].next[0]
+        if target is None or value < target.data or target.data < value:
+            raise ValueError(f"Value {value} not found in the skip list.")
+        for lvl in range(self._level):
+            prev = update[lvl]
+            if prev.next[lvl] is target:
+                prev.width[lvl] += target.width[lvl] - 1
+                prev.next[lvl] = target.next[lvl]
+            else:
+                prev.width[lvl] -= 1
+        while self._level > 1 and self._head.next[self._level - 1] is None:
+            self._level -= 1
+        self.count -= 1
+
+    def search(self, value):
+        """
+        Return the node holding the first occurrence of a value.
+
+        Parameters
+        ----------
+        value : object
+            The value to search for.
+
+        Returns
+        -------
+        SkipNode or None
+            The node holding the value, or None if not found.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(log n)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        node = self._head
+        for lvl in range(self._level - 1, -1, -1):
+            nxt = node.next[lvl]
+            while nxt is not None and nxt.data < value:
+                node = nxt
+                nxt = node.next[lvl]
+        node = node.next[0]
+        if node is not None and not value < node.data:
+            return node
+        return None
+
+    def __contains__(self, value):
+        """Check whether a value is in the skip list."""
+        return self.search(value) is not None
+
+    def rank(self, value):
+        """
+        Return the number of values smaller than value.
+
+        Parameters
+        ----------
+        value : object
+            The value to rank; it does not need to be in the skip list.
+
+        Returns
+        -------
+        int
+            The position value would be inserted at before its duplicates.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(log n)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        node = self._head
+        position = 0
+        for lvl in range(self._level - 1, -1, -1):
+            nxt = node.next[lvl]
+            while nxt is not None and nxt.data < value:
+                position += node.width[lvl]
+                node = nxt
+                nxt = node.next[lvl]
+        return position
+
+    def select(self, index):
+        """
+        Return the value at the given position.
+
+        Parameters
+        ----------
+        index : int
+            Position of the value; negative positions count from the end.
+
+        Returns
+        -------
+        object
+            The value at that position.
+
+        Raises
+        ------
+        IndexError
+            If index is out of range.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(log n)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("skip list index out of range")
+        remaining = index + 1
+        node = self._head
+        for lvl in range(self._level - 1, -1, -1):
+            while node.next[lvl] is not None and node.width[lvl] <= remaining:
+                remaining -= node.width[lvl]
+                node = node.next[lvl]
+        return node.data
+
+    def __getitem__(self, index):
+        """Return the value at the given position."""
+        return self.select(index)
+
+    def range(self, low=None, high=None):
+        """
+        Lazily yield the values v with low <= v < high, in order.
+
+        Parameters
+        ----------
+        low : object, optional
+            Inclusive lower bound; None means no lower bound.
+        high : object, optional
+            Exclusive upper bound; None means no upper bound.
+
+        Returns
+        -------
+        generator
+            The values in the range.
+
+        Time complexity
+        ---------------
+        Best : O(log n + k)
+        Average : O(log n + k)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        node = self._head
+        if low is not None:
+            for lvl in range(self._level - 1, -1, -1):
+                nxt = node.next[lvl]
+                while nxt is not None and nxt.data < low:
+                    node = nxt
+                    nxt = node.next[lvl]
+        node = node.next[0]
+        while node is not None and (high is None or node.data < high):
+            yield node.data
+            node = node.next[0]
+
+    def __iter__(self):
+        """Lazily yield every value in order."""
+        return self.range()
+
+    def __len__(self):
+        """Return the number of values."""
+        return self.count
+
+    def traverse(self):
+        """
+        Return a list of all values in order.
+
+        Returns
+        -------
+        list
+            The values in sorted order.
+        """
+        return list(self)
+
+    def peek(self):
+        """
+        Return the smallest value.
+
+        Raises
+        ------
+        IndexError
+            If the skip list is empty.
+        """
+        first = self._head.next[0]
+        if first is None:
+            raise IndexError("peek from empty skip list")
+        return first.data
+
+    def is_empty(self):
+        """
+        Check if the skip list is empty.
+
+        Returns
+        -------
+        bool
+            True if the skip list is empty, False otherwise.
+        """
+        return self._head.next[0] is None
+
+    def size(self):
+        """
+        Return the number of values.
+
+        Returns
+        -------
+        int
+            The number of values in the skip list.
+        """
+        return self.count
+
+    def __str__(self):
+        """Return the values joined by arrows, ending in None."""
+        return " -> ".join(str(value) for value in self) + " -> None"
+
+    def __repr__(self):
+        """Return the number of values and levels in use."""
+        return f"SkipList(size={self.count}, levels={self._level})"
+
+
+def benchmark_search(n=100_000, queries=1_000, seed=0):
+    """
+    Compare lookups in a SkipList with LinkedList.search and bisect on a sorted list.
+
+    Parameters
+    ----------
+    n : int, optional
+        Number of sorted values in each container (default is 100_000).
+    queries : int, optional
+        Number of random lookups (default is 1_000).
+    seed : int, optional
+        Random seed for the queries (default is 0).
+
+    Returns
+    -------
+    dict
+        Microseconds per lookup for each container.
+    """
+    values = list(range(0, 2 * n, 2))
+    rng = random.Random(seed)
+    targets = [rng.randrange(2 * n) for _ in range(queries)]
+
+    skip_list = SkipList(seed=seed)
+    for value in values:
+        skip_list.insert(value)
+    linked_list = LinkedList()
+    linked_list.extend(values)
+
+    def bisect_search(target):
+        index = bisect.bisect_left(values, target)
+        return index < len(values) and values[index] == target
+
+    results = {}
+    for name, search in (("LinkedList.search", linked_list.search),
+                         ("SkipList.search", skip_list.search),
+                         ("bisect on list", bisect_search)):
+        start = time.perf_counter()
+        for target in targets:
+            search(target)
+        results[name] = (time.perf_counter() - start) / queries * 1e6
+    return results
+
+
+# Example usage:
+if __name__ == "__main__":
+    s = SkipList(seed=42)
+    print("Initial skip list:", s)
+    for value in [30, 10, 50, 20, 40, 20]:
+        s.insert(value)
+    print("After insert:", s)
+    print("Delete 20:", s.delete(20))
+    print("After delete:", s)
+    print("Search 40:", s.search(40) is not None)
+    print("Search 99:", s.search(99) is not None)
+    print("Rank of 35:", s.rank(35))
+    print("Value at index 2:", s[2])
+    print("Range [15, 45):", list(s.range(15, 45)))
+    print("Peek smallest:", s.peek())
+    print("Size of skip list:", s.size())
+    print("Is skip list empty?", s.is_empty())
+
+    for name, micros in benchmark_search().items():
+        print(f"{name:>18}: {micros:10.2f} us per lookup")
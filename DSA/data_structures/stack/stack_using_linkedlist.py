@@ -17,6 +17,8 @@ class Node:
     next : Node or None
         Reference to the next node.
     """
+    __slots__ = ("value", "next")
+
     def __init__(self, value):
         self.value = value
         self.next = None
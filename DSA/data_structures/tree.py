@@ -5,6 +5,8 @@ A tree is a hierarchical data structure consisting of nodes.
 Each tree has a root node and each node can have zero or more child nodes.
 
 This implementation provides a Binary Tree, where each node has at most two children (left and right).
+BinaryTree links TreeNode objects; ArrayBinaryTree stores the same complete tree in a
+flat array, optionally as typed numbers in an array.array or a NumPy array.
 
 Operations:
 1. Insert: Add a new node to the tree.
@@ -12,11 +14,17 @@ Operations:
 3. Pre-order Traversal: Visit the root, then left subtree, then right subtree.
 4. In-order Traversal: Visit the left subtree, then root, then right subtree.
 5. Post-order Traversal: Visit the left subtree, then right subtree, then root.
-6. Check if empty: Determine if the tree has no nodes.
+6. Level-order Traversal: Visit the nodes level by level, left to right.
+7. Check if empty: Determine if the tree has no nodes.
 
 Properties:
 - Each node contains a value and references to its children.
 - The root node is the topmost node in the tree.
+- Values are inserted in level order, so the tree is always complete. The tree keeps
+  a frontier: a deque of the nodes that still have a free child slot, in level order.
+  Insert attaches the new node to the first of them, so it takes O(1) time.
+- BinaryTree traversals are generators driven by an explicit stack, so they stream
+  values in O(h) memory and work on trees of any depth without recursion.
 
 Pros:
 - Hierarchical structure allows for efficient searching and sorting.
@@ -40,6 +48,17 @@ argument -- description
 Return: return_description
 """
 
+import time
+import tracemalloc
+from array import array
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 class TreeNode:
     """
     A node in a binary tree.
@@ -62,6 +81,8 @@ class TreeNode:
     right : TreeNode or None
         Reference to the right child node.
     """
+    __slots__ = ("value", "left", "right")
+
     def __init__(self, value):
         self.value = value
         self.left = None
@@ -73,6 +94,8 @@ class BinaryTree:
 
     Methods
     -------
+    build_from(values)
+        Build a tree from values in level order (classmethod).
     insert(value)
         Insert a value into the binary tree (level order).
     search(value)
@@ -83,6 +106,10 @@ class BinaryTree:
         Return a list of values from a preorder traversal.
     postorder()
         Return a list of values from a postorder traversal.
+    iter_inorder(), iter_preorder(), iter_postorder()
+        Yield the values in inorder, preorder or postorder.
+    iter_level_order()
+        Yield the values level by level.
     is_empty()
         Check if the tree is empty.
 
@@ -94,6 +121,8 @@ class BinaryTree:
     ----------
     root : TreeNode or None
         Reference to the root node of the tree.
+    _frontier : collections.deque
+        Nodes with a free child slot, in level order.
     """
 
     def __init__(self):
@@ -103,6 +132,49 @@ class BinaryTree:
         Space complexity: O(1)
         """
         self.root = None
+        self._frontier = deque()
+
+    @classmethod
+    def build_from(cls, values):
+        """
+        Build a tree from values, in the same shape as inserting them one by one.
+
+        Nodes are created in level order and linked by index: the children
+        of the node at index i are at 2i + 1 and 2i + 2.
+
+        Parameters
+        ----------
+        values : iterable
+            The values to insert, in level order.
+
+        Returns
+        -------
+        BinaryTree
+            The new tree.
+
+        Time complexity
+        ---------------
+        Best : O(n)
+        Average : O(n)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(n)
+        Average : O(n)
+        Worst : O(n)
+        """
+        tree = cls()
+        nodes = [TreeNode(value) for value in values]
+        if not nodes:
+            return tree
+        for parent, child in zip(nodes, nodes[1::2]):
+            parent.left = child
+        for parent, child in zip(nodes, nodes[2::2]):
+            parent.right = child
+        tree.root = nodes[0]
+        tree._frontier.extend(nodes[(len(nodes) - 1) // 2:])
+        return tree
 
     def is_empty(self):
         """
@@ -131,6 +203,9 @@ class BinaryTree:
         """
         Insert a value into the binary tree.
 
+        The new node becomes a child of the first node in the frontier,
+        which is dropped from the frontier once both its children are set.
+
         Parameters
         ----------
         value : object
@@ -139,33 +214,28 @@ class BinaryTree:
         Time complexity
         ---------------
         Best : O(1)
-        Average : O(log n)
-        Worst : O(n)
+        Average : O(1)
+        Worst : O(1) amortized
 
         Space complexity
         ----------------
         Best : O(1)
-        Average : O(log n)
-        Worst : O(n)
+        Average : O(1)
+        Worst : O(1) amortized
 
         """
         new_node = TreeNode(value)
+        frontier = self._frontier
         if self.root is None:
             self.root = new_node
-            return
-        queue = [self.root]
-        while queue:
-            node = queue.pop(0)
+        else:
+            node = frontier[0]
             if node.left is None:
                 node.left = new_node
-                return
             else:
-                queue.append(node.left)
-            if node.right is None:
                 node.right = new_node
-                return
-            else:
-                queue.append(node.right)
+                frontier.popleft()
+        frontier.append(new_node)
 
     def search(self, value):
         """
@@ -196,9 +266,9 @@ class BinaryTree:
         """
         if self.root is None:
             return False
-        queue = [self.root]
+        queue = deque([self.root])
         while queue:
-            node = queue.pop(0)
+            node = queue.popleft()
             if node.value == value:
                 return True
             if node.left:
@@ -207,6 +277,118 @@ class BinaryTree:
                 queue.append(node.right)
         return False
 
+    def iter_inorder(self):
+        """
+        Yield the values in inorder: Left, Root, Right.
+
+        The stack holds the path from the root to the current node.
+
+        Time complexity
+        ---------------
+        Best : O(n)
+        Average : O(n)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(h)
+        Average : O(h)
+        Worst : O(h)
+        """
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
+
+    def iter_preorder(self):
+        """
+        Yield the values in preorder: Root, Left, Right.
+
+        Time complexity
+        ---------------
+        Best : O(n)
+        Average : O(n)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(h)
+        Average : O(h)
+        Worst : O(h)
+        """
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            yield node.value
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+
+    def iter_postorder(self):
+        """
+        Yield the values in postorder: Left, Right, Root.
+
+        A node is yielded when its right subtree is empty or was the last
+        subtree yielded.
+
+        Time complexity
+        ---------------
+        Best : O(n)
+        Average : O(n)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(h)
+        Average : O(h)
+        Worst : O(h)
+        """
+        stack = []
+        node = self.root
+        last = None
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+                continue
+            top = stack[-1]
+            if top.right is not None and top.right is not last:
+                node = top.right
+            else:
+                yield top.value
+                last = stack.pop()
+
+    def iter_level_order(self):
+        """
+        Yield the values level by level, left to right.
+
+        Time complexity
+        ---------------
+        Best : O(n)
+        Average : O(n)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(w)
+        Average : O(w)
+        Worst : O(w), where w is the width of the widest level
+        """
+        queue = deque([self.root] if self.root is not None else [])
+        while queue:
+            node = queue.popleft()
+            yield node.value
+            if node.left is not None:
+                queue.append(node.left)
+            if node.right is not None:
+                queue.append(node.right)
+
     def inorder(self):
         """
         Return a list of values from an inorder traversal.
@@ -224,14 +406,12 @@ class BinaryTree:
 
         Space complexity
         ----------------
-        Best : O(h)
-        Average : O(h)
-        Worst : O(h)
+        Best : O(n)
+        Average : O(n)
+        Worst : O(n)
 
         """
-        def _inorder(node):
-            return _inorder(node.left) + [node.value] + _inorder(node.right) if node else []
-        return _inorder(self.root)
+        return list(self.iter_inorder())
 
     def preorder(self):
         """
@@ -250,14 +430,12 @@ class BinaryTree:
 
         Space complexity
         ----------------
-        Best : O(h)
-        Average : O(h)
-        Worst : O(h)
+        Best : O(n)
+        Average : O(n)
+        Worst : O(n)
 
         """
-        def _preorder(node):
-            return [node.value] + _preorder(node.left) + _preorder(node.right) if node else []
-        return _preorder(self.root)
+        return list(self.iter_preorder())
 
     def postorder(self):
         """
@@ -276,14 +454,12 @@ class BinaryTree:
 
         Space complexity
         ----------------
-        Best : O(h)
-        Average : O(h)
-        Worst : O(h)
+        Best : O(n)
+        Average : O(n)
+        Worst : O(n)
 
         """
-        def _postorder(node):
-            return _postorder(node.left) + _postorder(node.right) + [node.value] if node else []
-        return _postorder(self.root)
+        return list(self.iter_postorder())
 
     def __str__(self):
         """
@@ -306,7 +482,7 @@ class BinaryTree:
         Average : O(n)
         Worst : O(n)
         """
-        return "Inorder: " + str(self.inorder())
+        return "Inorder: [" + ", ".join(repr(value) for value in self.iter_inorder()) + "]"
 
     def __repr__(self):
         """
@@ -331,6 +507,431 @@ class BinaryTree:
         """
         return f"BinaryTree(root={self.root})"
 
+
+class ArrayBinaryTree:
+    """
+    Binary tree stored in a flat array.
+
+    A level-order tree is always complete, so its nodes can be stored in
+    level order in one array: the children of index i are at 2i + 1 and
+    2i + 2, and the parent of index i is at (i - 1) // 2. No TreeNode
+    objects or child references are needed.
+
+    Methods
+    -------
+    build_from(values, typecode=None, backend="array")
+        Build a tree from values in level order (classmethod).
+    insert(value)
+        Insert a value into the binary tree (level order).
+    search(value)
+        Check if a value exists in the tree.
+    inorder()
+        Return a list of values from an inorder traversal.
+    preorder()
+        Return a list of values from a preorder traversal.
+    postorder()
+        Return a list of values from a postorder traversal.
+    is_empty()
+        Check if the tree is empty.
+
+    Parameters
+    ----------
+    typecode : str or None, optional
+        None (the default) stores any objects in a list. An array typecode
+        such as "q" or "d" stores numbers unboxed.
+    backend : str, optional
+        "array" stores typed values in an array.array, "numpy" in a NumPy
+        array with the dtype of the typecode (default is "array").
+
+    Attributes
+    ----------
+    _values : list, array.array or numpy.ndarray
+        The values in level order. A NumPy array has spare capacity at the end.
+    _size : int
+        Number of values in the tree.
+    """
+
+    def __init__(self, typecode=None, backend="array"):
+        """Initialize an empty binary tree.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        if backend not in ("array", "numpy"):
+            raise ValueError(f"Unknown storage backend {backend!r}")
+        if backend == "numpy" and typecode is not None and np is None:
+            raise ImportError("the numpy backend requires NumPy")
+        self._typecode = typecode
+        self._backend = backend
+        if typecode is None:
+            self._values = []
+        elif backend == "numpy":
+            self._values = np.empty(8, dtype=typecode)
+        else:
+            self._values = array(typecode)
+        self._size = 0
+
+    @classmethod
+    def build_from(cls, values, typecode=None, backend="array"):
+        """
+        Build a tree from values in level order.
+
+        Parameters
+        ----------
+        values : iterable
+            The values to insert, in level order.
+        typecode, backend
+            As for the constructor.
+
+        Returns
+        -------
+        ArrayBinaryTree
+            The new tree.
+
+        Time complexity
+        ---------------
+        Best : O(n)
+        Average : O(n)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(n)
+        Average : O(n)
+        Worst : O(n)
+        """
+        tree = cls(typecode, backend)
+        if typecode is None:
+            tree._values = list(values)
+        elif backend == "numpy":
+            tree._values = np.array(values if isinstance(values, np.ndarray) else list(values),
+                                    dtype=typecode)
+        else:
+            tree._values = array(typecode, values)
+        tree._size = len(tree._values)
+        return tree
+
+    def __len__(self):
+        """Return the number of values in the tree."""
+        return self._size
+
+    def is_empty(self):
+        """
+        Check if the tree is empty.
+
+        Returns
+        -------
+        bool
+            True if the tree is empty, False otherwise.
+        """
+        return self._size == 0
+
+    def insert(self, value):
+        """
+        Insert a value into the binary tree.
+
+        The next free position in level order is the end of the array.
+
+        Parameters
+        ----------
+        value : object
+            The value to insert.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1) amortized
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1) amortized
+        """
+        values = self._values
+        if self._typecode is not None and self._backend == "numpy":
+            if self._size == len(values):
+                grown = np.empty(max(8, 2 * len(values)), dtype=values.dtype)
+                grown[:self._size] = values
+                self._values = values = grown
+            values[self._size] = value
+        else:
+            values.append(value)
+        self._size += 1
+
+    def _python_values(self):
+        """Return the values as a Python list, in level order."""
+        if self._typecode is None:
+            return self._values
+        return self._values[:self._size].tolist()
+
+    def search(self, value):
+        """
+        Check if a value exists in the tree.
+
+        The array is scanned in C, without visiting nodes one by one.
+
+        Parameters
+        ----------
+        value : object
+            The value to search for.
+
+        Returns
+        -------
+        bool
+            True if value is found, False otherwise.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(n)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(n)
+        """
+        if self._typecode is not None and self._backend == "numpy":
+            return bool(np.any(self._values[:self._size] == value))
+        return value in self._values
+
+    def inorder(self):
+        """
+        Return a list of values from an inorder traversal.
+
+        Returns
+        -------
+        list
+            List of values in inorder: Left, Root, Right.
+
+        Time complexity
+        ---------------
+        Best : O(n)
+        Average : O(n)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(n)
+        Average : O(n)
+        Worst : O(n)
+        """
+        values = self._python_values()
+        n = self._size
+        result = []
+        stack = []
+        i = 0
+        while stack or i < n:
+            while i < n:
+                stack.append(i)
+                i = 2 * i + 1
+            i = stack.pop()
+            result.append(values[i])
+            i = 2 * i + 2
+        return result
+
+    def preorder(self):
+        """
+        Return a list of values from a preorder traversal.
+
+        Returns
+        -------
+        list
+            List of values in preorder: Root, Left, Right.
+
+        Time complexity
+        ---------------
+        Best : O(n)
+        Average : O(n)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(n)
+        Average : O(n)
+        Worst : O(n)
+        """
+        values = self._python_values()
+        n = self._size
+        result = []
+        stack = [0] if n else []
+        while stack:
+            i = stack.pop()
+            result.append(values[i])
+            if 2 * i + 2 < n:
+                stack.append(2 * i + 2)
+            if 2 * i + 1 < n:
+                stack.append(2 * i + 1)
+        return result
+
+    def postorder(self):
+        """
+        Return a list of values from a postorder traversal.
+
+        Visits Root, Right, Left and reverses the result.
+
+        Returns
+        -------
+        list
+            List of values in postorder: Left, Right, Root.
+
+        Time complexity
+        ---------------
+        Best : O(n)
+        Average : O(n)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(n)
+        Average : O(n)
+        Worst : O(n)
+        """
+        values = self._python_values()
+        n = self._size
+        result = []
+        stack = [0] if n else []
+        while stack:
+            i = stack.pop()
+            result.append(values[i])
+            if 2 * i + 1 < n:
+                stack.append(2 * i + 1)
+            if 2 * i + 2 < n:
+                stack.append(2 * i + 2)
+        result.reverse()
+        return result
+
+    def __str__(self):
+        """
+        Return a string representation of the tree (inorder).
+
+        Returns
+        -------
+        str
+            String representation of the tree.
+        """
+        return "Inorder: " + str(self.inorder())
+
+    def __repr__(self):
+        """
+        Return a detailed string representation of the tree.
+
+        Returns
+        -------
+        str
+            The size and storage of the tree.
+        """
+        storage = "list" if self._typecode is None else f"{self._backend} {self._typecode!r}"
+        return f"ArrayBinaryTree(size={self._size}, storage={storage})"
+
+
+ENGINES = {
+    "linked": BinaryTree,
+    "array": ArrayBinaryTree,
+}
+
+
+def create_binary_tree(engine="linked", **kwargs):
+    """
+    Create a binary tree using the named engine.
+
+    Parameters
+    ----------
+    engine : str, optional
+        "linked" for BinaryTree or "array" for ArrayBinaryTree
+        (default is "linked").
+    **kwargs
+        Passed to the engine's constructor.
+
+    Returns
+    -------
+    BinaryTree or ArrayBinaryTree
+        An empty binary tree.
+
+    Raises
+    ------
+    ValueError
+        If the engine name is unknown.
+    """
+    try:
+        tree_class = ENGINES[engine]
+    except KeyError:
+        raise ValueError(f"Unknown binary tree engine {engine!r}") from None
+    return tree_class(**kwargs)
+
+
+def benchmark_build(sizes=(10_000, 100_000, 1_000_000)):
+    """
+    Time building trees of increasing size with insert and with build_from.
+
+    Both should take about the same time per value at every size.
+
+    Parameters
+    ----------
+    sizes : tuple of int, optional
+        Tree sizes to build (default is 10_000, 100_000 and 1_000_000).
+
+    Returns
+    -------
+    list of tuple
+        (n, insert_seconds, build_from_seconds) for each size.
+    """
+    results = []
+    for n in sizes:
+        values = range(n)
+        start = time.perf_counter()
+        tree = BinaryTree()
+        for value in values:
+            tree.insert(value)
+        insert_seconds = time.perf_counter() - start
+        del tree
+
+        start = time.perf_counter()
+        tree = BinaryTree.build_from(values)
+        build_seconds = time.perf_counter() - start
+        del tree
+        results.append((n, insert_seconds, build_seconds))
+    return results
+
+def benchmark_engines(n=1_000_000):
+    """
+    Compare memory and inorder traversal time of the tree engines.
+
+    Parameters
+    ----------
+    n : int, optional
+        Number of integer values in each tree (default is 1_000_000).
+
+    Returns
+    -------
+    dict
+        Maps the engine description to (bytes_per_value, inorder_seconds).
+    """
+    values = range(1_000_000, 1_000_000 + n)
+    engines = [
+        ("BinaryTree", lambda: BinaryTree.build_from(values)),
+        ("ArrayBinaryTree list", lambda: ArrayBinaryTree.build_from(values)),
+        ("ArrayBinaryTree array 'q'", lambda: ArrayBinaryTree.build_from(values, "q")),
+    ]
+    if np is not None:
+        engines.append(("ArrayBinaryTree numpy 'q'",
+                        lambda: ArrayBinaryTree.build_from(np.arange(1_000_000, 1_000_000 + n),
+                                                           "q", backend="numpy")))
+    results = {}
+    for name, build in engines:
+        tracemalloc.start()
+        tree = build()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        start = time.perf_counter()
+        tree.inorder()
+        results[name] = (current / n, time.perf_counter() - start)
+        del tree
+    return results
+
 # Example usage:
 if __name__ == "__main__":
     tree = BinaryTree()
@@ -346,8 +947,26 @@ if __name__ == "__main__":
     print("Inorder:", tree.inorder())
     print("Preorder:", tree.preorder())
     print("Postorder:", tree.postorder())
+    print("Level order:", list(tree.iter_level_order()))
 
     print("Search 30:", tree.search(30))  
     print("Search 99:", tree.search(99))  
     
-    print("Is tree empty?", tree.is_empty())
\ No newline at end of file
+    print("Is tree empty?", tree.is_empty())
+
+    built = BinaryTree.build_from([10, 20, 30, 40, 50, 60])
+    print("Built with build_from:", built)
+
+    for n, insert_seconds, build_seconds in benchmark_build():
+        print(f"Build {n:>9,}: insert {insert_seconds / n * 1e9:6.0f} ns/value, "
+              f"build_from {build_seconds / n * 1e9:6.0f} ns/value")
+
+    array_tree = create_binary_tree("array", typecode="q")
+    for value in (10, 20, 30, 40, 50, 60):
+        array_tree.insert(value)
+    print("Array tree:", repr(array_tree), array_tree)
+    print("Array tree preorder:", array_tree.preorder())
+    print("Array tree search 30:", array_tree.search(30))
+
+    for name, (per_value, seconds) in benchmark_engines().items():
+        print(f"{name:>26}: {per_value:6.1f} bytes/value, inorder {seconds:.3f} s")
\ No newline at end of file
@@ -0,0 +1,512 @@
+"""
+UNROLLED LINKED LIST DATA STRUCTURE
+...................................
+An unrolled linked list is a linked list where each node holds a small array of
+values instead of a single value.
+
+Operations:
+1. Insert: Add a value to the end of the list.
+2. Insert at: Add a value at a given position, splitting a full node in two.
+3. Delete: Remove the first occurrence of a value, merging or rebalancing
+   nodes that become less than half full.
+4. Search: Find the node holding a specific value.
+5. Traverse: Visit each value in the list.
+6. Peek: Return the first value without removing it.
+7. is_empty: Check if the list is empty.
+8. size: Return the number of values in the list.
+
+Properties:
+- Each node holds up to node_capacity values in a Python list.
+- Appending fills the last node before a new one is created.
+- Apart from the last node, nodes are kept at least half full: a full node is
+  split in half when a value is inserted into it, and a node that drops below
+  half after a delete takes values from its successor or merges with it.
+
+Pros:
+- One node object and one next pointer per node_capacity values instead of per
+  value, so much less memory per element than LinkedList.
+- Traversal walks contiguous arrays, which is faster than following a pointer per value.
+
+Cons:
+- Inserting or deleting inside a node shifts up to node_capacity values.
+- More complex than a plain linked list.
+
+When to use an unrolled linked list:
+- When a linked list holds many small values and memory or traversal speed matters.
+
+When not to use an unrolled linked list:
+- When nodes must be referenced or spliced individually.
+
+Keyword arguments:
+argument -- description
+Return: return_description
+"""
+
+import time
+import tracemalloc
+
+from linked_list import LinkedList
+
+
+class UnrolledNode:
+    """
+    A node in an unrolled linked list.
+
+    Parameters
+    ----------
+    values : list, optional
+        The values to store in the node. Default is an empty list.
+
+    Attributes:
+        values: The values stored in the node, in list order.
+        next: Reference to the next node in the list.
+    """
+    __slots__ = ("values", "next")
+
+    def __init__(self, values=None):
+        self.values = values if values is not None else []
+        self.next = None
+
+
+class UnrolledLinkedList:
+    """
+    An unrolled linked list implementation.
+
+    Methods
+    -------
+    insert(value)
+        Insert a value at the end of the list.
+    insert_at(index, value)
+        Insert a value before the given position.
+    extend(values)
+        Insert every value at the end of the list.
+    delete(value)
+        Remove the first occurrence of the value from the list.
+    search(value)
+        Return the node holding the first occurrence of the value.
+    traverse()
+        Traverse the list and return a list of values.
+    peek()
+        Return the first value without removing it.
+    is_empty()
+        Check if the list is empty.
+    size()
+        Return the number of values in the list.
+
+    Parameters
+    ----------
+    node_capacity : int, optional
+        Maximum number of values per node. Default is 64.
+
+    Attributes
+    ----------
+    _head: The first node in the list.
+    _tail: The last node in the list.
+    count: The number of values in the list.
+    """
+
+    def __init__(self, node_capacity=64):
+        """
+        Initialize an empty unrolled linked list.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        if node_capacity < 2:
+            raise ValueError("node_capacity must be at least 2")
+        self._node_capacity = node_capacity
+        self._head = None
+        self._tail = None
+        self.count = 0
+
+    def insert(self, _value):
+        """
+        Insert a value at the end of the list.
+
+        Parameters
+        ----------
+        _value : object
+            The value to be inserted into the list.
+
+        Returns
+        -------
+        None
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        tail = self._tail
+        if tail is None:
+            self._head = self._tail = UnrolledNode([_value])
+        elif len(tail.values) < self._node_capacity:
+            tail.values.append(_value)
+        else:
+            new_node = UnrolledNode([_value])
+            tail.next = new_node
+            self._tail = new_node
+        self.count += 1
+
+    def extend(self, values):
+        """
+        Insert every value at the end of the list, filling whole nodes at a time.
+
+        Parameters
+        ----------
+        values : iterable
+            The values to be inserted, in order.
+
+        Time complexity
+        ---------------
+        Best : O(k)
+        Average : O(k)
+        Worst : O(k)
+
+        Space complexity
+        ----------------
+        Best : O(k)
+        Average : O(k)
+        Worst : O(k)
+        """
+        values = list(values)
+        if not values:
+            return
+        capacity = self._node_capacity
+        start = 0
+        if self._tail is not None:
+            room = capacity - len(self._tail.values)
+            self._tail.values.extend(values[:room])
+            start = room
+        for offset in range(start, len(values), capacity):
+            new_node = UnrolledNode(values[offset:offset + capacity])
+            if self._tail is None:
+                self._head = new_node
+            else:
+                self._tail.next = new_node
+            self._tail = new_node
+        self.count += len(values)
+
+    def insert_at(self, index, _value):
+        """
+        Insert a value before the given position.
+
+        If the target node is full it is split in two halves first.
+
+        Parameters
+        ----------
+        index : int
+            Position of the new value, from 0 to size().
+        _value : object
+            The value to be inserted.
+
+        Raises
+        ------
+        IndexError
+            If index is out of range.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(n / c + c)
+        Worst : O(n / c + c)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(c)
+        """
+        if not 0 <= index <= self.count:
+            raise IndexError("insert index out of range")
+        if index == self.count:
+            self.insert(_value)
+            return
+        node = self._head
+        while index > len(node.values):
+            index -= len(node.values)
+            node = node.next
+        if len(node.values) >= self._node_capacity:
+            half = len(node.values) // 2
+            new_node = UnrolledNode(node.values[half:])
+            del node.values[half:]
+            new_node.next = node.next
+            node.next = new_node
+            if self._tail is node:
+                self._tail = new_node
+            if index > half:
+                index -= half
+                node = new_node
+        node.values.insert(index, _value)
+        self.count += 1
+
+    def delete(self, _value):
+        """
+        Remove the first occurrence of the value from the list.
+
+        A node left less than half full takes values from its successor, or
+        merges with it when both fit in one node. An emptied node is unlinked.
+
+        Parameters
+        ----------
+        _value : object
+            The value to be deleted.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the value is not in a non-empty list.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(n)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        if self._head is None:
+            return
+        prev = None
+        node = self._head
+        while node is not None:
+            try:
+                position = node.values.index(_value)
+            except ValueError:
+                prev = node
+                node = node.next
+                continue
+            del node.values[position]
+            self.count -= 1
+            self._rebalance(prev, node)
+            return
+        raise ValueError(f"Value {_value} not found in the linked list.")
+
+    def _rebalance(self, prev, node):
+        """Restore the half-full invariant of node after a delete."""
+        half = self._node_capacity // 2
+        successor = node.next
+        if len(node.values) >= half:
+            return
+        if successor is not None:
+            if len(node.values) + len(successor.values) <= self._node_capacity:
+                node.values.extend(successor.values)
+                node.next = successor.next
+                if self._tail is successor:
+                    self._tail = node
+            else:
+                moved = half - len(node.values)
+                node.values.extend(successor.values[:moved])
+                del successor.values[:moved]
+        elif not node.values:
+            if prev is None:
+                self._head = None
+            else:
+                prev.next = None
+            self._tail = prev
+
+    def search(self, _value):
+        """
+        Return the node holding the first occurrence of the value.
+
+        Parameters
+        ----------
+        _value : object
+            The value to search for.
+
+        Returns
+        -------
+        UnrolledNode or None
+            The node containing the value, or None if not found.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(n)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        node = self._head
+        while node is not None:
+            if _value in node.values:
+                return node
+            node = node.next
+        return None
+
+    def traverse(self):
+        """
+        Traverse the list and return a list of values.
+
+        Returns
+        -------
+        list
+            A list containing every value in order.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(n)
+        Worst : O(n)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(n)
+        Worst : O(n)
+        """
+        values = []
+        node = self._head
+        while node is not None:
+            values.extend(node.values)
+            node = node.next
+        return values
+
+    def peek(self):
+        """
+        Return the first value without removing it.
+
+        Returns
+        -------
+        object
+            The first value in the list.
+
+        Raises
+        ------
+        IndexError
+            If the list is empty.
+
+        Time complexity
+        ---------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+
+        Space complexity
+        ----------------
+        Best : O(1)
+        Average : O(1)
+        Worst : O(1)
+        """
+        if self._head is not None:
+            return self._head.values[0]
+        raise IndexError("peek from empty linked list")
+
+    def is_empty(self):
+        """
+        Check if the list is empty.
+
+        Returns
+        -------
+        bool
+            True if the list is empty, False otherwise.
+        """
+        return self._head is None
+
+    def size(self):
+        """
+        Return the number of values in the list.
+
+        Returns
+        -------
+        int
+            The number of values in the list.
+        """
+        return self.count
+
+    def __str__(self):
+        """
+        Return a string representation of the list.
+
+        Returns
+        -------
+        str
+            The values joined by arrows, ending in None.
+        """
+        return " -> ".join(str(value) for value in self.traverse()) + " -> None"
+
+    def __repr__(self):
+        """
+        Return a string representation of the list for debugging.
+
+        Returns
+        -------
+        str
+            The values and the node capacity.
+        """
+        return f"UnrolledLinkedList({self.traverse()}, node_capacity={self._node_capacity})"
+
+
+def benchmark_against_linked_list(n=1_000_000, node_capacity=64, rounds=5):
+    """
+    Compare bytes per element and traversal throughput with LinkedList.
+
+    Parameters
+    ----------
+    n : int, optional
+        Number of values in each list (default is 1_000_000).
+    node_capacity : int, optional
+        Node capacity of the unrolled list (default is 64).
+    rounds : int, optional
+        Number of traversals timed (default is 5).
+
+    Returns
+    -------
+    dict
+        Maps the list class name to (bytes_per_element, values_per_second).
+    """
+    values = list(range(n))
+    results = {}
+    for name, factory in (("LinkedList", LinkedList),
+                          ("UnrolledLinkedList", lambda: UnrolledLinkedList(node_capacity))):
+        tracemalloc.start()
+        linked_list = factory()
+        linked_list.extend(values)
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        start = time.perf_counter()
+        for _ in range(rounds):
+            linked_list.traverse()
+        elapsed = time.perf_counter() - start
+        results[name] = (current / n, n * rounds / elapsed)
+    return results
+
+
+# Example usage:
+if __name__ == "__main__":
+    l = UnrolledLinkedList(node_capacity=4)
+    print("Initial list:", l)
+    l.extend([11, 22, 33, 44, 55, 66])
+    print("After extend:", l)
+    l.insert_at(1, 15)
+    print("After insert_at(1, 15):", repr(l))
+    l.delete(22)
+    l.delete(33)
+    print("After deleting 22 and 33:", repr(l))
+    print("Search 44:", l.search(44) is not None)
+    print("Search 99:", l.search(99) is not None)
+    print("Peek first:", l.peek())
+    print("Size of list:", l.size())
+    print("Is list empty?", l.is_empty())
+
+    for name, (per_element, rate) in benchmark_against_linked_list().items():
+        print(f"{name:>18}: {per_element:6.1f} bytes/element, {rate:14,.0f} values/s traversed")